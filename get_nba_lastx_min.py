@@ -1,15 +1,50 @@
 import logging
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from tqdm import tqdm  # 用于显示进度条
 
+from nba_api.library.cache import ResponseCache
+from nba_api.library.checkpoint import FAILED, CheckpointStore, download
+from nba_api.library.http import NBAHTTP
+from nba_api.library.ratelimit import RateLimiter
+from nba_api.library.retry import RetryPolicy
 from nba_api.stats.endpoints import leaguegamefinder, playbyplayv2
 
 logger = logging.getLogger()
 logging.basicConfig(level=logging.INFO)
 
+# finished games never change, so re-runs read play-by-play from disk
+NBAHTTP.set_cache(ResponseCache("cache/nba_responses.sqlite"))
+# stay under stats.nba.com's throttling threshold and back off instead of re-firing
+NBAHTTP.set_rate_limiter(RateLimiter(rates={"stats.nba.com": 4}, burst=4))
+NBAHTTP.set_retry_policy(RetryPolicy(max_retries=5, backoff_factor=1.0, max_elapsed=120))
+# one pooled keep-alive connection per worker thread
+MAX_WORKERS = 10
+NBAHTTP.configure_pool(workers=MAX_WORKERS)
+# per-game progress, so an interrupted backfill resumes where it stopped
+CHECKPOINT = CheckpointStore("cache/nba_lastx_min_checkpoint.sqlite")
+# games that failed this many times are no longer retried
+MAX_ATTEMPTS = 5
+# a season's game list is refetched with backoff on any error, then the season is skipped;
+# it is the only retry loop for that request, so one season makes at most max_retries + 1
+SEASON_RETRY = RetryPolicy(max_retries=5, backoff_factor=5.0, max_backoff=120)
+OUTPUT_DIRECTORY = "assets/fromq3"
+
+
+def find_games(season):
+    # the HTTP retries are off for this call: SEASON_RETRY already retries it
+    retry_policy = NBAHTTP.get_retry_policy()
+    NBAHTTP.set_retry_policy(None)
+    try:
+        gamefinder = leaguegamefinder.LeagueGameFinder(
+            season_nullable=season, timeout=5
+        )  # 替换为目标赛季
+        return gamefinder.get_data_frames()[0]
+    finally:
+        NBAHTTP.set_retry_policy(retry_policy)
+
 
 def quater_pct_to_sec(quater, pct):
     """
@@ -27,97 +62,91 @@ def quater_pct_to_sec(quater, pct):
         return 4 * 12 * 60 + (quater - 4) * 5 * 60 - pct_sec
 
 
-def process_one(game_id):
-    error = None
-    for _ in range(3):
-        try:
-            # filter last quater plays, including overtime
-            play_by_play = playbyplayv2.PlayByPlayV2(
-                game_id=game_id, timeout=5
-            ).get_data_frames()[0]
-            play_by_play = play_by_play[play_by_play["SCOREMARGIN"].notna()]
-            last_quater = int(play_by_play["PERIOD"].max())
-            # convert PCTIMESTRING to seconds from the start of the game
-            play_by_play["TIMEPLAYED"] = play_by_play.apply(
-                lambda x: quater_pct_to_sec(x["PERIOD"], x["PCTIMESTRING"]), axis=1
-            )
-            # get socre margin of every second in last 120 seconds
-            result = {"GAME_ID": game_id}
-            # get Q3 ~ end of the game by seconds
-            # assuming 2 OTs at most
-            for i in range(2 * 12 * 60, 2880 + (last_quater - 4) * 5 * 60 + 1):
-                result[i] = play_by_play[play_by_play["TIMEPLAYED"] <= i].iloc[-1][
-                    "SCOREMARGIN"
-                ]
-                if result[i] == "TIE":
-                    result[i] = 0
-            return result, game_id
-        except Exception as e:
-            error = e
-            pass
-    logger.info(f"failed to process game {game_id} error {error}")
-    return False, game_id
+def score_margins(game_id, play_by_play):
+    # filter last quater plays, including overtime
+    play_by_play = play_by_play[play_by_play["SCOREMARGIN"].notna()]
+    last_quater = int(play_by_play["PERIOD"].max())
+    # convert PCTIMESTRING to seconds from the start of the game
+    play_by_play["TIMEPLAYED"] = play_by_play.apply(
+        lambda x: quater_pct_to_sec(x["PERIOD"], x["PCTIMESTRING"]), axis=1
+    )
+    # get socre margin of every second in last 120 seconds
+    result = {"GAME_ID": game_id}
+    # get Q3 ~ end of the game by seconds
+    # assuming 2 OTs at most
+    for i in range(2 * 12 * 60, 2880 + (last_quater - 4) * 5 * 60 + 1):
+        result[i] = play_by_play[play_by_play["TIMEPLAYED"] <= i].iloc[-1][
+            "SCOREMARGIN"
+        ]
+        if result[i] == "TIE":
+            result[i] = 0
+    return result
+
 
+def process_game(game_id, endpoint):
+    return score_margins(game_id, endpoint.get_data_frames()[0])
+
+
+def write_season(season, job):
+    """
+    Rewrites the season's CSV from every game finished so far; the file name
+    is stable so re-runs replace it instead of adding another copy.
+    """
+    results = [result for _, result in CHECKPOINT.get_results(job)]
+    if len(results) == 0:
+        logger.info("no result succeed")
+        return
+    results_df = pd.DataFrame(results)
+    logger.info(f"season {season} has {len(results_df)} games")
+    file_name = os.path.join(OUTPUT_DIRECTORY, f"nba_from_q3_{season}.csv")
+    logger.info(f"saving to {file_name}")
+    results_df.to_csv(f"{file_name}.tmp", index=False)
+    os.replace(f"{file_name}.tmp", file_name)
 
-try:
-    with open("failed_games.txt", "r") as f:
-        his_failed_games = f.read().split("\n")
-        his_failed_games = [x for x in his_failed_games if x != ""]
-except Exception as e:
-    logger.info(f"Open file failed with {e}")
-    his_failed_games = []
 
 # 获取2020赛季至今的比赛列表
 years = list(range(10, 15))
-# 初始化存储结果
-new_failed_games = []
 
-time_stamp = time.time()
 for year in years:
     season = f"20{year:02d}-{year+1:02d}"
-    results = []
+    job = f"fromq3/{season}"
     logger.info(f"Processing season {season}")
-    while True:
+    games = None
+    for attempt in range(SEASON_RETRY.max_retries + 1):
         try:
-            gamefinder = leaguegamefinder.LeagueGameFinder(
-                season_nullable=season, timeout=5
-            )  # 替换为目标赛季
-            games = gamefinder.get_data_frames()[0]
+            games = find_games(season)
             logger.info(f"season {season} has {len(games)} games")
             break
         except Exception as e:
-            logger.info(f"Error getting games: {e}")
-    games = gamefinder.get_data_frames()[0]
-    # logger.info(len(games))
-    # logger.info(games)
-    # # 提取需要的字段
-    # games = games[['GAME_ID', 'GAME_DATE', 'MATCHUP', 'WL', 'PTS', 'PLUS_MINUS']]
-    game_ids = list(set(games["GAME_ID"].tolist()))
-    if len(his_failed_games) > 0:
-        game_ids = list(set(game_ids).intersection(set(his_failed_games)))
-    # process failed games
-    logger.info(f"season {season} has {len(game_ids)} games un processed")
-    # use ThreadPoolExecutor and tqdm to show progress bar
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        results = list(tqdm(executor.map(process_one, game_ids), total=len(game_ids)))
-    filtered_results = []
-    for result in results:
-        if result[0]:
-            filtered_results.append(result[0])
-        else:
-            new_failed_games.append(result[1])
-    results = filtered_results
-    if len(results) == 0:
-        logger.info("no result succeed")
+            if attempt == SEASON_RETRY.max_retries:
+                logger.error(f"Error getting games: {e}")
+                break
+            # full jitter alone may retry a throttled request almost at once
+            delay = max(SEASON_RETRY.backoff_factor, SEASON_RETRY.get_backoff(attempt))
+            logger.info(f"Error getting games: {e}, retry in {delay:.0f}s")
+            time.sleep(delay)
+    if games is None:
+        logger.error(f"skipping season {season}, its games could not be listed")
         continue
-    results_df = pd.DataFrame(results)
-
-    # # 保存或输出
-    # # logger.info(results_df.head())
-    logger.info(f"season {season} has {len(results_df)} games")
-    file_name = f"nba_from_q3_{season}_{time_stamp}.csv"
-    logger.info(f"saving to {file_name}")
-    results_df.to_csv(f"{file_name}", index=False)
-logger.info(f"new failed games: {len(new_failed_games)}")
-with open("failed_games.txt", "w") as f:
-    f.write("\n".join(new_failed_games))
+    # finished games are skipped, failed ones are retried
+    CHECKPOINT.add(job, sorted(set(games["GAME_ID"].tolist())))
+    game_ids = CHECKPOINT.get_pending(job, max_attempts=MAX_ATTEMPTS)
+    logger.info(f"season {season} has {len(game_ids)} games un processed")
+    progress = download(
+        CHECKPOINT,
+        job,
+        playbyplayv2.PlayByPlayV2,
+        game_ids,
+        lambda game_id: {"game_id": game_id, "timeout": 5},
+        process=process_game,
+        concurrency=MAX_WORKERS,
+        max_attempts=MAX_ATTEMPTS,
+    )
+    for game_id, status in tqdm(progress, total=len(game_ids)):
+        if status == FAILED:
+            logger.info(
+                f"failed to process game {game_id} "
+                f"error {CHECKPOINT.get_status(job, game_id)['error']}"
+            )
+    write_season(season, job)
+    logger.info(f"season {season} progress: {CHECKPOINT.get_counts(job)}")
@@ -1,13 +1,14 @@
 import json
 import logging
 import os
+import queue
 import sys
 import threading
 import time
 from json.decoder import JSONDecodeError
 from multiprocessing import Manager
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import certifi
 import pandas as pd
@@ -16,7 +17,8 @@ from py_clob_client.order_builder.constants import BUY, SELL
 from PyQt6.QtWidgets import QApplication
 from requests.exceptions import ReadTimeout
 
-from nba_api.live.nba.endpoints import boxscore
+from nba_api.live.nba.library.hub import LiveGameHub
+from nba_api.live.nba.library.scheduler import PollScheduler
 from nba_api.stats.endpoints import ScoreboardV2
 from nba_api.stats.static import teams
 from tools.qt_printer import ThreadDisplayWindow
@@ -25,7 +27,7 @@ from tools.utils import (
     check_flip,
     client,
     get_team_token,
-    get_time_played,
+    get_time_played_from_clock,
     sell_with_market_price,
     setup_logger,
 )
@@ -46,6 +48,8 @@ class NBATrader:
         loss_sell_th: float = 0.2,
         profit_sell_th: float = 0.008,
         buy_balance: float = 0.0,
+        requests_per_second: float = 2.0,
+        update_timeout: float = 300.0,
     ):
         self.logger = setup_logger("main", f"logs/{game_date}/main.log")
         self.game_date = game_date
@@ -53,6 +57,15 @@ class NBATrader:
         self.loss_sell_th = loss_sell_th
         self.profit_sell_th = profit_sell_th
         self.buy_balance = buy_balance
+        # One scoreboard request per tick serves every game; the scheduler
+        # decides when each game is due and caps requests to cdn.nba.com.
+        self.hub = LiveGameHub(timeout=5)
+        self.scheduler = PollScheduler(rate=requests_per_second)
+        self.game_updates: Dict[str, queue.Queue] = {}
+        # Seconds a game thread waits for an update before checking that the
+        # hub is still polling its game.
+        self.update_timeout = update_timeout
+        self.hub_thread: Optional[threading.Thread] = None
 
         self.manager = Manager()
         self.token_infos = self.manager.dict()
@@ -162,8 +175,19 @@ class NBATrader:
         bought_str = ""
         fake_bought_str = ""
 
+        updates = self.game_updates[game_id]
         while True:
-            game_info = self._get_game_info(game_id, away_team, home_team, logger)
+            try:
+                update = updates.get(timeout=self.update_timeout)
+            except queue.Empty:
+                if game_id not in self.hub.get_game_ids() or not (
+                    self.hub_thread and self.hub_thread.is_alive()
+                ):
+                    logger.error(f"{game_id}: hub stopped polling, no more updates")
+                    break
+                logger.info(f"{game_id}: no update in {self.update_timeout:.0f}s")
+                continue
+            game_info = self._get_game_info(update, away_team, home_team, logger)
             if not game_info:
                 continue
 
@@ -176,7 +200,6 @@ class NBATrader:
                     self.qt_window.print(
                         match_up, f"{away_team} vs. {home_team} {status_text}, sleeping"
                     )
-                time.sleep(60)
                 continue
 
             if self._is_late_game(status_text):
@@ -196,6 +219,7 @@ class NBATrader:
                 self._handle_game_end(
                     away_team, home_team, away_token, home_token, logger
                 )
+                self.hub.unsubscribe(game_id)
                 logger.info(f"{game_id}: {away_team} vs. {home_team} finished")
                 if self.qt_window:
                     self.qt_window.print(
@@ -204,30 +228,67 @@ class NBATrader:
                     )
                 break
 
-    def _get_game_info(self, game_id, away_team, home_team, logger):
-        try:
-            box = boxscore.BoxScore(game_id, timeout=5)
-            info = box.game.get_dict()
-            assert (
-                info["awayTeam"]["teamName"] == away_team
-                and info["homeTeam"]["teamName"] == home_team
-            ), "error, away team name not match"
-            return info
-        except ReadTimeout as e:
-            logger.info(f"query {away_team} VS {home_team} timeout {e}")
-        except JSONDecodeError:
-            logger.info(
-                f"game {away_team} VS {home_team} not started, sleep for 5 minutes"
+    def _get_game_info(self, update, away_team, home_team, logger):
+        if update.error is not None:
+            if isinstance(update.error, JSONDecodeError):
+                logger.info(f"game {away_team} VS {home_team} not started")
+                if self.qt_window:
+                    self.qt_window.print(
+                        f"{away_team}_{home_team}",
+                        f"game {away_team} VS {home_team} not started",
+                    )
+            else:
+                logger.info(f"{away_team} VS {home_team}, some error {update.error}")
+            return None
+        info = update.game
+        if (
+            info["awayTeam"]["teamName"] != away_team
+            or info["homeTeam"]["teamName"] != home_team
+        ):
+            logger.info(f"{away_team} VS {home_team}, error, away team name not match")
+            return None
+        return info
+
+    def poll_games(self):
+        logger = setup_logger("hub", f"logs/{self.game_date}/hub.log")
+        for game_id in self.hub.get_game_ids():
+            self.scheduler.add(game_id)
+
+        while self.hub.get_game_ids():
+            delay = self.scheduler.get_delay()
+            if delay is None:
+                break
+            time.sleep(delay)
+            game_ids = self.scheduler.get_due()
+            time.sleep(self.scheduler.reserve())
+            try:
+                updates = dict(self.hub.tick(game_ids))
+            except Exception as e:
+                if isinstance(e, ReadTimeout):
+                    logger.info(f"query scoreboard timeout {e}")
+                else:
+                    logger.error(f"error when poll scoreboard: {e}")
+                for game_id in game_ids:
+                    self.scheduler.record_error(game_id)
+                continue
+
+            # BoxScores fetched during the tick are charged to the next one.
+            fetched = sum(
+                update.box_score is not None or update.error is not None
+                for update in updates.values()
             )
-            if self.qt_window:
-                self.qt_window.print(
-                    f"{away_team}_{home_team}",
-                    f"game {away_team} VS {home_team} not started, sleep for 5 minutes",
-                )
-            time.sleep(300)
-        except Exception as e:
-            logger.info(f"{away_team} VS {home_team}, some error {e}")
-        return None
+            if fetched:
+                self.scheduler.reserve(fetched)
+            for game_id in game_ids:
+                update = updates.get(game_id)
+                if update is not None and update.error is not None:
+                    backoff = self.scheduler.record_error(game_id)
+                    logger.info(f"{game_id} error {update.error}, retry in {backoff:.0f}s")
+                else:
+                    interval = self.scheduler.update(
+                        game_id, self.hub.get_state(game_id), self.hub.get_game(game_id)
+                    )
+                    logger.info(f"{game_id} next poll in {interval}s")
 
     def _is_early_game(self, status_text: str) -> bool:
         early_stages = ["Half", "pre", "Q1", "Q2"]
@@ -254,7 +315,9 @@ class NBATrader:
         status_text = game_info["gameStatusText"]
 
         try:
-            time_played = get_time_played(status_text)
+            time_played = get_time_played_from_clock(
+                game_info["period"], game_info["gameClock"], status_text
+            )
         except Exception as e:
             logger.info(f"error: {e} with {status_text}")
             return bought_str, fake_bought_str
@@ -453,6 +516,13 @@ class NBATrader:
 
         self.setup_games()
 
+        # Subscribe every game before the hub starts polling
+        for game_id in self.gameid_token:
+            self.game_updates[game_id] = self.hub.subscribe(game_id, queue.Queue())
+        self.hub_thread = threading.Thread(target=self.poll_games)
+        self.threads.append(self.hub_thread)
+        self.hub_thread.start()
+
         # Start game monitoring threads
         for game_id in self.gameid_token:
             thread = threading.Thread(target=self.buy_one_game, args=(game_id,))
@@ -0,0 +1,86 @@
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from nba_api.library.http import NBAHTTP
+from nba_api.library.ratelimit import TokenBucket
+
+
+class FetchResult:
+    """
+    Outcome of one fetch_many() call: the endpoint instance when it loaded,
+    otherwise the exception it raised.
+    """
+
+    __slots__ = ("index", "kwargs", "endpoint", "error")
+
+    def __init__(self, index, kwargs, endpoint=None, error=None):
+        self.index = index
+        self.kwargs = kwargs
+        self.endpoint = endpoint
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = "ok" if self.ok else repr(self.error)
+        return "FetchResult({}, {!r}, {})".format(self.index, self.kwargs, outcome)
+
+
+def fetch_many(endpoint_class, kwargs_iterable, concurrency=None, rate=None, burst=1):
+    """
+    Instantiates endpoint_class once per kwargs dict on a thread pool and yields
+    a FetchResult for each as it completes, in completion order (index is the
+    position in kwargs_iterable). Failures are reported on the result instead
+    of raised.
+
+    Requests go through NBAHTTP as usual, so the configured cache, rate limiter,
+    retry policy and per-host concurrency cap all apply. concurrency defaults to
+    NBAHTTP.pool_maxsize so every worker keeps a pooled connection. rate caps
+    endpoint calls per second for this job only; leave it None to rely on the
+    rate limiter, which does not charge cache hits.
+
+    kwargs_iterable is consumed lazily, so it may be a generator of any length.
+    """
+    if concurrency is None:
+        concurrency = NBAHTTP.pool_maxsize
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    bucket = TokenBucket(rate, burst) if rate else None
+
+    def call(kwargs):
+        if bucket is not None:
+            delay = bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        return endpoint_class(**kwargs)
+
+    items = enumerate(kwargs_iterable)
+    pending = {}
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="nba_api-fetch"
+    )
+    try:
+        while True:
+            # Keep the workers busy without queueing the whole iterable.
+            for index, kwargs in items:
+                pending[executor.submit(call, kwargs)] = (index, kwargs)
+                if len(pending) >= concurrency * 2:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, kwargs = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield FetchResult(index, kwargs, endpoint=future.result())
+                else:
+                    yield FetchResult(index, kwargs, error=error)
+    finally:
+        # Reached early when the caller stops iterating.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
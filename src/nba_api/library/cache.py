@@ -0,0 +1,397 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+from datetime import date, datetime
+from urllib.parse import quote_plus
+
+# TTL meaning "never expires"; a TTL of 0 means "do not cache".
+FOREVER = None
+
+
+def _parse_game_date(value):
+    for date_format in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(str(value), date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def scoreboard_ttl(parameters, data=None):
+    """
+    Scoreboards for days that are over never change again; today's (or an
+    unspecified day, which the API treats as today) goes stale within seconds.
+    """
+    game_date = _parse_game_date(parameters.get("GameDate", ""))
+    if game_date is not None and game_date < date.today():
+        return FOREVER
+    return 10
+
+
+# TTL for game results that are, or may be, still changing.
+IN_PROGRESS_TTL = 60
+FINAL = 3
+# Team minutes at the end of regulation, and added by each overtime.
+REGULATION_MINUTES = 240
+OVERTIME_MINUTES = 25
+
+
+def _get_rows(result_set):
+    headers = result_set.get("headers") or []
+    return [dict(zip(headers, row)) for row in result_set.get("rowSet") or []]
+
+
+def _get_season_year(game_id):
+    # GameIDs are LLTYYNNNNN: league, season type, then the season's start year.
+    game_id = str(game_id or "")
+    if len(game_id) != 10 or not game_id.isdigit():
+        return None
+    year = int(game_id[3:5])
+    return (1900 if year >= 46 else 2000) + year
+
+
+def _is_past_season(parameters):
+    # Every game of a season before the current one is over. The NBA season
+    # starting in a year runs until the following summer.
+    game_id = next(
+        (value for key, value in parameters.items() if key.lower() == "gameid"), None
+    )
+    year = _get_season_year(game_id)
+    if year is None:
+        return False
+    today = date.today()
+    return year < (today.year if today.month >= 7 else today.year - 1)
+
+
+def _get_minutes(value):
+    # Team MIN / minutes: "240:00", "265.000000:00" or a number.
+    if isinstance(value, (int, float)):
+        return float(value)
+    minutes, _, seconds = str(value or "").partition(":")
+    try:
+        return float(minutes) + (int(seconds) / 60 if seconds else 0)
+    except ValueError:
+        return None
+
+
+def _is_final_box_score(minutes, home_score, away_score):
+    # Team minutes only land on a period end; one from the 4th on with the
+    # score untied ends the game.
+    if None in minutes or len(set(minutes)) != 1 or home_score == away_score:
+        return False
+    played = minutes[0] - REGULATION_MINUTES
+    return played >= 0 and played % OVERTIME_MINUTES == 0
+
+
+def _is_final_play_by_play(last_period, last_event_ends_period, home_score, away_score):
+    # A game is over once a period from the 4th on has ended untied.
+    return (
+        last_event_ends_period
+        and last_period >= 4
+        and home_score is not None
+        and home_score != away_score
+    )
+
+
+def _get_game_status(data):
+    # gameStatus of V3 and live payloads, at the top level or one level down.
+    for value in [data] + [value for value in data.values() if isinstance(value, dict)]:
+        if "gameStatus" in value:
+            return value["gameStatus"]
+    return None
+
+
+def _has_rows(data):
+    result_sets = data.get("resultSets") or data.get("resultSet")
+    if result_sets is None:
+        return any(value for key, value in data.items() if key not in ("meta", "resource"))
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    return any(result_set.get("rowSet") for result_set in result_sets)
+
+
+def _is_final(data):
+    """
+    True when a decoded stats response shows that its game is over: a
+    gameStatus or GAME_STATUS_ID of 3, team minutes at the end of the 4th
+    period or an overtime with the score untied, or a play-by-play whose last
+    event ends such a period. False when it is not, or cannot tell.
+    """
+    if not isinstance(data, dict):
+        return False
+    status = _get_game_status(data)
+    if status is not None:
+        return status == FINAL
+
+    result_sets = data.get("resultSets") or data.get("resultSet") or []
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    for result_set in result_sets:
+        headers = result_set.get("headers") or []
+        if "GAME_STATUS_ID" in headers:
+            rows = _get_rows(result_set)
+            return bool(rows) and all(row["GAME_STATUS_ID"] == FINAL for row in rows)
+        if "EVENTMSGTYPE" in headers and "PERIOD" in headers:
+            rows = _get_rows(result_set)
+            if not rows:
+                return False
+            scores = [row["SCORE"] for row in rows if row.get("SCORE")]
+            away_score, _, home_score = scores[-1].partition(" - ") if scores else (None, "", None)
+            # EVENTMSGTYPE 13 is the end of a period.
+            return _is_final_play_by_play(
+                rows[-1]["PERIOD"], rows[-1]["EVENTMSGTYPE"] == 13, home_score, away_score
+            )
+        if {"TEAM_ID", "MIN", "PTS"} <= set(headers) and "PLAYER_ID" not in headers:
+            rows = _get_rows(result_set)
+            if len(rows) == 2:
+                return _is_final_box_score(
+                    [_get_minutes(row["MIN"]) for row in rows], rows[0]["PTS"], rows[1]["PTS"]
+                )
+
+    for value in data.values():
+        if isinstance(value, dict) and "homeTeam" in value and "awayTeam" in value:
+            teams = [(value[team] or {}).get("statistics") or {} for team in ("homeTeam", "awayTeam")]
+            if all("minutes" in team and "points" in team for team in teams):
+                return _is_final_box_score(
+                    [_get_minutes(team["minutes"]) for team in teams],
+                    teams[0]["points"],
+                    teams[1]["points"],
+                )
+
+    actions = (data.get("game") or {}).get("actions")
+    if actions:
+        last = actions[-1]
+        scored = [action for action in actions if action.get("scoreHome") not in (None, "")]
+        return _is_final_play_by_play(
+            last.get("period") or 0,
+            last.get("actionType") == "period" and last.get("subType") == "end",
+            scored[-1]["scoreHome"] if scored else None,
+            scored[-1]["scoreAway"] if scored else None,
+        )
+    return False
+
+
+def game_ttl(parameters, data=None):
+    """
+    Results for finished games are immutable and kept forever: games of past
+    seasons (by GameID) and games the response itself shows are over. Others
+    are kept for IN_PROGRESS_TTL seconds. On lookups (data is None) any stored
+    entry is served until the expiry it was stored with.
+    """
+    if data is None:
+        return FOREVER
+    if isinstance(data, dict) and _is_past_season(parameters) and _has_rows(data):
+        return FOREVER
+    return FOREVER if _is_final(data) else IN_PROGRESS_TTL
+
+
+# Anything not listed here is not cached unless the policy's default_ttl says
+# otherwise.
+DEFAULT_TTLS = {
+    "boxscoreadvancedv2": game_ttl,
+    "boxscoreadvancedv3": game_ttl,
+    "boxscoredefensivev2": game_ttl,
+    "boxscorefourfactorsv2": game_ttl,
+    "boxscorefourfactorsv3": game_ttl,
+    "boxscorehustlev2": game_ttl,
+    "boxscorematchupsv3": game_ttl,
+    "boxscoremiscv2": game_ttl,
+    "boxscoremiscv3": game_ttl,
+    "boxscoreplayertrackv2": game_ttl,
+    "boxscoreplayertrackv3": game_ttl,
+    "boxscorescoringv2": game_ttl,
+    "boxscorescoringv3": game_ttl,
+    "boxscoresummaryv2": game_ttl,
+    "boxscoretraditionalv2": game_ttl,
+    "boxscoretraditionalv3": game_ttl,
+    "boxscoreusagev2": game_ttl,
+    "boxscoreusagev3": game_ttl,
+    "gamerotation": game_ttl,
+    "playbyplay": game_ttl,
+    "playbyplayv2": game_ttl,
+    "playbyplayv3": game_ttl,
+    "scoreboardv2": scoreboard_ttl,
+}
+
+
+class CachePolicy:
+    """
+    Per-endpoint time-to-live, in seconds. A TTL may be a number, FOREVER, or a
+    callable taking the request parameters (dict) and the decoded response
+    (None on lookups) and returning either.
+    """
+
+    def __init__(self, ttls=None, default_ttl=0):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+
+    def set_ttl(self, endpoint, ttl):
+        self.ttls[endpoint.lower()] = ttl
+
+    def get_ttl(self, endpoint, parameters, data=None, contents=None):
+        ttl = self.ttls.get(endpoint.lower(), self.default_ttl)
+        if callable(ttl):
+            if data is None and contents is not None:
+                # Only callers without the decoded response pay for decoding.
+                try:
+                    data = json.loads(contents)
+                except ValueError:
+                    data = {}
+            ttl = ttl(dict(parameters), data)
+        return ttl
+
+
+class ResponseCache:
+    """
+    Persistent, size-bounded response cache stored in a single SQLite file.
+    Bodies are zlib-compressed and entries are evicted least recently used first
+    once the total compressed size exceeds max_bytes.
+    """
+
+    def __init__(
+        self, path, max_bytes=512 * 1024 * 1024, policy=None, compression_level=6
+    ):
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.policy = policy if policy is not None else CachePolicy()
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                url TEXT,
+                status_code INTEGER,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires REAL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def get_key(base_url, parameters):
+        parameter_string = "&".join(
+            "{}={}".format(key, "" if val is None else quote_plus(str(val)))
+            for key, val in sorted(parameters, key=lambda kv: kv[0])
+        )
+        return hashlib.sha1(
+            "{}?{}".format(base_url, parameter_string).encode("utf-8")
+        ).hexdigest()
+
+    def is_cacheable(self, endpoint, parameters):
+        return self.policy.get_ttl(endpoint, parameters) != 0
+
+    def get(self, endpoint, base_url, parameters):
+        """
+        Returns (contents, status_code, url) for a fresh entry, otherwise None.
+        """
+        if not self.is_cacheable(endpoint, parameters):
+            return None
+        key = self.get_key(base_url, parameters)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, status_code, url, expires FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, status_code, url, expires = row
+            if expires is not None and expires <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._connection.commit()
+            self.hits += 1
+        return zlib.decompress(body), status_code, url
+
+    def set(self, endpoint, base_url, parameters, contents, status_code, url, data=None):
+        """
+        Stores a response body. data is the body already decoded, for the
+        policy's TTL callables; without it they decode contents themselves.
+        """
+        if isinstance(contents, str):
+            contents = contents.encode("utf-8")
+        ttl = self.policy.get_ttl(endpoint, parameters, data, contents)
+        if ttl == 0:
+            return
+        body = zlib.compress(contents, self.compression_level)
+        now = time.time()
+        expires = None if ttl is FOREVER else now + ttl
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, url, status_code, body, size, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.get_key(base_url, parameters),
+                    endpoint.lower(),
+                    url,
+                    status_code,
+                    body,
+                    len(body),
+                    expires,
+                    now,
+                ),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        )
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def get_size(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
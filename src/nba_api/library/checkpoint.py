@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from nba_api.library.bulk import fetch_many
+
+PENDING = "pending"
+OK = "ok"
+FAILED = "failed"
+
+
+class CheckpointStore:
+    """
+    Per-item progress of resumable bulk jobs, stored in a single SQLite file.
+    Items are keyed by (job, key) and move from pending to ok or failed; every
+    outcome counts as an attempt and failed items are picked up again on the
+    next run. ok items may carry a JSON result so outputs can be rebuilt
+    without refetching anything.
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """CREATE TABLE IF NOT EXISTS items (
+                job TEXT NOT NULL,
+                key TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                result TEXT,
+                updated REAL NOT NULL,
+                PRIMARY KEY (job, key)
+            )"""
+        )
+        self._connection.commit()
+
+    def add(self, job, keys):
+        """
+        Registers keys as pending; keys the job already has keep their status.
+        Returns the number of new keys.
+        """
+        now = time.time()
+        with self._lock:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO items (job, key, status, updated) "
+                "VALUES (?, ?, ?, ?)",
+                [(job, str(key), PENDING, now) for key in keys],
+            )
+            self._connection.commit()
+            return self._connection.total_changes - before
+
+    def get_pending(self, job, max_attempts=None):
+        """
+        Returns the keys still to do, in the order they were added: pending
+        ones and failed ones with fewer than max_attempts attempts (None = no
+        limit).
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key FROM items WHERE job = ? AND (status = ? OR "
+                "(status = ? AND (? IS NULL OR attempts < ?))) ORDER BY rowid",
+                (job, PENDING, FAILED, max_attempts, max_attempts),
+            ).fetchall()
+        return [key for key, in rows]
+
+    def _update(self, job, key, status, error, result):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE items SET status = ?, attempts = attempts + 1, error = ?, "
+                "result = ?, updated = ? WHERE job = ? AND key = ?",
+                (status, error, result, time.time(), job, str(key)),
+            )
+            self._connection.commit()
+
+    def mark_ok(self, job, key, result=None):
+        self._update(
+            job,
+            key,
+            OK,
+            None,
+            None if result is None else json.dumps(result, default=str),
+        )
+
+    def mark_failed(self, job, key, error):
+        if isinstance(error, BaseException):
+            error = "{}: {}".format(type(error).__name__, error)
+        self._update(job, key, FAILED, error, None)
+
+    def get_status(self, job, key):
+        """
+        Returns {"status", "attempts", "error"} for one item, or None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, attempts, error FROM items WHERE job = ? AND key = ?",
+                (job, str(key)),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "attempts": row[1], "error": row[2]}
+
+    def get_counts(self, job):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM items WHERE job = ? GROUP BY status",
+                (job,),
+            ).fetchall()
+        return dict(rows)
+
+    def get_results(self, job):
+        """
+        Returns [(key, result)] for the job's ok items, in the order they were added.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, result FROM items WHERE job = ? AND status = ? ORDER BY rowid",
+                (job, OK),
+            ).fetchall()
+        return [(key, None if result is None else json.loads(result)) for key, result in rows]
+
+    def get_failed(self, job):
+        """
+        Returns [(key, attempts, error)] for the job's failed items.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT key, attempts, error FROM items WHERE job = ? AND status = ? "
+                "ORDER BY rowid",
+                (job, FAILED),
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def download(
+    store,
+    job,
+    endpoint_class,
+    keys,
+    get_kwargs,
+    process=None,
+    concurrency=None,
+    rate=None,
+    max_attempts=None,
+    process_in_worker=True,
+):
+    """
+    Runs a resumable bulk job. Registers keys with the store, then fetches
+    endpoint_class(**get_kwargs(key)) with fetch_many() for every key not yet
+    ok and records each outcome as soon as it arrives, so an interrupted run
+    resumes where it stopped. process(key, endpoint) turns a loaded endpoint
+    into the JSON-serializable result stored with the item; an exception from
+    it fails the item like a request error would.
+
+    process runs on the fetching worker threads, so results are computed in
+    parallel and only the store writes are serialized; pass
+    process_in_worker=False for a process that is not thread-safe.
+
+    Yields (key, status) for every item recorded.
+    """
+    store.add(job, keys)
+    todo = store.get_pending(job, max_attempts)
+
+    def load(key):
+        endpoint = endpoint_class(**get_kwargs(key))
+        if process is None or not process_in_worker:
+            return endpoint
+        return process(key, endpoint)
+
+    fetches = fetch_many(
+        load,
+        ({"key": key} for key in todo),
+        concurrency=concurrency,
+        rate=rate,
+    )
+    for fetch in fetches:
+        key = todo[fetch.index]
+        try:
+            if not fetch.ok:
+                raise fetch.error
+            result = fetch.endpoint
+            if process is None:
+                result = None
+            elif not process_in_worker:
+                result = process(key, result)
+        except Exception as e:
+            store.mark_failed(job, key, e)
+            yield key, FAILED
+        else:
+            store.mark_ok(job, key, result)
+            yield key, OK
@@ -1,6 +1,7 @@
 DEBUG = False
 
-# Saving and loading responses from text files so that you do not have to do multiple requests when debugging.
+# Saving and loading responses from a local response cache (nba_api.library.cache) so that you do not have to do
+# multiple requests when debugging.
 DEBUG_STORAGE = False
 
 # PROXY = ''
@@ -1,9 +1,77 @@
 import os
 import json
-import random
+import time
+import asyncio
+import importlib
+import importlib.util
+import threading
 import requests
 
-from urllib.parse import quote_plus
+from collections import OrderedDict
+from contextlib import nullcontext
+
+from nba_api.library import json_decoder
+from nba_api.library.cache import CachePolicy, FOREVER, ResponseCache
+from nba_api.library.instrumentation import RequestSample
+from nba_api.library.pool import (
+    ConcurrencyLimiter,
+    get_connection_stats,
+    get_pool_defaults,
+    mount_adapters,
+)
+from nba_api.library.proxy import ProxyPool
+from nba_api.library.retry import THROTTLE_STATUS_CODES, parse_retry_after
+from nba_api.library.singleflight import SingleFlight
+
+# aiohttp is imported by the first async request; it adds noticeably to the
+# import time of every endpoint otherwise.
+AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+aiohttp = None
+
+
+# Close tasks of replaced async sessions, kept referenced until they finish.
+_closing = set()
+
+
+def _forget_close(task):
+    _closing.discard(task)
+    if not task.cancelled():
+        # A session of a closed event loop may fail to close its sockets.
+        task.exception()
+
+
+def _close_async_session(session, loop=None):
+    # Closes a replaced aiohttp session, on the event loop it was opened on
+    # while that loop is still around.
+    if session is None or session.closed:
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is not None and loop is not running and loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    elif running is not None:
+        task = running.create_task(session.close())
+        _closing.add(task)
+        task.add_done_callback(_forget_close)
+    elif loop is not None and not loop.is_closed():
+        loop.run_until_complete(session.close())
+    else:
+        try:
+            asyncio.run(session.close())
+        except RuntimeError:
+            pass
+
+
+def _import_aiohttp():
+    global aiohttp
+    if not AIOHTTP:
+        raise Exception("Import Missing - Failed to import aiohttp.")
+    if aiohttp is None:
+        aiohttp = importlib.import_module("aiohttp")
+    return aiohttp
+
 
 try:
     from nba_api.library.debug.debug import DEBUG
@@ -24,22 +92,58 @@ except ImportError:
 
 
 if DEBUG:
-    from hashlib import md5
-
     print("DEBUG MODE")
 
 
+_NOT_DECODED = object()
+
+
 class NBAResponse:
-    def __init__(self, response, status_code, url):
+    def __init__(self, response, status_code, url, keep_contents=True):
+        # response is the raw body, normally bytes straight off the socket.
         self._response = response
         self._status_code = status_code
         self._url = url
+        self._keep_contents = keep_contents
+        self._dict = _NOT_DECODED
+        self._decode_error = None
+
+    def get_content(self):
+        contents = self._response
+        if contents is None:
+            return self.get_json().encode("utf-8")
+        if isinstance(contents, str):
+            return contents.encode("utf-8")
+        return contents
 
     def get_response(self):
-        return self._response
+        contents = self._response
+        if contents is None:
+            return self.get_json()
+        if isinstance(contents, bytes):
+            return contents.decode("utf-8")
+        return contents
 
     def get_dict(self):
-        return json.loads(self._response)
+        """Returns the decoded payload, decoding it at most once.
+
+        The dict is shared and read-only: every call returns the same object,
+        and so do the calls of requests sharing this response, whether they
+        waited on one in-flight request or got a 304 for a cached validator.
+        Copy it before changing it.
+        """
+        if self._dict is _NOT_DECODED:
+            if self._decode_error is not None:
+                raise self._decode_error
+            try:
+                self._dict = json_decoder.loads(self._response)
+            except ValueError as e:
+                self._decode_error = e
+                raise
+            if not self._keep_contents:
+                # The dict is now the only copy; get_response re-serializes it.
+                self._response = None
+        return self._dict
 
     def get_json(self):
         return json.dumps(self.get_dict())
@@ -55,6 +159,40 @@ class NBAResponse:
         return self._url
 
 
+class ValidatorStore:
+    """
+    Remembers the ETag / Last-Modified validators of recent responses, together
+    with the response they validate, so unchanged resources can be revalidated
+    with a conditional GET and served from memory on a 304.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, etag, last_modified, response):
+        with self._lock:
+            self._entries[key] = (etag, last_modified, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class NBAHTTP:
     nba_response = NBAResponse
 
@@ -64,13 +202,65 @@ class NBAHTTP:
 
     headers = None
 
+    # Connection pool of the shared requests.Session; see configure_pool.
+    pool_connections = 10
+
+    pool_maxsize = 10
+
+    pool_block = False
+
+    keep_alive = True
+
+    # Total number of pooled connections held by the async client, and the cap
+    # per host (0 = no cap).
+    async_pool_size = 100
+
+    async_limit_per_host = 0
+
+    # Send If-None-Match / If-Modified-Since and reuse the previous response on a 304.
+    conditional_requests = False
+
+    # Keep the raw body on the response after it is parsed; set to False to hold
+    # only the decoded dict.
+    keep_contents = True
+
+    _validators = ValidatorStore()
+
+    # Share one in-flight request among concurrent callers asking for the same URL.
+    coalesce_requests = True
+
+    _single_flight = SingleFlight()
+
+    _cache = None
+
+    _rate_limiter = None
+
+    _retry_policy = None
+
+    _instrumentation = None
+
+    _proxy_pool = None
+
+    _proxy_pools = {}
+
+    _concurrency_limiter = None
+
     _session = None
 
+    _async_session = None
+
+    _async_session_loop = None
+
     @classmethod
     def get_session(cls):
         session = cls._session
         if session is None:
-            session = requests.Session()
+            session = mount_adapters(
+                requests.Session(),
+                cls.pool_connections,
+                cls.pool_maxsize,
+                cls.pool_block,
+            )
             cls._session = session
         return session
 
@@ -78,23 +268,216 @@ class NBAHTTP:
     def set_session(cls, session) -> None:
         cls._session = session
 
+    @classmethod
+    def configure_pool(
+        cls,
+        workers=None,
+        pool_maxsize=None,
+        pool_connections=None,
+        pool_block=None,
+        max_per_host=None,
+        keep_alive=True,
+    ) -> None:
+        """
+        Sizes the shared connection pools. Unset sizes are derived from the
+        number of worker threads issuing requests; max_per_host caps how many
+        requests may be in flight to one host at a time (sync and async). The
+        current session is re-mounted; an open async session keeps its old
+        limits until it is closed.
+        """
+        defaults = get_pool_defaults(workers)
+        cls.pool_connections = pool_connections or defaults["pool_connections"]
+        cls.pool_maxsize = pool_maxsize or defaults["pool_maxsize"]
+        cls.pool_block = defaults["pool_block"] if pool_block is None else pool_block
+        cls.keep_alive = keep_alive
+        cls.async_pool_size = max(cls.async_pool_size, cls.pool_maxsize)
+        cls.async_limit_per_host = max_per_host or 0
+        cls._concurrency_limiter = (
+            ConcurrencyLimiter(max_per_host) if max_per_host else None
+        )
+        for session in {id(s): s for s in cls._get_sessions()}.values():
+            mount_adapters(
+                session,
+                cls.pool_connections,
+                cls.pool_maxsize,
+                cls.pool_block,
+            )
+
+    @classmethod
+    def _get_sessions(cls):
+        # get_session() on a subclass caches the session on that subclass.
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            classes.extend(klass.__subclasses__())
+            session = klass.__dict__.get("_session")
+            if session is not None:
+                yield session
+
+    @classmethod
+    def get_pool_stats(cls):
+        """
+        Returns the pool settings, per-host connection reuse of the shared
+        session and, when max_per_host is set, per-host concurrency.
+        """
+        limiter = cls._concurrency_limiter
+        return {
+            "pool_connections": cls.pool_connections,
+            "pool_maxsize": cls.pool_maxsize,
+            "pool_block": cls.pool_block,
+            "keep_alive": cls.keep_alive,
+            "connections": get_connection_stats(cls.get_session()),
+            "concurrency": limiter.get_stats() if limiter is not None else {},
+        }
+
+    @classmethod
+    def get_async_session(cls):
+        """
+        Returns the pooled aiohttp.ClientSession shared by every async request.
+        Must be called from within a running event loop; a session created for a
+        previous (now closed) event loop is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        session = cls._async_session
+        if session is None or session.closed or (
+            cls._async_session_loop is not None and cls._async_session_loop is not loop
+        ):
+            _close_async_session(session, cls._async_session_loop)
+            _import_aiohttp()
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=cls.async_pool_size,
+                    limit_per_host=cls.async_limit_per_host,
+                    force_close=not cls.keep_alive,
+                )
+            )
+            cls._async_session = session
+            cls._async_session_loop = loop
+        return session
+
+    @classmethod
+    def set_async_session(cls, session) -> None:
+        """
+        Replaces the shared aiohttp.ClientSession, closing the one it replaces.
+        """
+        previous = cls._async_session
+        if previous is not session:
+            _close_async_session(previous, cls._async_session_loop)
+        cls._async_session = session
+        cls._async_session_loop = None
+
+    @classmethod
+    async def close_async_session(cls) -> None:
+        session = cls._async_session
+        cls._async_session = None
+        cls._async_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    @classmethod
+    def get_cache(cls):
+        return cls._cache
+
+    @classmethod
+    def set_cache(cls, cache) -> None:
+        """
+        Installs a response cache (e.g. nba_api.library.cache.ResponseCache) used
+        by every request; pass None to disable caching.
+        """
+        cls._cache = cache
+
+    @classmethod
+    def get_rate_limiter(cls):
+        return cls._rate_limiter
+
+    @classmethod
+    def set_rate_limiter(cls, rate_limiter) -> None:
+        """
+        Installs a nba_api.library.ratelimit.RateLimiter consulted before every
+        request (including retries); pass None to disable rate limiting.
+        """
+        cls._rate_limiter = rate_limiter
+
+    @classmethod
+    def get_retry_policy(cls):
+        return cls._retry_policy
+
+    @classmethod
+    def set_retry_policy(cls, retry_policy) -> None:
+        """
+        Installs a nba_api.library.retry.RetryPolicy; pass None to disable retries.
+        """
+        cls._retry_policy = retry_policy
+
+    @classmethod
+    def get_instrumentation(cls):
+        return cls._instrumentation
+
+    @classmethod
+    def set_instrumentation(cls, instrumentation) -> None:
+        """
+        Installs a nba_api.library.instrumentation.Instrumentation (or any object
+        with a record(sample) method) that receives the timings and outcome of
+        every request; pass None to disable instrumentation.
+        """
+        cls._instrumentation = instrumentation
+
+    @classmethod
+    def get_proxy_pool(cls, proxies=None):
+        """
+        Returns the installed default ProxyPool or, given a list of proxies, the
+        pool tracking that list (created on first use so health is remembered
+        across requests).
+        """
+        if proxies is None:
+            return cls._proxy_pool
+        key = tuple(proxies)
+        pool = cls._proxy_pools.get(key)
+        if pool is None:
+            pool = cls._proxy_pools.setdefault(key, ProxyPool(proxies))
+        return pool
+
+    @classmethod
+    def set_proxy_pool(cls, proxy_pool) -> None:
+        """
+        Installs the ProxyPool used when a request does not pass its own proxy.
+        """
+        cls._proxy_pool = proxy_pool
+
+    @classmethod
+    def clear_validators(cls) -> None:
+        cls._validators.clear()
+
     def clean_contents(self, contents):
         return contents
 
-    def send_api_request(
-        self,
-        endpoint,
-        parameters,
-        referer=None,
-        proxy=None,
-        headers=None,
-        timeout=None,
-        raise_exception_on_error=False,
-    ):
+    def _get_conditional_request(self, base_url, parameters, request_headers):
+        if not self.conditional_requests:
+            return None, None, request_headers
+        key = (base_url, tuple(parameters))
+        entry = self._validators.get(key)
+        if entry is None:
+            return key, None, request_headers
+        etag, last_modified, _ = entry
+        request_headers = dict(request_headers or {})
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+        return key, entry, request_headers
+
+    def _store_validators(self, key, status_code, response_headers, data):
+        if key is None or status_code != 200:
+            return
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators.set(key, etag, last_modified, data)
+
+    def _prepare_request(self, endpoint, parameters, referer, proxy, headers):
         if not self.base_url:
             raise Exception("Cannot use send_api_request from _HTTP class.")
         base_url = self.base_url.format(endpoint=endpoint)
-        endpoint = endpoint.lower()
         self.parameters = parameters
 
         if headers is None:
@@ -103,81 +486,419 @@ class NBAHTTP:
             request_headers = headers
 
         if referer:
+            request_headers = dict(request_headers or {})
             request_headers["Referer"] = referer
 
         if proxy is None:
-            request_proxy = PROXY
+            request_proxy = self._proxy_pool or PROXY
         elif not proxy:
             request_proxy = None
         else:
             request_proxy = proxy
 
         if isinstance(request_proxy, list):
-            request_proxy = random.choice(request_proxy)
-            if DEBUG:
-                print(request_proxy)
+            request_proxy = self.get_proxy_pool(request_proxy)
 
+        # Sort parameters by key... for some reason this matters for some requests...
+        parameters = sorted(parameters.items(), key=lambda kv: kv[0])
+
+        return base_url, parameters, request_headers, request_proxy or None
+
+    def _build_response(self, contents, status_code, url, raise_exception_on_error):
+        data = self.nba_response(
+            response=contents,
+            status_code=status_code,
+            url=url,
+            keep_contents=self.keep_contents,
+        )
+
+        if raise_exception_on_error and not data.valid_json():
+            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+
+        return data
+
+    def _fetch(
+        self, base_url, parameters, request_headers, request_proxy, timeout, sample=None
+    ):
         proxies = None
         if request_proxy:
             proxies = {
                 "http": request_proxy,
                 "https": request_proxy,
             }
+        if not self.keep_alive:
+            request_headers = dict(request_headers or {})
+            request_headers["Connection"] = "close"
+        fetch_started = time.monotonic()
+        response = self.get_session().get(
+            url=base_url,
+            params=parameters,
+            headers=request_headers,
+            proxies=proxies,
+            timeout=timeout,
+        )
+        if sample is not None:
+            # requests does not expose DNS / connect timings; elapsed runs from
+            # sending the request until the response headers were parsed.
+            sample.ttfb = response.elapsed.total_seconds()
+            sample.download = max(time.monotonic() - fetch_started - sample.ttfb, 0.0)
+        return response.status_code, response.url, response.headers, response.content
+
+    async def _fetch_async(
+        self, base_url, parameters, request_headers, request_proxy, timeout, sample=None
+    ):
+        # aiohttp only accepts str query values and, unlike requests, does not
+        # drop parameters whose value is None.
+        params = [(key, str(val)) for key, val in parameters if val is not None]
+        request_timeout = None
+        if timeout is not None and AIOHTTP:
+            request_timeout = _import_aiohttp().ClientTimeout(total=timeout)
+        fetch_started = time.monotonic()
+        async with self.get_async_session().get(
+            base_url,
+            params=params,
+            headers=request_headers,
+            proxy=request_proxy,
+            timeout=request_timeout,
+        ) as response:
+            read_started = time.monotonic()
+            # A 304 has no body; b"" matches what requests returns for one.
+            contents = b""
+            if response.status != 304:
+                contents = await response.read()
+            if sample is not None:
+                sample.ttfb = read_started - fetch_started
+                sample.download = time.monotonic() - read_started
+            return response.status, str(response.url), response.headers, contents
+
+    def _choose_proxy(self, request_proxy):
+        if not isinstance(request_proxy, ProxyPool):
+            return request_proxy
+        proxy = request_proxy.choose()
+        if DEBUG:
+            print(proxy)
+        return proxy
+
+    def _record_proxy(self, request_proxy, proxy, fetch_started, status_code=None):
+        if not isinstance(request_proxy, ProxyPool):
+            return
+        latency = time.monotonic() - fetch_started
+        if status_code is None:
+            request_proxy.record_failure(proxy, latency)
+        else:
+            request_proxy.record_response(proxy, status_code, latency)
 
-        url = None
-        status_code = None
-        contents = None
-
-        # Sort parameters by key... for some reason this matters for some requests...
-        parameters = sorted(parameters.items(), key=lambda kv: kv[0])
+    def _get_slot(self, base_url):
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            return nullcontext()
+        return limiter.slot(base_url)
 
-        if DEBUG and DEBUG_STORAGE:
-            print(endpoint, parameters)
-            directory_name = "debug_storage"
-            parameter_string = "&".join(
-                "{}={}".format(key, "" if val is None else quote_plus(str(val)))
-                for key, val in parameters
-            )
-            url = "{}?{}".format(base_url, parameter_string)
-            print(url)
-            file_name = "{}-{}.txt".format(
-                endpoint, md5(parameter_string.encode("utf-8")).hexdigest()
-            )
-            file_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "debug", directory_name
-            )
-            if not os.path.exists(file_path):
-                os.makedirs(file_path)
-            file_path = os.path.join(file_path, file_name)
-            print(file_name, os.path.isfile(file_path))
-            if os.path.isfile(file_path):
-                f = open(file_path, "r")
-                contents = f.read()
-                f.close()
-                print("loading from file...")
-
-        if not contents:
-            response = self.get_session().get(
-                url=base_url,
-                params=parameters,
-                headers=request_headers,
-                proxies=proxies,
-                timeout=timeout,
-            )
-            url = response.url
-            status_code = response.status_code
-            contents = response.text
+    def _get_retry_delay(
+        self, base_url, attempt, started, status_code=None, exception=None, headers=None
+    ):
+        retry_after = None
+        if headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+        limiter = self.get_rate_limiter()
+        if limiter is not None and status_code in THROTTLE_STATUS_CODES:
+            limiter.record_throttle(base_url, retry_after)
+        policy = self.get_retry_policy()
+        if policy is None:
+            return None
+        return policy.get_delay(
+            attempt,
+            time.monotonic() - started,
+            status_code=status_code,
+            exception=exception,
+            retry_after=retry_after,
+        )
+
+    def _send(
+        self, base_url, parameters, request_headers, request_proxy, timeout, sample=None
+    ):
+        limiter = self.get_rate_limiter()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(base_url)
+            if sample is not None:
+                sample.retries = attempt
+            proxy = self._choose_proxy(request_proxy)
+            fetch_started = time.monotonic()
+            try:
+                with self._get_slot(base_url):
+                    result = self._fetch(
+                        base_url, parameters, request_headers, proxy, timeout, sample
+                    )
+            except Exception as e:
+                self._record_proxy(request_proxy, proxy, fetch_started)
+                delay = self._get_retry_delay(base_url, attempt, started, exception=e)
+                if delay is None:
+                    raise
+            else:
+                self._record_proxy(request_proxy, proxy, fetch_started, result[0])
+                delay = self._get_retry_delay(
+                    base_url, attempt, started, status_code=result[0], headers=result[2]
+                )
+                if delay is None:
+                    return result
+            time.sleep(delay)
+            attempt += 1
+
+    async def _send_async(
+        self, base_url, parameters, request_headers, request_proxy, timeout, sample=None
+    ):
+        limiter = self.get_rate_limiter()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async(base_url)
+            if sample is not None:
+                sample.retries = attempt
+            proxy = self._choose_proxy(request_proxy)
+            fetch_started = time.monotonic()
+            try:
+                result = await self._fetch_async(
+                    base_url, parameters, request_headers, proxy, timeout, sample
+                )
+            except Exception as e:
+                self._record_proxy(request_proxy, proxy, fetch_started)
+                delay = self._get_retry_delay(base_url, attempt, started, exception=e)
+                if delay is None:
+                    raise
+            else:
+                self._record_proxy(request_proxy, proxy, fetch_started, result[0])
+                delay = self._get_retry_delay(
+                    base_url, attempt, started, status_code=result[0], headers=result[2]
+                )
+                if delay is None:
+                    return result
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _get_cached_response(
+        self, endpoint, base_url, parameters, raise_exception_on_error, sample=None
+    ):
+        cache = self.get_cache()
+        if cache is None:
+            return None
+        cached = cache.get(endpoint, base_url, parameters)
+        if cached is None:
+            return None
+        contents, status_code, url = cached
+        if sample is not None:
+            sample.source = "cache"
+            sample.status_code = status_code
+        return self._build_response(contents, status_code, url, raise_exception_on_error)
+
+    def _start_sample(self, endpoint):
+        if self.get_instrumentation() is None:
+            return None
+        return RequestSample(endpoint)
+
+    def _finish_sample(self, sample, error=None):
+        instrumentation = self.get_instrumentation()
+        if sample is None or instrumentation is None:
+            return
+        sample.total = time.monotonic() - sample.started
+        if error is not None:
+            sample.error = type(error).__name__
+        instrumentation.record(sample)
+
+    def _load_result(
+        self,
+        endpoint,
+        base_url,
+        parameters,
+        result,
+        validator_key,
+        validator,
+        raise_exception_on_error,
+        sample=None,
+    ):
+        status_code, url, response_headers, contents = result
+        if sample is not None:
+            sample.status_code = status_code
+            sample.bytes = len(contents)
+        if status_code == 304 and validator is not None:
+            if sample is not None:
+                sample.source = "not_modified"
+            return validator[2]
 
         contents = self.clean_contents(contents)
-        if DEBUG and DEBUG_STORAGE:
-            f = open(file_path, "w")
-            f.write(contents)
-            f.close()
-            print(url)
 
-        data = self.nba_response(response=contents, status_code=status_code, url=url)
+        parse_started = time.monotonic()
+        data = self._build_response(
+            contents, status_code, url, raise_exception_on_error
+        )
+        if sample is not None:
+            data.valid_json()
+            sample.parse = time.monotonic() - parse_started
+        cache = self.get_cache()
+        if cache is not None and status_code == 200 and data.valid_json():
+            cache.set(
+                endpoint, base_url, parameters, contents, status_code, url, data.get_dict()
+            )
+        self._store_validators(validator_key, status_code, response_headers, data)
+        return data
 
-        if raise_exception_on_error and not data.valid_json():
-            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+    def _get_flight_key(self, base_url, parameters, raise_exception_on_error):
+        if not self.coalesce_requests:
+            return None
+        key = (base_url, tuple(parameters), raise_exception_on_error)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
+    def _request(
+        self,
+        endpoint,
+        base_url,
+        parameters,
+        request_headers,
+        request_proxy,
+        timeout,
+        raise_exception_on_error,
+    ):
+        sample = self._start_sample(endpoint)
+        try:
+            data = self._get_cached_response(
+                endpoint, base_url, parameters, raise_exception_on_error, sample
+            )
+            if data is None:
+                validator_key, validator, request_headers = (
+                    self._get_conditional_request(base_url, parameters, request_headers)
+                )
+                result = self._send(
+                    base_url, parameters, request_headers, request_proxy, timeout, sample
+                )
+                data = self._load_result(
+                    endpoint,
+                    base_url,
+                    parameters,
+                    result,
+                    validator_key,
+                    validator,
+                    raise_exception_on_error,
+                    sample,
+                )
+        except Exception as e:
+            self._finish_sample(sample, e)
+            raise
+        self._finish_sample(sample)
         return data
+
+    async def _request_async(
+        self,
+        endpoint,
+        base_url,
+        parameters,
+        request_headers,
+        request_proxy,
+        timeout,
+        raise_exception_on_error,
+    ):
+        sample = self._start_sample(endpoint)
+        try:
+            data = self._get_cached_response(
+                endpoint, base_url, parameters, raise_exception_on_error, sample
+            )
+            if data is None:
+                validator_key, validator, request_headers = (
+                    self._get_conditional_request(base_url, parameters, request_headers)
+                )
+                result = await self._send_async(
+                    base_url, parameters, request_headers, request_proxy, timeout, sample
+                )
+                data = self._load_result(
+                    endpoint,
+                    base_url,
+                    parameters,
+                    result,
+                    validator_key,
+                    validator,
+                    raise_exception_on_error,
+                    sample,
+                )
+        except Exception as e:
+            self._finish_sample(sample, e)
+            raise
+        self._finish_sample(sample)
+        return data
+
+    def send_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+    ):
+        base_url, parameters, request_headers, request_proxy = self._prepare_request(
+            endpoint, parameters, referer, proxy, headers
+        )
+        request = (
+            endpoint.lower(),
+            base_url,
+            parameters,
+            request_headers,
+            request_proxy,
+            timeout,
+            raise_exception_on_error,
+        )
+
+        key = self._get_flight_key(base_url, parameters, raise_exception_on_error)
+        if key is None:
+            return self._request(*request)
+        # Identical concurrent requests share one round trip and one NBAResponse.
+        return self._single_flight.do(key, self._request, *request)
+
+    async def send_api_request_async(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+    ):
+        base_url, parameters, request_headers, request_proxy = self._prepare_request(
+            endpoint, parameters, referer, proxy, headers
+        )
+        request = (
+            endpoint.lower(),
+            base_url,
+            parameters,
+            request_headers,
+            request_proxy,
+            timeout,
+            raise_exception_on_error,
+        )
+
+        key = self._get_flight_key(base_url, parameters, raise_exception_on_error)
+        if key is None:
+            return await self._request_async(*request)
+        return await self._single_flight.do_async(key, self._request_async, *request)
+
+
+if DEBUG and DEBUG_STORAGE:
+    # Keep every response so repeated debugging runs never re-request the API.
+    NBAHTTP.set_cache(
+        ResponseCache(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "debug",
+                "debug_storage",
+                "responses.sqlite",
+            ),
+            policy=CachePolicy(ttls={}, default_ttl=FOREVER),
+        )
+    )
@@ -0,0 +1,218 @@
+import re
+import time
+import bisect
+import threading
+
+# Latency histogram upper bounds, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PHASES = ("ttfb", "download", "parse", "total")
+
+_ID_PATTERN = re.compile(r"(?<=_)\d+")
+
+
+def normalize_endpoint(endpoint):
+    """
+    Collapses per-game URLs into one metric name, e.g.
+    boxscore/boxscore_0022000180.json -> boxscore/boxscore_{id}.
+    """
+    endpoint = endpoint.lower()
+    if endpoint.endswith(".json"):
+        endpoint = endpoint[: -len(".json")]
+    return _ID_PATTERN.sub("{id}", endpoint)
+
+
+class RequestSample:
+    """
+    Timings (seconds) and outcome of one send_api_request call. source is
+    "network", "not_modified" (304 served from memory) or "cache".
+    """
+
+    __slots__ = (
+        "endpoint",
+        "started",
+        "status_code",
+        "source",
+        "bytes",
+        "retries",
+        "error",
+        "ttfb",
+        "download",
+        "parse",
+        "total",
+    )
+
+    def __init__(self, endpoint):
+        self.endpoint = normalize_endpoint(endpoint)
+        self.started = time.monotonic()
+        self.status_code = None
+        self.source = "network"
+        self.bytes = 0
+        self.retries = 0
+        self.error = None
+        self.ttfb = None
+        self.download = None
+        self.parse = None
+        self.total = None
+
+    def get_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__ if name != "started"}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class EndpointStats:
+    def __init__(self, buckets):
+        self.latency = {phase: Histogram(buckets) for phase in PHASES}
+        self.responses = {}
+        self.bytes = 0
+        self.retries = 0
+        self.errors = {}
+
+    def get_dict(self):
+        return {
+            "responses": {
+                "{}:{}".format(source, status): count
+                for (source, status), count in self.responses.items()
+            },
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "errors": dict(self.errors),
+            "latency": {
+                phase: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count if histogram.count else None,
+                }
+                for phase, histogram in self.latency.items()
+            },
+        }
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound):
+    return "+Inf" if bound is None else repr(float(bound))
+
+
+class Instrumentation:
+    """
+    Aggregates RequestSamples per endpoint into latency histograms and response,
+    byte, retry and error counters. Pass callback to also receive every sample
+    as it is recorded (e.g. to forward it to another metrics system).
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, callback=None):
+        self.buckets = tuple(sorted(buckets))
+        self.callback = callback
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, sample):
+        with self._lock:
+            stats = self._endpoints.get(sample.endpoint)
+            if stats is None:
+                stats = self._endpoints[sample.endpoint] = EndpointStats(self.buckets)
+            for phase in PHASES:
+                value = getattr(sample, phase)
+                if value is not None:
+                    stats.latency[phase].observe(value)
+            if sample.error is not None:
+                stats.errors[sample.error] = stats.errors.get(sample.error, 0) + 1
+            else:
+                key = (sample.source, sample.status_code)
+                stats.responses[key] = stats.responses.get(key, 0) + 1
+            stats.bytes += sample.bytes
+            stats.retries += sample.retries
+        if self.callback is not None:
+            self.callback(sample)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                endpoint: stats.get_dict()
+                for endpoint, stats in sorted(self._endpoints.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix="nba_api"):
+        """
+        Renders every metric in the Prometheus text exposition format.
+        """
+        latency = "{}_request_duration_seconds".format(prefix)
+        responses = "{}_responses_total".format(prefix)
+        errors = "{}_request_errors_total".format(prefix)
+        received = "{}_response_bytes_total".format(prefix)
+        retries = "{}_retries_total".format(prefix)
+        lines = [
+            "# HELP {} Request latency by phase.".format(latency),
+            "# TYPE {} histogram".format(latency),
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            for endpoint, stats in endpoints:
+                for phase, histogram in stats.latency.items():
+                    labels = 'endpoint="{}",phase="{}"'.format(_escape(endpoint), phase)
+                    cumulative = 0
+                    for bound, count in zip(
+                        self.buckets + (None,), histogram.counts
+                    ):
+                        cumulative += count
+                        lines.append(
+                            '{}_bucket{{{},le="{}"}} {}'.format(
+                                latency, labels, _format_bound(bound), cumulative
+                            )
+                        )
+                    lines.append("{}_sum{{{}}} {}".format(latency, labels, histogram.sum))
+                    lines.append(
+                        "{}_count{{{}}} {}".format(latency, labels, histogram.count)
+                    )
+            lines.append("# HELP {} Responses by source and status code.".format(responses))
+            lines.append("# TYPE {} counter".format(responses))
+            for endpoint, stats in endpoints:
+                for (source, status), count in sorted(
+                    stats.responses.items(), key=lambda item: str(item[0])
+                ):
+                    lines.append(
+                        '{}{{endpoint="{}",source="{}",status="{}"}} {}'.format(
+                            responses, _escape(endpoint), source, status, count
+                        )
+                    )
+            lines.append("# HELP {} Requests that raised, by exception.".format(errors))
+            lines.append("# TYPE {} counter".format(errors))
+            for endpoint, stats in endpoints:
+                for error, count in sorted(stats.errors.items()):
+                    lines.append(
+                        '{}{{endpoint="{}",error="{}"}} {}'.format(
+                            errors, _escape(endpoint), _escape(error), count
+                        )
+                    )
+            for name, attribute, description in (
+                (received, "bytes", "Response body bytes received."),
+                (retries, "retries", "Retried attempts."),
+            ):
+                lines.append("# HELP {} {}".format(name, description))
+                lines.append("# TYPE {} counter".format(name))
+                for endpoint, stats in endpoints:
+                    lines.append(
+                        '{}{{endpoint="{}"}} {}'.format(
+                            name, _escape(endpoint), getattr(stats, attribute)
+                        )
+                    )
+        return "\n".join(lines) + "\n"
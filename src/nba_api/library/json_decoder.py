@@ -0,0 +1,71 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def _as_decode_error(error, contents):
+    # Backends raise their own ValueError subclasses; callers (and scripts catching
+    # json.JSONDecodeError) should not need to know which backend is active.
+    if isinstance(contents, (bytes, bytearray, memoryview)):
+        contents = bytes(contents).decode("utf-8", errors="replace")
+    return json.JSONDecodeError(str(error), contents or "", 0)
+
+
+def _json_loads(contents):
+    return json.loads(contents)
+
+
+def _orjson_loads(contents):
+    return orjson.loads(contents)
+
+
+def _simdjson_loads(contents):
+    return simdjson.loads(contents)
+
+
+DECODERS = {"json": _json_loads}
+if simdjson is not None:
+    DECODERS["simdjson"] = _simdjson_loads
+if orjson is not None:
+    DECODERS["orjson"] = _orjson_loads
+
+# Fastest available backend first; the stdlib is always available.
+_decoder = DECODERS.get("orjson") or DECODERS.get("simdjson") or DECODERS["json"]
+
+
+def get_decoder():
+    return _decoder
+
+
+def set_decoder(decoder):
+    """
+    Sets the function used to decode response bodies. Accepts the name of one of
+    the installed backends in DECODERS or any callable taking str/bytes.
+    """
+    global _decoder
+    if isinstance(decoder, str):
+        if decoder not in DECODERS:
+            raise ValueError(
+                "Unknown JSON decoder '{}'. Available: {}".format(
+                    decoder, ", ".join(sorted(DECODERS))
+                )
+            )
+        decoder = DECODERS[decoder]
+    _decoder = decoder
+
+
+def loads(contents):
+    try:
+        return _decoder(contents)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        raise _as_decode_error(e, contents) from e
@@ -0,0 +1,152 @@
+import time
+import threading
+
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+
+
+def get_pool_defaults(workers=None):
+    """
+    Pool settings for a given number of worker threads: one pooled connection
+    per worker so no thread ever has to discard (and later re-handshake) one.
+    """
+    pool_maxsize = DEFAULT_POOLSIZE
+    if workers:
+        pool_maxsize = max(pool_maxsize, int(workers))
+    return {
+        "pool_connections": DEFAULT_POOLSIZE,
+        "pool_maxsize": pool_maxsize,
+        "pool_block": DEFAULT_POOLBLOCK,
+    }
+
+
+def mount_adapters(session, pool_connections, pool_maxsize, pool_block):
+    """
+    Replaces the session's http:// and https:// adapters with ones using the
+    given pool settings, closing the connections held by the old ones.
+    """
+    for prefix in ("https://", "http://"):
+        previous = session.adapters.get(prefix)
+        session.mount(
+            prefix,
+            HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            ),
+        )
+        if previous is not None:
+            previous.close()
+    return session
+
+
+def _iter_connection_pools(adapter):
+    managers = [getattr(adapter, "poolmanager", None)]
+    managers.extend(getattr(adapter, "proxy_manager", {}).values())
+    for manager in managers:
+        if manager is None:
+            continue
+        for key in manager.pools.keys():
+            pool = manager.pools.get(key)
+            if pool is not None:
+                yield pool
+
+
+def get_connection_stats(session):
+    """
+    Connection reuse per host, read from the session's urllib3 pools. A request
+    that did not open a new connection reused a kept-alive one; urllib3 does
+    not count reconnects of a pooled connection the server closed, so reuse
+    is an upper bound when the server drops idle connections.
+    """
+    stats = {}
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        for pool in _iter_connection_pools(adapter):
+            host = "{}://{}".format(pool.scheme, pool.host)
+            host_stats = stats.setdefault(
+                host, {"connections": 0, "requests": 0, "reused": 0, "idle": 0}
+            )
+            connections = getattr(pool, "num_connections", 0)
+            requests = getattr(pool, "num_requests", 0)
+            host_stats["connections"] += connections
+            host_stats["requests"] += requests
+            host_stats["reused"] += max(requests - connections, 0)
+            queue = getattr(pool, "pool", None)
+            if queue is not None:
+                host_stats["idle"] += sum(conn is not None for conn in list(queue.queue))
+    return stats
+
+
+class ConcurrencyLimiter:
+    """
+    Caps the number of requests in flight to any one host. limits maps a host
+    name to its cap; other hosts use max_per_host (None = unlimited).
+    """
+
+    def __init__(self, max_per_host=None, limits=None):
+        self.max_per_host = max_per_host
+        self.limits = dict(limits or {})
+        self._semaphores = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_host(url):
+        return urlsplit(url).hostname or url
+
+    def _get_semaphore(self, host):
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                limit = self.limits.get(host, self.max_per_host)
+                if limit is None:
+                    return None
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(limit)
+            return semaphore
+
+    def _get_host_stats(self, host):
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = {
+                "requests": 0,
+                "in_flight": 0,
+                "max_in_flight": 0,
+                "waited": 0,
+                "wait_seconds": 0.0,
+            }
+        return stats
+
+    @contextmanager
+    def slot(self, url):
+        host = self.get_host(url)
+        semaphore = self._get_semaphore(host)
+        waited = None
+        if semaphore is not None and not semaphore.acquire(blocking=False):
+            started = time.monotonic()
+            semaphore.acquire()
+            waited = time.monotonic() - started
+        with self._lock:
+            stats = self._get_host_stats(host)
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            if waited is not None:
+                stats["waited"] += 1
+                stats["wait_seconds"] += waited
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stats[host]["in_flight"] -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    def get_stats(self):
+        with self._lock:
+            return {host: dict(stats) for host, stats in self._stats.items()}
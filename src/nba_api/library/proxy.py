@@ -0,0 +1,115 @@
+import time
+import random
+import threading
+
+# Responses that mean the exit node is blocked or overloaded rather than the
+# request being bad.
+FAILURE_STATUS_CODES = (403, 407, 429, 502, 503, 504)
+
+
+class ProxyStats:
+    def __init__(self, proxy):
+        self.proxy = proxy
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency = None
+        self.error_rate = 0.0
+        self.cooldown_until = 0.0
+
+    def get_dict(self):
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+class ProxyPool:
+    """
+    Health-scored proxy pool. Each proxy keeps an exponentially weighted latency
+    and error rate; requests go to the better of two randomly sampled proxies
+    (power of two choices) and proxies that fail repeatedly sit out a cooldown
+    that doubles with every further failure.
+    """
+
+    def __init__(
+        self,
+        proxies,
+        cooldown=30.0,
+        max_cooldown=600.0,
+        max_consecutive_failures=3,
+        smoothing=0.3,
+        failure_status_codes=FAILURE_STATUS_CODES,
+    ):
+        if not proxies:
+            raise ValueError("ProxyPool requires at least one proxy")
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_consecutive_failures = max_consecutive_failures
+        self.smoothing = smoothing
+        self.failure_status_codes = tuple(failure_status_codes)
+        self._stats = {proxy: ProxyStats(proxy) for proxy in proxies}
+        self._lock = threading.Lock()
+
+    def _score(self, stats):
+        # Untried proxies score best so every proxy gets sampled at least once.
+        if stats.latency is None:
+            return 0.0
+        return stats.latency * (1.0 + 10.0 * stats.error_rate)
+
+    def choose(self):
+        now = time.monotonic()
+        with self._lock:
+            available = [s for s in self._stats.values() if s.cooldown_until <= now]
+            if not available:
+                return min(self._stats.values(), key=lambda s: s.cooldown_until).proxy
+            if len(available) == 1:
+                return available[0].proxy
+            first, second = random.sample(available, 2)
+            return min(first, second, key=self._score).proxy
+
+    def _update(self, proxy, failed, latency=None):
+        stats = self._stats.get(proxy)
+        if stats is None:
+            return
+        stats.requests += 1
+        stats.error_rate += self.smoothing * (float(failed) - stats.error_rate)
+        if latency is not None:
+            if stats.latency is None:
+                stats.latency = latency
+            else:
+                stats.latency += self.smoothing * (latency - stats.latency)
+        if not failed:
+            stats.consecutive_failures = 0
+            return
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        excess = stats.consecutive_failures - self.max_consecutive_failures
+        if excess >= 0:
+            cooldown = min(self.max_cooldown, self.cooldown * (2**excess))
+            stats.cooldown_until = time.monotonic() + cooldown
+
+    def record_success(self, proxy, latency):
+        with self._lock:
+            self._update(proxy, failed=False, latency=latency)
+
+    def record_failure(self, proxy, latency=None):
+        with self._lock:
+            self._update(proxy, failed=True, latency=latency)
+
+    def record_response(self, proxy, status_code, latency):
+        if status_code in self.failure_status_codes:
+            self.record_failure(proxy, latency)
+        else:
+            self.record_success(proxy, latency)
+
+    def get_stats(self):
+        with self._lock:
+            return {proxy: stats.get_dict() for proxy, stats in self._stats.items()}
+
+    def __len__(self):
+        return len(self._stats)
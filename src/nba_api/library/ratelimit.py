@@ -0,0 +1,136 @@
+import time
+import asyncio
+import threading
+
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Callers reserve a token and are told how long to
+    wait for it, so the same bucket serves blocking and asyncio callers.
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(max(burst, 1))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes one token and returns the number of seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def pause(self, seconds):
+        """
+        Withholds tokens for the given number of seconds (e.g. after a 429).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter keyed by host. rates maps a host name to its
+    requests per second; other hosts use default_rate (None = unlimited).
+    """
+
+    def __init__(self, default_rate=None, burst=1, rates=None):
+        self.default_rate = default_rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_host(url):
+        return urlsplit(url).hostname or url
+
+    def set_rate(self, host, rate):
+        with self._lock:
+            self.rates[host] = rate
+            self._buckets.pop(host, None)
+
+    def get_bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate = self.rates.get(host, self.default_rate)
+                if rate is None:
+                    return None
+                bucket = TokenBucket(rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _get_host_stats(self, host):
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = {
+                "requests": 0,
+                "delayed": 0,
+                "wait_seconds": 0.0,
+                "max_wait_seconds": 0.0,
+                "throttled_responses": 0,
+            }
+        return stats
+
+    def _reserve(self, url):
+        host = self.get_host(url)
+        bucket = self.get_bucket(host)
+        delay = bucket.reserve() if bucket is not None else 0.0
+        with self._lock:
+            stats = self._get_host_stats(host)
+            stats["requests"] += 1
+            if delay > 0:
+                stats["delayed"] += 1
+                stats["wait_seconds"] += delay
+                stats["max_wait_seconds"] = max(stats["max_wait_seconds"], delay)
+        return delay
+
+    def acquire(self, url):
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url):
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def record_throttle(self, url, retry_after=None):
+        """
+        Records a throttling response from the server and, when it says how long
+        to back off, holds the host's bucket for that long.
+        """
+        host = self.get_host(url)
+        with self._lock:
+            self._get_host_stats(host)["throttled_responses"] += 1
+        bucket = self.get_bucket(host)
+        if bucket is not None and retry_after:
+            bucket.pause(retry_after)
+
+    def get_stats(self):
+        with self._lock:
+            return {host: dict(stats) for host, stats in self._stats.items()}
@@ -0,0 +1,108 @@
+import sys
+import random
+import asyncio
+import threading
+import requests
+
+# The default policy also retries aiohttp.ClientError. aiohttp is only imported
+# by the async transport, so it is looked up when an exception is checked.
+RETRY_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    asyncio.TimeoutError,
+)
+
+
+def _is_aiohttp_error(exception):
+    aiohttp = sys.modules.get("aiohttp")
+    return aiohttp is not None and isinstance(exception, aiohttp.ClientError)
+
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        # HTTP-date values are rare from stats.nba.com / cdn.nba.com; ignore them.
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter. A request is retried at most
+    max_retries times, on the listed status codes and exceptions, and never
+    once max_elapsed seconds have passed since the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        max_backoff=30.0,
+        jitter=True,
+        retry_on_status=RETRY_STATUS_CODES,
+        retry_on_exceptions=RETRY_EXCEPTIONS,
+        max_elapsed=None,
+        respect_retry_after=True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on_status = tuple(retry_on_status)
+        self.retry_on_exceptions = tuple(retry_on_exceptions)
+        self._retry_on_aiohttp = retry_on_exceptions is RETRY_EXCEPTIONS
+        self.max_elapsed = max_elapsed
+        self.respect_retry_after = respect_retry_after
+        self._stats = {"retries": 0, "gave_up": 0, "status_codes": {}, "exceptions": {}}
+        self._lock = threading.Lock()
+
+    def is_retryable(self, status_code=None, exception=None):
+        if exception is not None:
+            if self._retry_on_aiohttp and _is_aiohttp_error(exception):
+                return True
+            return isinstance(exception, self.retry_on_exceptions)
+        return status_code in self.retry_on_status
+
+    def get_backoff(self, attempt, retry_after=None):
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        if self.respect_retry_after and retry_after is not None:
+            backoff = max(backoff, min(retry_after, self.max_backoff))
+        return backoff
+
+    def get_delay(self, attempt, elapsed, status_code=None, exception=None, retry_after=None):
+        """
+        Returns how long to sleep before the next attempt, or None when the
+        request should not (or may no longer) be retried.
+        """
+        if not self.is_retryable(status_code, exception):
+            return None
+        delay = self.get_backoff(attempt, retry_after)
+        out_of_time = self.max_elapsed is not None and elapsed + delay > self.max_elapsed
+        with self._lock:
+            if attempt >= self.max_retries or out_of_time:
+                self._stats["gave_up"] += 1
+                return None
+            self._stats["retries"] += 1
+            if exception is not None:
+                name = type(exception).__name__
+                self._stats["exceptions"][name] = self._stats["exceptions"].get(name, 0) + 1
+            else:
+                codes = self._stats["status_codes"]
+                codes[status_code] = codes.get(status_code, 0) + 1
+        return delay
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "retries": self._stats["retries"],
+                "gave_up": self._stats["gave_up"],
+                "status_codes": dict(self._stats["status_codes"]),
+                "exceptions": dict(self._stats["exceptions"]),
+            }
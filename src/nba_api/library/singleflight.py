@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls that share a key into one: the first caller runs
+    the function and every caller that arrives while it is in flight receives
+    the same result (or exception). Nothing is remembered once the call returns.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._async_calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key, fn, *args, **kwargs):
+        # Futures belong to a single event loop, so coalescing is per loop.
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            # The call runs in its own task and every caller awaits it through
+            # shield(), so cancelling one caller never cancels the others.
+            task = calls[key] = asyncio.ensure_future(fn(*args, **kwargs))
+
+            def forget(task):
+                if calls.get(key) is task:
+                    del calls[key]
+                if not calls and self._async_calls.get(loop) is calls:
+                    del self._async_calls[loop]
+                if not task.cancelled():
+                    # Mark retrieved so abandoned calls do not log "never retrieved".
+                    task.exception()
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
@@ -1,5 +1,5 @@
 __all__ = ["playbyplay", "boxscore", "scoreboard"]
 
-from .playbyplay import PlayByPlay
+from .playbyplay import PlayByPlay, PlayByPlayStream
 from .boxscore import BoxScore
 from .scoreboard import ScoreBoard
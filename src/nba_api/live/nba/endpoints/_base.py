@@ -15,6 +15,17 @@ class Endpoint:
         def get_dict(self):
             return self.data
 
+    @classmethod
+    async def create_async(cls, *args, **kwargs):
+        """
+        Awaitable constructor: builds the endpoint without blocking and then
+        awaits get_request_async().
+        """
+        kwargs["get_request"] = False
+        endpoint = cls(*args, **kwargs)
+        await endpoint.get_request_async()
+        return endpoint
+
     def get_request_url(self):
         return self.nba_response.get_url()
 
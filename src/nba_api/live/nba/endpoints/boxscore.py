@@ -1,4 +1,5 @@
 from nba_api.live.nba.endpoints._base import Endpoint
+from nba_api.live.nba.library.gamestate import get_game_state, parse_game_state
 from nba_api.live.nba.library.http import NBALiveHTTP
 
 
@@ -308,11 +309,23 @@ class BoxScore(Endpoint):
     home_team_stats = None
     game = None
     game_details = None
+    game_state = None
     nba_response = None
     officials = None
 
-    def __init__(self, game_id, proxy=None, headers=None, timeout=30, get_request=True):
+    def __init__(
+        self,
+        game_id,
+        proxy=None,
+        headers=None,
+        timeout=30,
+        get_request=True,
+        game_state_only=False,
+    ):
+        # game_state_only reads game_state from the raw response and skips the
+        # DataSets; the full document is only decoded if that read fails.
         self.game_id = game_id
+        self.game_state_only = game_state_only
         self.proxy = proxy
         if headers is not None:
             self.headers = headers
@@ -330,9 +343,26 @@ class BoxScore(Endpoint):
         )
         self.load_response()
 
+    async def get_request_async(self):
+        self.nba_response = await NBALiveHTTP().send_api_request_async(
+            endpoint=self.endpoint_url.format(game_id=self.game_id),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
     def load_response(self):
+        if self.game_state_only:
+            self.game_state = parse_game_state(self.nba_response.get_content())
+            if self.game_state is not None:
+                return
         data_sets = self.nba_response.get_dict()
         if "game" in data_sets:
+            self.game_state = get_game_state(data_sets["game"])
+            if self.game_state_only:
+                return
             self.game = Endpoint.DataSet(data=data_sets["game"])
             self.game_details = self.game.get_dict().copy()
             if "arena" in self.game.get_dict():
@@ -84,7 +84,126 @@ class PlayByPlay(Endpoint):
         )
         self.load_response()
 
+    async def get_request_async(self):
+        self.nba_response = await NBALiveHTTP().send_api_request_async(
+            endpoint=self.endpoint_url.format(game_id=self.game_id),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
     def load_response(self):
         data_sets = self.nba_response.get_dict()
         if "game" in data_sets and "actions" in data_sets["game"]:
             self.actions = Endpoint.DataSet(data=data_sets["game"]["actions"])
+
+
+def _edited_key(edited):
+    # "2021-01-16T00:40:31Z" and "2021-01-16T00:40:31.3Z" do not order as
+    # strings, so the fraction of a second is compared separately.
+    if not edited:
+        return ("", 0.0)
+    seconds, _, fraction = edited.rstrip("Z").partition(".")
+    return (seconds, float("0." + fraction) if fraction else 0.0)
+
+
+class ActionCursor:
+    """
+    How far a consumer has read one game's actions: the highest actionNumber
+    and the latest edited timestamp seen. Its size does not grow with the game.
+    """
+
+    __slots__ = ("action_number", "edited")
+
+    def __init__(self, action_number=0, edited=None):
+        self.action_number = action_number
+        self.edited = _edited_key(edited)
+
+    def is_new(self, action):
+        return (
+            action["actionNumber"] > self.action_number
+            or _edited_key(action.get("edited")) > self.edited
+        )
+
+    def copy(self):
+        cursor = ActionCursor(self.action_number)
+        cursor.edited = self.edited
+        return cursor
+
+    def advance(self, action):
+        self.action_number = max(self.action_number, action["actionNumber"])
+        self.edited = max(self.edited, _edited_key(action.get("edited")))
+
+    def __repr__(self):
+        return "ActionCursor(action_number={}, edited={!r})".format(
+            self.action_number, self.edited
+        )
+
+
+class PlayByPlayStream:
+    """
+    Incremental play-by-play. Each poll fetches the game's feed and yields only
+    the actions that are new (higher actionNumber) or were edited (later
+    edited timestamp) since the previous poll, in feed order. Every action is
+    compared against the cursor as it was when the poll started; the cursor
+    then moves to the furthest action yielded once the poll is done.
+    """
+
+    def __init__(self, proxy=None, headers=None, timeout=30):
+        self.proxy = proxy
+        self.headers = headers
+        self.timeout = timeout
+        self._cursors = {}
+
+    def get_cursor(self, game_id):
+        cursor = self._cursors.get(game_id)
+        if cursor is None:
+            cursor = self._cursors[game_id] = ActionCursor()
+        return cursor
+
+    def reset(self, game_id=None):
+        if game_id is None:
+            self._cursors.clear()
+        else:
+            self._cursors.pop(game_id, None)
+
+    def get_delta(self, game_id, actions):
+        """
+        Yields the actions of a feed that the game's cursor has not seen.
+        """
+        # Edits within one feed are not ordered by their edited timestamps, so
+        # advancing mid-batch would hide an edit older than the one before it.
+        seen = self.get_cursor(game_id)
+        cursor = seen.copy()
+        try:
+            for action in actions:
+                if seen.is_new(action):
+                    cursor.advance(action)
+                    yield action
+        finally:
+            self._cursors[game_id] = cursor
+
+    def _get_actions(self, endpoint):
+        return endpoint.get_dict().get("game", {}).get("actions", [])
+
+    def _get_endpoint(self, game_id):
+        return PlayByPlay(
+            game_id,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+            get_request=False,
+        )
+
+    def poll(self, game_id):
+        endpoint = self._get_endpoint(game_id)
+        endpoint.get_request()
+        return self.get_delta(game_id, self._get_actions(endpoint))
+
+    async def poll_async(self, game_id):
+        endpoint = self._get_endpoint(game_id)
+        await endpoint.get_request_async()
+        for action in self.get_delta(game_id, self._get_actions(endpoint)):
+            yield action
@@ -101,6 +101,16 @@ class ScoreBoard(Endpoint):
         )
         self.load_response()
 
+    async def get_request_async(self):
+        self.nba_response = await NBALiveHTTP().send_api_request_async(
+            endpoint=self.endpoint_url,
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
     def load_response(self):
         data_sets = self.nba_response.get_dict()
         if "scoreboard" in data_sets:
@@ -0,0 +1,102 @@
+import re
+
+# NBA periods; pass period_seconds=600 for WNBA games.
+PERIOD_SECONDS = 720.0
+OVERTIME_SECONDS = 300.0
+REGULATION_PERIODS = 4
+
+_CLOCK = re.compile(r"PT(\d+)M(\d+(?:\.\d+)?)S")
+# Live feeds repeat a bounded set of clock strings, so each one is parsed once.
+_remaining = {}
+_MAX_CACHED = 100_000
+
+
+def _parse_clock(game_clock):
+    # "PT02M31.40S" is by far the common shape; anything else goes to the regex.
+    if (
+        len(game_clock) == 11
+        and game_clock[:2] == "PT"
+        and game_clock[4] == "M"
+        and game_clock[10] == "S"
+    ):
+        try:
+            return int(game_clock[2:4]) * 60 + float(game_clock[5:10])
+        except ValueError:
+            pass
+    match = _CLOCK.fullmatch(game_clock)
+    if match is None:
+        return None
+    return int(match.group(1)) * 60 + float(match.group(2))
+
+
+def parse_clock(game_clock):
+    """
+    Returns the seconds left in the period for an ISO 8601 gameClock
+    ("PT02M31.40S" -> 151.4), or None for a blank or unrecognized clock.
+    """
+    if not isinstance(game_clock, str):
+        return None
+    try:
+        return _remaining[game_clock]
+    except KeyError:
+        remaining = _parse_clock(game_clock)
+        if len(_remaining) < _MAX_CACHED:
+            _remaining[game_clock] = remaining
+        return remaining
+
+
+def get_elapsed(
+    period,
+    game_clock,
+    period_seconds=PERIOD_SECONDS,
+    overtime_seconds=OVERTIME_SECONDS,
+    regulation_periods=REGULATION_PERIODS,
+):
+    """
+    Returns the game seconds elapsed at a period and gameClock, counting every
+    overtime as its own overtime_seconds period (Q4 0:00 is 2880.0, OT 4:00 is
+    2940.0 in the NBA). Returns None when the clock is blank or the period is
+    not started.
+    """
+    remaining = parse_clock(game_clock)
+    if remaining is None or not period:
+        return None
+    if period <= regulation_periods:
+        return period * period_seconds - remaining
+    return (
+        regulation_periods * period_seconds
+        + (period - regulation_periods) * overtime_seconds
+        - remaining
+    )
+
+
+def get_elapsed_many(
+    actions,
+    period_key="period",
+    clock_key="clock",
+    period_seconds=PERIOD_SECONDS,
+    overtime_seconds=OVERTIME_SECONDS,
+    regulation_periods=REGULATION_PERIODS,
+):
+    """
+    get_elapsed() over a sequence of dicts, e.g. the actions of a live
+    play-by-play (period_key="period", clock_key="clock") or the games of a
+    scoreboard (clock_key="gameClock"). Returns a list aligned with actions.
+    """
+    remaining = _remaining
+    regulation = regulation_periods * period_seconds
+    elapsed = []
+    append = elapsed.append
+    for action in actions:
+        period = action.get(period_key)
+        game_clock = action.get(clock_key)
+        left = remaining.get(game_clock) if isinstance(game_clock, str) else None
+        if left is None:
+            left = parse_clock(game_clock)
+        if left is None or not period:
+            append(None)
+        elif period <= regulation_periods:
+            append(period * period_seconds - left)
+        else:
+            append(regulation + (period - regulation_periods) * overtime_seconds - left)
+    return elapsed
@@ -0,0 +1,100 @@
+import json
+import re
+
+from typing import NamedTuple, Optional
+
+
+class GameState(NamedTuple):
+    """
+    The scoreboard-level state of a live game: status, period, clock and the
+    two team scores.
+    """
+
+    game_id: str
+    game_status: int
+    game_status_text: str
+    period: int
+    game_clock: str
+    home_team_id: Optional[int]
+    home_score: Optional[int]
+    away_team_id: Optional[int]
+    away_score: Optional[int]
+
+
+_EMPTY = {}
+
+
+def get_game_state(game):
+    """
+    Builds a GameState from a live game dict (the "game" of a boxscore, or one
+    of a scoreboard's "games"). Only the fields above are read; players,
+    officials and arena are never touched or copied.
+    """
+    home_team = game.get("homeTeam") or _EMPTY
+    away_team = game.get("awayTeam") or _EMPTY
+    return GameState(
+        game_id=game.get("gameId"),
+        game_status=game.get("gameStatus"),
+        game_status_text=game.get("gameStatusText"),
+        period=game.get("period"),
+        game_clock=game.get("gameClock"),
+        home_team_id=home_team.get("teamId"),
+        home_score=home_team.get("score"),
+        away_team_id=away_team.get("teamId"),
+        away_score=away_team.get("score"),
+    )
+
+
+_VALUE = rb'\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|null|true|false)'
+_GAME_FIELDS = {
+    name: re.compile(b'"' + name.encode() + b'"' + _VALUE)
+    for name in ("gameId", "gameStatus", "gameStatusText", "period", "gameClock")
+}
+_TEAM_FIELDS = {
+    name: re.compile(b'"' + name.encode() + b'"' + _VALUE) for name in ("teamId", "score")
+}
+
+
+def _find_team(content, start, end):
+    # Only accept fields at the top level of the team object: a match after a
+    # nested object or array (periods, players) could belong to either.
+    values = {}
+    for name, pattern in _TEAM_FIELDS.items():
+        match = pattern.search(content, start, end)
+        if (
+            match is None
+            or content.count(b"{", start, match.start()) != 1
+            or content.find(b"[", start, match.start()) != -1
+        ):
+            return None
+        values[name] = json.loads(match.group(1))
+    return values
+
+
+def parse_game_state(content):
+    """
+    Builds a GameState straight from the raw bytes of a live boxscore without
+    decoding the document, so the player arrays are never parsed. Returns None
+    when the layout is not the expected one (game fields ahead of the teams,
+    team id and score ahead of any nested data); callers then fall back to
+    get_game_state() on the decoded dict.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    home = content.find(b'"homeTeam"')
+    away = content.find(b'"awayTeam"')
+    if home == -1 or away == -1:
+        return None
+    game = {}
+    for name, pattern in _GAME_FIELDS.items():
+        match = pattern.search(content, 0, min(home, away))
+        if match is None:
+            return None
+        game[name] = json.loads(match.group(1))
+    home_team = _find_team(content, home, away if away > home else len(content))
+    away_team = _find_team(content, away, home if home > away else len(content))
+    if home_team is None or away_team is None:
+        return None
+    game["homeTeam"] = home_team
+    game["awayTeam"] = away_team
+    return get_game_state(game)
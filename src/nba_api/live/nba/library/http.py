@@ -14,13 +14,18 @@ except ImportError:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36",
     }
 
+ERROR_MESSAGE = b'{"Message":"An error has occurred."}'
+
 
 class NBALiveHTTP(http.NBAHTTP):
     nba_response = http.NBAResponse
     base_url = "https://cdn.nba.com/static/json/liveData/{endpoint}"
     headers = STATS_HEADERS
+    # cdn.nba.com serves ETag/Last-Modified; unchanged feeds come back as a bodyless 304.
+    conditional_requests = True
 
     def clean_contents(self, contents):
-        if '{"Message":"An error has occurred."}' in contents:
-            return "<Error><Message>An error has occurred.</Message></Error>"
+        # The error payload is the whole body, so only the head needs checking.
+        if ERROR_MESSAGE in contents[:256]:
+            return b"<Error><Message>An error has occurred.</Message></Error>"
         return contents
@@ -0,0 +1,253 @@
+import asyncio
+import threading
+import time
+
+from typing import NamedTuple, Optional
+
+from nba_api.library.bulk import fetch_many
+from nba_api.live.nba.endpoints.boxscore import BoxScore
+from nba_api.live.nba.endpoints.scoreboard import ScoreBoard
+from nba_api.live.nba.library.gamestate import GameState, get_game_state
+
+
+class GameUpdate(NamedTuple):
+    """
+    What a LiveGameHub subscriber receives. game is the game's dict (from the
+    scoreboard, or from a BoxScore for games missing from it); box_score is set
+    only when a BoxScore was fetched this tick; error is the exception of a
+    failed BoxScore fetch, delivered with the last known state and game.
+    """
+
+    state: Optional[GameState]
+    game: Optional[dict]
+    box_score: Optional[BoxScore] = None
+    error: Optional[Exception] = None
+
+
+def _wants_detail(detail, state):
+    return detail(state) if callable(detail) else detail
+
+
+def _notify(subscriber, update):
+    # Queues (queue.Queue, asyncio.Queue, ...) are fed with put_nowait; anything
+    # else is called.
+    put = getattr(subscriber, "put_nowait", None)
+    if put is None:
+        subscriber(update)
+    else:
+        put(update)
+
+
+class LiveGameHub:
+    """
+    Fans one todaysScoreboard request per tick out to the subscribers of every
+    game, so request volume follows ticks rather than games. A game's
+    subscribers are only notified when its GameState changed since the last
+    update they were sent, or when a BoxScore fetch failed.
+
+    A per-game BoxScore is fetched only for a changed game with a subscriber
+    registered with detail=True (or a detail(state) predicate returning True),
+    and for subscribed games that are not on today's scoreboard. A game off
+    the scoreboard is not fetched again once its BoxScore shows it final,
+    and is backed off exponentially while its BoxScore fetches fail.
+    """
+
+    # Seconds before refetching a game off the scoreboard whose BoxScore
+    # failed, doubled for every further failure up to max_miss_backoff.
+    miss_backoff = 30.0
+    max_miss_backoff = 600.0
+
+    def __init__(self, proxy=None, headers=None, timeout=30):
+        self.proxy = proxy
+        self.headers = headers
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._subscribers = {}
+        self._states = {}
+        self._games = {}
+        # Game ids off the scoreboard -> (failed fetches, time of next fetch).
+        self._misses = {}
+
+    def subscribe(self, game_id, subscriber, detail=False):
+        """
+        Registers a callable or a queue for a game's GameUpdates and returns it.
+        """
+        with self._lock:
+            self._subscribers.setdefault(game_id, {})[subscriber] = detail
+        return subscriber
+
+    def unsubscribe(self, game_id, subscriber=None):
+        """
+        Removes one subscriber of a game, or all of them when subscriber is None.
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(game_id)
+            if subscribers is None:
+                return
+            if subscriber is None:
+                subscribers.clear()
+            else:
+                subscribers.pop(subscriber, None)
+            if not subscribers:
+                del self._subscribers[game_id]
+                self._states.pop(game_id, None)
+                self._games.pop(game_id, None)
+                self._misses.pop(game_id, None)
+
+    def get_game_ids(self):
+        with self._lock:
+            return list(self._subscribers)
+
+    def get_state(self, game_id):
+        return self._states.get(game_id)
+
+    def get_game(self, game_id):
+        return self._games.get(game_id)
+
+    def _get_scoreboard(self):
+        return ScoreBoard(
+            proxy=self.proxy, headers=self.headers, timeout=self.timeout, get_request=False
+        )
+
+    def _get_box_score_kwargs(self, game_id):
+        return {
+            "game_id": game_id,
+            "proxy": self.proxy,
+            "headers": self.headers,
+            "timeout": self.timeout,
+        }
+
+    @staticmethod
+    def _get_games(scoreboard):
+        if scoreboard.games is None:
+            return {}
+        return {game["gameId"]: game for game in scoreboard.games.get_dict()}
+
+    def _get_fetches(self, subscribers, games, now):
+        # Game ids that need a BoxScore this tick.
+        with self._lock:
+            states = {game_id: self._states.get(game_id) for game_id in subscribers}
+            retry_at = {game_id: due for game_id, (_, due) in self._misses.items()}
+        fetches = []
+        for game_id, details in subscribers.items():
+            game = games.get(game_id)
+            if game is None:
+                # Off the scoreboard, a final game no longer changes and a
+                # failing one waits out its backoff.
+                final = states[game_id] is not None and states[game_id].game_status == 3
+                if not final and now >= retry_at.get(game_id, now):
+                    fetches.append(game_id)
+                continue
+            state = get_game_state(game)
+            if state != states[game_id] and any(
+                _wants_detail(detail, state) for detail in details.values()
+            ):
+                fetches.append(game_id)
+        return fetches
+
+    def _record_misses(self, games, box_scores, now):
+        # Backs off games off the scoreboard whose BoxScore fetch failed.
+        with self._lock:
+            for game_id in games:
+                self._misses.pop(game_id, None)
+            for game_id, (_, error) in box_scores.items():
+                if game_id in games or game_id not in self._subscribers:
+                    continue
+                if error is None:
+                    self._misses.pop(game_id, None)
+                    continue
+                failures = self._misses.get(game_id, (0, now))[0] + 1
+                backoff = min(
+                    self.max_miss_backoff, self.miss_backoff * 2 ** (failures - 1)
+                )
+                self._misses[game_id] = (failures, now + backoff)
+
+    def _publish(self, subscribers, games, box_scores):
+        # box_scores maps game ids to (box_score, error).
+        updates = []
+        for game_id, details in subscribers.items():
+            box_score, error = box_scores.get(game_id, (None, None))
+            game = games.get(game_id)
+            if game is None and box_score is not None and box_score.game is not None:
+                game = box_score.game.get_dict()
+            if game is None:
+                if error is None:
+                    continue
+                with self._lock:
+                    update = GameUpdate(
+                        self._states.get(game_id), self._games.get(game_id), None, error
+                    )
+            else:
+                state = get_game_state(game)
+                with self._lock:
+                    if state == self._states.get(game_id) and error is None:
+                        continue
+                    # A game unsubscribed during the tick is not tracked again.
+                    if game_id in self._subscribers:
+                        self._states[game_id] = state
+                        self._games[game_id] = game
+                update = GameUpdate(state, game, box_score, error)
+            for subscriber in details:
+                _notify(subscriber, update)
+            updates.append((game_id, update))
+        return updates
+
+    def _get_subscribers(self, game_ids=None):
+        with self._lock:
+            return {
+                game_id: dict(details)
+                for game_id, details in self._subscribers.items()
+                if game_ids is None or game_id in game_ids
+            }
+
+    def tick(self, game_ids=None, now=None):
+        """
+        Polls the scoreboard (and any BoxScores needed) once, notifies the
+        subscribers of changed games and returns their (game_id, GameUpdate)
+        pairs. game_ids limits the tick to some of the subscribed games, e.g.
+        the ones a PollScheduler says are due. Errors fetching the scoreboard
+        itself are raised. now is a time.monotonic() value.
+        """
+        now = time.monotonic() if now is None else now
+        subscribers = self._get_subscribers(game_ids)
+        scoreboard = self._get_scoreboard()
+        scoreboard.get_request()
+        games = self._get_games(scoreboard)
+        fetches = self._get_fetches(subscribers, games, now)
+        box_scores = {}
+        if fetches:
+            for result in fetch_many(
+                BoxScore, [self._get_box_score_kwargs(game_id) for game_id in fetches]
+            ):
+                box_scores[fetches[result.index]] = (result.endpoint, result.error)
+        self._record_misses(games, box_scores, now)
+        return self._publish(subscribers, games, box_scores)
+
+    async def tick_async(self, game_ids=None, now=None):
+        """
+        Awaitable tick(); the BoxScores needed are fetched concurrently.
+        """
+        now = time.monotonic() if now is None else now
+        subscribers = self._get_subscribers(game_ids)
+        scoreboard = self._get_scoreboard()
+        await scoreboard.get_request_async()
+        games = self._get_games(scoreboard)
+        fetches = self._get_fetches(subscribers, games, now)
+        results = await asyncio.gather(
+            *[
+                BoxScore.create_async(**self._get_box_score_kwargs(game_id))
+                for game_id in fetches
+            ],
+            return_exceptions=True,
+        )
+        box_scores = {}
+        for game_id, result in zip(fetches, results):
+            # CancelledError is a BaseException, not an Exception, since 3.8.
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                box_scores[game_id] = (None, result)
+            else:
+                box_scores[game_id] = (result, None)
+        self._record_misses(games, box_scores, now)
+        return self._publish(subscribers, games, box_scores)
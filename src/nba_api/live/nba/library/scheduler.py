@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+
+from datetime import datetime
+
+from nba_api.library.ratelimit import TokenBucket
+from nba_api.live.nba.library.clock import parse_clock
+
+
+def _get_start_time(game):
+    # gameTimeUTC ("2021-01-16T00:30:00Z") as a POSIX timestamp, or None.
+    value = (game or {}).get("gameTimeUTC")
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class PollScheduler:
+    """
+    Decides when each live game is polled next from its GameState, backs a
+    game off exponentially while its polls fail, and shares one
+    requests-per-second budget (rate, burst) across all games.
+
+    Times are time.time() values, since pre-game countdowns are measured
+    against the game's gameTimeUTC.
+    """
+
+    # Seconds between polls in each phase of a game.
+    pregame_min = 15.0
+    pregame_max = 300.0
+    first_half = 30.0
+    halftime = 60.0
+    period_break = 30.0
+    stoppage = 10.0
+    # How often cdn.nba.com refreshes a live feed: a clock unchanged for
+    # longer than this is a stoppage, not a feed that has not updated yet.
+    feed_refresh = 5.0
+    second_half = 5.0
+    clutch = 1.0
+    # A game is "clutch" in the last clutch_seconds of the 4th period or
+    # overtime with the margin at most clutch_margin points.
+    clutch_seconds = 300.0
+    clutch_margin = 10
+
+    def __init__(self, rate=None, burst=1, backoff_factor=2.0, max_backoff=300.0, jitter=True):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._due = {}
+        self._errors = {}
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get_interval(self, state, game=None, stopped_for=0.0, now=None):
+        """
+        Returns the seconds until a game should be polled again, or None once it
+        is final. stopped_for is how long the live clock has not moved; past
+        feed_refresh it is a stoppage (timeout, review, free throws), which
+        never polls faster than the phase would, except in clutch time.
+        """
+        if state is None:
+            return self.pregame_min
+        if state.game_status == 3:
+            return None
+        if state.game_status != 2:
+            start = _get_start_time(game)
+            if start is None:
+                return self.pregame_max
+            now = time.time() if now is None else now
+            return min(self.pregame_max, max(self.pregame_min, (start - now) / 2))
+
+        clock = parse_clock(state.game_clock)
+        status_text = state.game_status_text or ""
+        if "Half" in status_text or (state.period == 2 and not clock):
+            return self.halftime
+        if not clock:
+            return self.period_break
+        if (
+            state.period >= 4
+            and clock <= self.clutch_seconds
+            and abs((state.home_score or 0) - (state.away_score or 0)) <= self.clutch_margin
+        ):
+            return self.clutch
+        interval = self.first_half if state.period <= 2 else self.second_half
+        if stopped_for > self.feed_refresh:
+            return max(self.stoppage, interval)
+        return interval
+
+    def get_backoff(self, errors):
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** (errors - 1)))
+        if self.jitter:
+            # Keep at least half the backoff so failing games never spin.
+            backoff = random.uniform(backoff / 2, backoff)
+        return backoff
+
+    def update(self, game_id, state, game=None, now=None):
+        """
+        Records a successful poll and schedules the game's next one. Returns the
+        interval, or None when the game is final and has been removed.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            # _states keeps the state and when its clock was first seen.
+            previous, clock_since = self._states.get(game_id, (None, now))
+            if (
+                previous is None
+                or state is None
+                or previous.period != state.period
+                or previous.game_clock != state.game_clock
+            ):
+                clock_since = now
+            interval = self.get_interval(state, game, now - clock_since, now)
+            self._errors.pop(game_id, None)
+            if interval is None:
+                self._due.pop(game_id, None)
+                self._states.pop(game_id, None)
+            else:
+                self._due[game_id] = now + interval
+                self._states[game_id] = (state, clock_since)
+        return interval
+
+    def record_error(self, game_id, now=None):
+        """
+        Records a failed poll and returns the backoff before the game's next one.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            errors = self._errors[game_id] = self._errors.get(game_id, 0) + 1
+            backoff = self.get_backoff(errors)
+            self._due[game_id] = now + backoff
+        return backoff
+
+    def add(self, game_id, now=None):
+        """
+        Schedules a game that has not been polled yet to be polled right away.
+        """
+        with self._lock:
+            self._due.setdefault(game_id, time.time() if now is None else now)
+
+    def remove(self, game_id):
+        with self._lock:
+            self._due.pop(game_id, None)
+            self._errors.pop(game_id, None)
+            self._states.pop(game_id, None)
+
+    def get_errors(self, game_id):
+        return self._errors.get(game_id, 0)
+
+    def get_due(self, now=None):
+        """
+        Returns the ids of the games whose next poll is due.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            return [game_id for game_id, due in self._due.items() if due <= now]
+
+    def get_delay(self, now=None):
+        """
+        Returns the seconds until the next game is due (0 if one already is), or
+        None when no game is scheduled.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            if not self._due:
+                return None
+            return max(0.0, min(self._due.values()) - now)
+
+    def reserve(self, requests=1):
+        """
+        Takes requests tokens from the shared budget and returns the seconds to
+        wait before sending them (always 0 without a rate).
+        """
+        if self.bucket is None:
+            return 0.0
+        delay = 0.0
+        for _ in range(requests):
+            delay = self.bucket.reserve()
+        return delay
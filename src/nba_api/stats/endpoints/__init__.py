@@ -1,3 +1,5 @@
+import importlib
+
 __all__ = [
     "alltimeleadersgrids",
     "assistleaders",
@@ -135,137 +137,159 @@ __all__ = [
     "winprobabilitypbp",
 ]
 
-from .alltimeleadersgrids import AllTimeLeadersGrids
-from .assistleaders import AssistLeaders
-from .assisttracker import AssistTracker
-from .boxscoreadvancedv2 import BoxScoreAdvancedV2
-from .boxscoreadvancedv3 import BoxScoreAdvancedV3
-from .boxscoredefensivev2 import BoxScoreDefensiveV2
-from .boxscorefourfactorsv2 import BoxScoreFourFactorsV2
-from .boxscorefourfactorsv3 import BoxScoreFourFactorsV3
-from .boxscorehustlev2 import BoxScoreHustleV2
-from .boxscorematchupsv3 import BoxScoreMatchupsV3
-from .boxscoremiscv2 import BoxScoreMiscV2
-from .boxscoremiscv3 import BoxScoreMiscV3
-from .boxscoreplayertrackv2 import BoxScorePlayerTrackV2
-from .boxscoreplayertrackv3 import BoxScorePlayerTrackV3
-from .boxscorescoringv2 import BoxScoreScoringV2
-from .boxscorescoringv3 import BoxScoreScoringV3
-from .boxscoresummaryv2 import BoxScoreSummaryV2
-from .boxscoretraditionalv2 import BoxScoreTraditionalV2
-from .boxscoretraditionalv3 import BoxScoreTraditionalV3
-from .boxscoreusagev2 import BoxScoreUsageV2
-from .boxscoreusagev3 import BoxScoreUsageV3
-from .commonallplayers import CommonAllPlayers
-from .commonplayerinfo import CommonPlayerInfo
-from .commonplayoffseries import CommonPlayoffSeries
-from .commonteamroster import CommonTeamRoster
-from .commonteamyears import CommonTeamYears
-from .cumestatsplayer import CumeStatsPlayer
-from .cumestatsplayergames import CumeStatsPlayerGames
-from .cumestatsteam import CumeStatsTeam
-from .cumestatsteamgames import CumeStatsTeamGames
-from .defensehub import DefenseHub
-from .draftboard import DraftBoard
-from .draftcombinedrillresults import DraftCombineDrillResults
-from .draftcombinenonstationaryshooting import DraftCombineNonStationaryShooting
-from .draftcombineplayeranthro import DraftCombinePlayerAnthro
-from .draftcombinespotshooting import DraftCombineSpotShooting
-from .draftcombinestats import DraftCombineStats
-from .drafthistory import DraftHistory
-from .fantasywidget import FantasyWidget
-from .franchisehistory import FranchiseHistory
-from .franchiseleaders import FranchiseLeaders
-from .franchiseplayers import FranchisePlayers
-from .gamerotation import GameRotation
-from .glalumboxscoresimilarityscore import GLAlumBoxScoreSimilarityScore
-from .homepageleaders import HomePageLeaders
-from .homepagev2 import HomePageV2
-from .hustlestatsboxscore import HustleStatsBoxScore
-from .iststandings import ISTStandings
-from .infographicfanduelplayer import InfographicFanDuelPlayer
-from .leaderstiles import LeadersTiles
-from .leaguedashlineups import LeagueDashLineups
-from .leaguedashplayerbiostats import LeagueDashPlayerBioStats
-from .leaguedashplayerclutch import LeagueDashPlayerClutch
-from .leaguedashoppptshot import LeagueDashOppPtShot
-from .leaguedashplayerptshot import LeagueDashPlayerPtShot
-from .leaguedashplayershotlocations import LeagueDashPlayerShotLocations
-from .leaguedashplayerstats import LeagueDashPlayerStats
-from .leaguedashptdefend import LeagueDashPtDefend
-from .leaguedashptstats import LeagueDashPtStats
-from .leaguedashptteamdefend import LeagueDashPtTeamDefend
-from .leaguedashteamclutch import LeagueDashTeamClutch
-from .leaguedashteamptshot import LeagueDashTeamPtShot
-from .leaguedashteamshotlocations import LeagueDashTeamShotLocations
-from .leaguedashteamstats import LeagueDashTeamStats
-from .leaguehustlestatsplayer import LeagueHustleStatsPlayer
-from .leaguehustlestatsteam import LeagueHustleStatsTeam
-from .leaguegamefinder import LeagueGameFinder
-from .leaguegamelog import LeagueGameLog
-from .leagueleaders import LeagueLeaders
-from .leaguelineupviz import LeagueLineupViz
-from .leagueplayerondetails import LeaguePlayerOnDetails
-from .leagueseasonmatchups import LeagueSeasonMatchups
-from .leaguestandings import LeagueStandings
-from .leaguestandingsv3 import LeagueStandingsV3
-from .matchupsrollup import MatchupsRollup
-from .playbyplay import PlayByPlay
-from .playbyplayv2 import PlayByPlayV2
-from .playbyplayv3 import PlayByPlayV3
-from .playerawards import PlayerAwards
-from .playercareerbycollege import PlayerCareerByCollege
-from .playercareerbycollegerollup import PlayerCareerByCollegeRollup
-from .playercareerstats import PlayerCareerStats
-from .playercompare import PlayerCompare
-from .playerdashptpass import PlayerDashPtPass
-from .playerdashptreb import PlayerDashPtReb
-from .playerdashptshotdefend import PlayerDashPtShotDefend
-from .playerdashptshots import PlayerDashPtShots
-from .playerdashboardbyclutch import PlayerDashboardByClutch
-from .playerdashboardbygamesplits import PlayerDashboardByGameSplits
-from .playerdashboardbygeneralsplits import PlayerDashboardByGeneralSplits
-from .playerdashboardbylastngames import PlayerDashboardByLastNGames
-from .playerdashboardbyshootingsplits import PlayerDashboardByShootingSplits
-from .playerdashboardbyteamperformance import PlayerDashboardByTeamPerformance
-from .playerdashboardbyyearoveryear import PlayerDashboardByYearOverYear
-from .playerestimatedmetrics import PlayerEstimatedMetrics
-from .playerfantasyprofile import PlayerFantasyProfile
-from .playerfantasyprofilebargraph import PlayerFantasyProfileBarGraph
-from .playergamelog import PlayerGameLog
-from .playergamelogs import PlayerGameLogs
-from .playergamestreakfinder import PlayerGameStreakFinder
-from .playerindex import PlayerIndex
-from .playernextngames import PlayerNextNGames
-from .playerprofilev2 import PlayerProfileV2
-from .playervsplayer import PlayerVsPlayer
-from .playoffpicture import PlayoffPicture
-from .scoreboardv2 import ScoreboardV2
-from .shotchartdetail import ShotChartDetail
-from .shotchartleaguewide import ShotChartLeagueWide
-from .shotchartlineupdetail import ShotChartLineupDetail
-from .synergyplaytypes import SynergyPlayTypes
-from .teamandplayersvsplayers import TeamAndPlayersVsPlayers
-from .teamdashlineups import TeamDashLineups
-from .teamdashptpass import TeamDashPtPass
-from .teamdashptreb import TeamDashPtReb
-from .teamdashptshots import TeamDashPtShots
-from .teamdashboardbygeneralsplits import TeamDashboardByGeneralSplits
-from .teamdashboardbyshootingsplits import TeamDashboardByShootingSplits
-from .teamdetails import TeamDetails
-from .teamestimatedmetrics import TeamEstimatedMetrics
-from .teamgamelog import TeamGameLog
-from .teamgamelogs import TeamGameLogs
-from .teamgamestreakfinder import TeamGameStreakFinder
-from .teamhistoricalleaders import TeamHistoricalLeaders
-from .teaminfocommon import TeamInfoCommon
-from .teamplayerdashboard import TeamPlayerDashboard
-from .teamplayeronoffdetails import TeamPlayerOnOffDetails
-from .teamplayeronoffsummary import TeamPlayerOnOffSummary
-from .teamvsplayer import TeamVsPlayer
-from .teamyearbyyearstats import TeamYearByYearStats
-from .videodetails import VideoDetails
-from .videodetailsasset import VideoDetailsAsset
-from .videoevents import VideoEvents
-from .videostatus import VideoStatus
-from .winprobabilitypbp import WinProbabilityPBP
+# Endpoint class -> module. Modules are imported on first attribute access
+# (PEP 562) so importing one endpoint does not load all of them.
+_ENDPOINTS = {
+    "AllTimeLeadersGrids": "alltimeleadersgrids",
+    "AssistLeaders": "assistleaders",
+    "AssistTracker": "assisttracker",
+    "BoxScoreAdvancedV2": "boxscoreadvancedv2",
+    "BoxScoreAdvancedV3": "boxscoreadvancedv3",
+    "BoxScoreDefensiveV2": "boxscoredefensivev2",
+    "BoxScoreFourFactorsV2": "boxscorefourfactorsv2",
+    "BoxScoreFourFactorsV3": "boxscorefourfactorsv3",
+    "BoxScoreHustleV2": "boxscorehustlev2",
+    "BoxScoreMatchupsV3": "boxscorematchupsv3",
+    "BoxScoreMiscV2": "boxscoremiscv2",
+    "BoxScoreMiscV3": "boxscoremiscv3",
+    "BoxScorePlayerTrackV2": "boxscoreplayertrackv2",
+    "BoxScorePlayerTrackV3": "boxscoreplayertrackv3",
+    "BoxScoreScoringV2": "boxscorescoringv2",
+    "BoxScoreScoringV3": "boxscorescoringv3",
+    "BoxScoreSummaryV2": "boxscoresummaryv2",
+    "BoxScoreTraditionalV2": "boxscoretraditionalv2",
+    "BoxScoreTraditionalV3": "boxscoretraditionalv3",
+    "BoxScoreUsageV2": "boxscoreusagev2",
+    "BoxScoreUsageV3": "boxscoreusagev3",
+    "CommonAllPlayers": "commonallplayers",
+    "CommonPlayerInfo": "commonplayerinfo",
+    "CommonPlayoffSeries": "commonplayoffseries",
+    "CommonTeamRoster": "commonteamroster",
+    "CommonTeamYears": "commonteamyears",
+    "CumeStatsPlayer": "cumestatsplayer",
+    "CumeStatsPlayerGames": "cumestatsplayergames",
+    "CumeStatsTeam": "cumestatsteam",
+    "CumeStatsTeamGames": "cumestatsteamgames",
+    "DefenseHub": "defensehub",
+    "DraftBoard": "draftboard",
+    "DraftCombineDrillResults": "draftcombinedrillresults",
+    "DraftCombineNonStationaryShooting": "draftcombinenonstationaryshooting",
+    "DraftCombinePlayerAnthro": "draftcombineplayeranthro",
+    "DraftCombineSpotShooting": "draftcombinespotshooting",
+    "DraftCombineStats": "draftcombinestats",
+    "DraftHistory": "drafthistory",
+    "FantasyWidget": "fantasywidget",
+    "FranchiseHistory": "franchisehistory",
+    "FranchiseLeaders": "franchiseleaders",
+    "FranchisePlayers": "franchiseplayers",
+    "GameRotation": "gamerotation",
+    "GLAlumBoxScoreSimilarityScore": "glalumboxscoresimilarityscore",
+    "HomePageLeaders": "homepageleaders",
+    "HomePageV2": "homepagev2",
+    "HustleStatsBoxScore": "hustlestatsboxscore",
+    "ISTStandings": "iststandings",
+    "InfographicFanDuelPlayer": "infographicfanduelplayer",
+    "LeadersTiles": "leaderstiles",
+    "LeagueDashLineups": "leaguedashlineups",
+    "LeagueDashPlayerBioStats": "leaguedashplayerbiostats",
+    "LeagueDashPlayerClutch": "leaguedashplayerclutch",
+    "LeagueDashOppPtShot": "leaguedashoppptshot",
+    "LeagueDashPlayerPtShot": "leaguedashplayerptshot",
+    "LeagueDashPlayerShotLocations": "leaguedashplayershotlocations",
+    "LeagueDashPlayerStats": "leaguedashplayerstats",
+    "LeagueDashPtDefend": "leaguedashptdefend",
+    "LeagueDashPtStats": "leaguedashptstats",
+    "LeagueDashPtTeamDefend": "leaguedashptteamdefend",
+    "LeagueDashTeamClutch": "leaguedashteamclutch",
+    "LeagueDashTeamPtShot": "leaguedashteamptshot",
+    "LeagueDashTeamShotLocations": "leaguedashteamshotlocations",
+    "LeagueDashTeamStats": "leaguedashteamstats",
+    "LeagueHustleStatsPlayer": "leaguehustlestatsplayer",
+    "LeagueHustleStatsTeam": "leaguehustlestatsteam",
+    "LeagueGameFinder": "leaguegamefinder",
+    "LeagueGameLog": "leaguegamelog",
+    "LeagueLeaders": "leagueleaders",
+    "LeagueLineupViz": "leaguelineupviz",
+    "LeaguePlayerOnDetails": "leagueplayerondetails",
+    "LeagueSeasonMatchups": "leagueseasonmatchups",
+    "LeagueStandings": "leaguestandings",
+    "LeagueStandingsV3": "leaguestandingsv3",
+    "MatchupsRollup": "matchupsrollup",
+    "PlayByPlay": "playbyplay",
+    "PlayByPlayV2": "playbyplayv2",
+    "PlayByPlayV3": "playbyplayv3",
+    "PlayerAwards": "playerawards",
+    "PlayerCareerByCollege": "playercareerbycollege",
+    "PlayerCareerByCollegeRollup": "playercareerbycollegerollup",
+    "PlayerCareerStats": "playercareerstats",
+    "PlayerCompare": "playercompare",
+    "PlayerDashPtPass": "playerdashptpass",
+    "PlayerDashPtReb": "playerdashptreb",
+    "PlayerDashPtShotDefend": "playerdashptshotdefend",
+    "PlayerDashPtShots": "playerdashptshots",
+    "PlayerDashboardByClutch": "playerdashboardbyclutch",
+    "PlayerDashboardByGameSplits": "playerdashboardbygamesplits",
+    "PlayerDashboardByGeneralSplits": "playerdashboardbygeneralsplits",
+    "PlayerDashboardByLastNGames": "playerdashboardbylastngames",
+    "PlayerDashboardByShootingSplits": "playerdashboardbyshootingsplits",
+    "PlayerDashboardByTeamPerformance": "playerdashboardbyteamperformance",
+    "PlayerDashboardByYearOverYear": "playerdashboardbyyearoveryear",
+    "PlayerEstimatedMetrics": "playerestimatedmetrics",
+    "PlayerFantasyProfile": "playerfantasyprofile",
+    "PlayerFantasyProfileBarGraph": "playerfantasyprofilebargraph",
+    "PlayerGameLog": "playergamelog",
+    "PlayerGameLogs": "playergamelogs",
+    "PlayerGameStreakFinder": "playergamestreakfinder",
+    "PlayerIndex": "playerindex",
+    "PlayerNextNGames": "playernextngames",
+    "PlayerProfileV2": "playerprofilev2",
+    "PlayerVsPlayer": "playervsplayer",
+    "PlayoffPicture": "playoffpicture",
+    "ScoreboardV2": "scoreboardv2",
+    "ShotChartDetail": "shotchartdetail",
+    "ShotChartLeagueWide": "shotchartleaguewide",
+    "ShotChartLineupDetail": "shotchartlineupdetail",
+    "SynergyPlayTypes": "synergyplaytypes",
+    "TeamAndPlayersVsPlayers": "teamandplayersvsplayers",
+    "TeamDashLineups": "teamdashlineups",
+    "TeamDashPtPass": "teamdashptpass",
+    "TeamDashPtReb": "teamdashptreb",
+    "TeamDashPtShots": "teamdashptshots",
+    "TeamDashboardByGeneralSplits": "teamdashboardbygeneralsplits",
+    "TeamDashboardByShootingSplits": "teamdashboardbyshootingsplits",
+    "TeamDetails": "teamdetails",
+    "TeamEstimatedMetrics": "teamestimatedmetrics",
+    "TeamGameLog": "teamgamelog",
+    "TeamGameLogs": "teamgamelogs",
+    "TeamGameStreakFinder": "teamgamestreakfinder",
+    "TeamHistoricalLeaders": "teamhistoricalleaders",
+    "TeamInfoCommon": "teaminfocommon",
+    "TeamPlayerDashboard": "teamplayerdashboard",
+    "TeamPlayerOnOffDetails": "teamplayeronoffdetails",
+    "TeamPlayerOnOffSummary": "teamplayeronoffsummary",
+    "TeamVsPlayer": "teamvsplayer",
+    "TeamYearByYearStats": "teamyearbyyearstats",
+    "VideoDetails": "videodetails",
+    "VideoDetailsAsset": "videodetailsasset",
+    "VideoEvents": "videoevents",
+    "VideoStatus": "videostatus",
+    "WinProbabilityPBP": "winprobabilitypbp",
+}
+
+
+def __getattr__(name):
+    module_name = _ENDPOINTS.get(name)
+    if module_name is None:
+        if name not in __all__:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+        # importing a submodule binds it as a package attribute
+        return importlib.import_module("." + name, __name__)
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_ENDPOINTS))
@@ -1,21 +1,52 @@
+import os
+import glob
 import json
+import importlib.util
 import numpy as np
 
-try:
-    from pandas import DataFrame, MultiIndex
+from nba_api.stats.library import arrow, schema
+from nba_api.stats.library.columns import get_unique_names, to_columns, transpose
+from nba_api.stats.library.http import PARSER_DICT, NBAStatsHTTP
 
-    PANDAS = True
-except ImportError:
-    PANDAS = False
+# pandas is imported by the first data frame or multi-level header; it
+# dominates the import time of every endpoint otherwise.
+PANDAS = importlib.util.find_spec("pandas") is not None
+pandas = None
+
+
+def _import_pandas():
+    global pandas
+    if not PANDAS:
+        raise Exception("Import Missing - Failed to import DataFrame from pandas.")
+    if pandas is None:
+        pandas = importlib.import_module("pandas")
+    return pandas
 
 
 class Endpoint:
     class DataSet:
         key = None
-        data = {}
+        endpoint = None
+        _data = {}
+        _columns = None
+        # Set for data sets loaded from Arrow/Parquet, which keep their columns
+        # and only build the {"headers", "data"} dict when it is asked for.
+        _table = None
 
-        def __init__(self, data):
+        def __init__(self, data, endpoint=None, key=None):
             self.data = data
+            self.endpoint = endpoint
+            self.key = key
+
+        @property
+        def data(self):
+            if self._data is None:
+                self._data = arrow.from_table(self._table)
+            return self._data
+
+        @data.setter
+        def data(self, data):
+            self._data = data
 
         def get_json(self):
             return json.dumps(self.data)
@@ -23,44 +54,243 @@ class Endpoint:
         def get_dict(self):
             return self.data
 
-        def get_data_frame(self):
-            if not PANDAS:
-                raise Exception(
-                    "Import Missing - Failed to import DataFrame from pandas."
+        def get_column_names(self):
+            if self._table is not None:
+                return list(self._table.column_names)
+            headers = self.data.get("headers") or []
+            if not headers or isinstance(headers[0], str):
+                return list(headers)
+
+            # Multiple levels of column names
+            levels = []
+            level_names = []
+            for i in range(len(headers)):
+                # Extend column names for level to full length
+                level = headers[i]
+                level_names.append(level["name"] if "name" in level else "LEVEL_" + str(i))
+                column_names = (
+                    [""] * level["columnsToSkip"] if "columnsToSkip" in level else []
                 )
+                column_names += list(
+                    np.repeat(
+                        np.array(level["columnNames"]),
+                        level["columnSpan"] if "columnSpan" in level else 1,
+                    )
+                )
+                levels.append(column_names)
+            if not PANDAS:
+                return list(zip(*levels))
+            return _import_pandas().MultiIndex.from_arrays(levels, names=level_names)
+
+        def get_columns(self):
+            """
+            Returns the data set as one typed NumPy array per column, keyed by
+            column name (a tuple of level names for multi-level headers).
+            Repeated headers are suffixed by occurrence ("PTS", "PTS_1"). The
+            arrays are built once and shared with get_data_frame().
+            """
+            if self._columns is None and self._table is not None:
+                self._columns = {
+                    name: arrow.to_numpy(column)
+                    for name, column in zip(self._table.column_names, self._table.columns)
+                }
+            if self._columns is None:
+                names = self.get_column_names()
+                arrays = to_columns(names, self.data.get("data") or [])
+                if arrays is None:
+                    raise ValueError("Row lengths do not match the data set headers.")
+                self._columns = dict(zip(get_unique_names(list(names)), arrays))
+            return self._columns
+
+        def get_schema(self, parameters=None):
+            """
+            Returns {column: dtype} from the schema registry for this data set;
+            parameters are those of the request it came from.
+            """
+            return schema.registry.get_schema(
+                self.endpoint, self.key, self.get_column_names(), parameters
+            )
 
-            if "headers" not in self.data or not self.data["headers"]:
+        def get_data_frame(self, typed=False):
+            """
+            Builds a DataFrame from the column arrays, with the dtypes pandas
+            infers. Pass typed=True to opt in to the compact dtypes of
+            get_schema() (string IDs, categorical tricodes, small integer
+            counts).
+            """
+            DataFrame = _import_pandas().DataFrame
+
+            names = self.get_column_names()
+            if not len(names):
                 return DataFrame()
 
-            if isinstance(self.data['headers'][0], str):
-                return DataFrame(self.data["data"], columns=self.data["headers"])
-
-            else:  # Multiple levels of column names
-                levels = []
-                level_names = []
-                for i in range(
-                    len(self.data["headers"])
-                ):  # Extend column names for level to full length
-                    level = self.data["headers"][i]
-                    level_names.append(
-                        level["name"] if "name" in level else "LEVEL_" + str(i)
-                    )
-                    column_names = (
-                        [""] * level["columnsToSkip"]
-                        if "columnsToSkip" in level
-                        else []
-                    )
-                    column_names += list(
-                        np.repeat(
-                            np.array(level["columnNames"]),
-                            level["columnSpan"] if "columnSpan" in level else 1,
-                        )
+            if len(set(names)) == len(names):
+                try:
+                    columns = self.get_columns()
+                except ValueError:
+                    columns = None
+                if columns is not None:
+                    if typed and isinstance(names, list):
+                        dtypes = self.get_schema()
+                        columns = {
+                            name: schema.apply_dtype(name, values, dtypes[name])
+                            if name in dtypes
+                            else values
+                            for name, values in columns.items()
+                        }
+                    # Built from the column arrays without copying them.
+                    frame = DataFrame(columns, copy=False)
+                    frame.columns = names
+                    return frame
+
+            # Duplicate or misaligned columns cannot be keyed by name.
+            return DataFrame(self.data["data"], columns=names)
+
+        def get_arrow_table(self, metadata=None, parameters=None):
+            """
+            Builds an Arrow table typed from get_schema(parameters), so a data
+            set's schema is the same whichever values or nulls a response has.
+            Repeated headers are suffixed as in get_columns().
+            """
+            if self._table is not None:
+                if metadata is None:
+                    return self._table
+                return self._table.replace_schema_metadata(metadata)
+            names = list(self.get_column_names())
+            values = transpose(names, self.data.get("data") or [])
+            if values is None:
+                raise ValueError("Row lengths do not match the data set headers.")
+            dtypes = {}
+            if all(isinstance(name, str) for name in names):
+                dtypes = self.get_schema(parameters)
+            unique_names = get_unique_names(names)
+            return arrow.to_table(
+                dict(zip(unique_names, values)),
+                metadata=metadata,
+                dtypes={unique: dtypes.get(name) for unique, name in zip(unique_names, names)},
+            )
+
+        def to_parquet(self, path, compression="zstd"):
+            arrow.write_parquet(self.get_arrow_table(), path, compression=compression)
+
+        @classmethod
+        def from_arrow_table(cls, table, endpoint=None, key=None):
+            """
+            Wraps an Arrow table without converting it: get_columns() and
+            get_data_frame() read its columns, and the rows of get_dict() are
+            only built when it is called.
+            """
+            data_set = cls(data=None, endpoint=endpoint, key=key)
+            data_set._table = table
+            return data_set
+
+        @classmethod
+        def from_parquet(cls, path, memory_map=True):
+            return cls.from_arrow_table(arrow.read_parquet(path, memory_map=memory_map))
+
+    class DataSets:
+        """
+        The data sets of a response, in response order. Iterating and integer
+        indexing behave like the list this replaces; indexing by result set
+        name works like a mapping. Nothing is extracted from the response until
+        first access, and each DataSet is built only when it is asked for.
+        """
+
+        def __init__(self, nba_response=None, endpoint=None, data_sets=None):
+            self._nba_response = nba_response
+            self.endpoint = endpoint
+            self._raw = None
+            self._data_sets = dict(data_sets or {})
+            if data_sets is not None:
+                self._raw = {name: ds.data for name, ds in data_sets.items()}
+                for name, data_set in self._data_sets.items():
+                    data_set.endpoint, data_set.key = endpoint, name
+
+        def _get_raw(self):
+            if self._raw is None:
+                if self.endpoint in PARSER_DICT:
+                    self._raw = self._nba_response.get_data_sets(self.endpoint)
+                else:
+                    self._raw = self._nba_response.get_data_sets()
+                self._nba_response = None
+            return self._raw
+
+        def keys(self):
+            return list(self._get_raw())
+
+        def values(self):
+            return [self[name] for name in self._get_raw()]
+
+        def items(self):
+            return [(name, self[name]) for name in self._get_raw()]
+
+        def get(self, name, default=None):
+            if name not in self._get_raw():
+                return default
+            return self[name]
+
+        def __getitem__(self, key):
+            if isinstance(key, slice):
+                return [self[name] for name in self.keys()[key]]
+            if isinstance(key, int):
+                key = self.keys()[key]
+            data_set = self._data_sets.get(key)
+            if data_set is None:
+                data_set = Endpoint.DataSet(
+                    data=self._get_raw()[key], endpoint=self.endpoint, key=key
+                )
+                self._data_sets[key] = data_set
+            return data_set
+
+        def __contains__(self, name):
+            return name in self._get_raw()
+
+        def __iter__(self):
+            return iter(self.values())
+
+        def __len__(self):
+            return len(self._get_raw())
+
+    class DataSetProperty:
+        """
+        Class-level accessor for one named data set, built on first access.
+        """
+
+        def __init__(self, name):
+            self.name = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            data_sets = instance.data_sets
+            if data_sets is None:
+                raise AttributeError(
+                    "{} has no data sets until a response is loaded.".format(
+                        type(instance).__name__
                     )
-                    levels.append(column_names)
-                midx = MultiIndex.from_arrays(
-                    levels, names=level_names
-                )  # Use MultiIndex for dataframe columns
-                return DataFrame(self.data["data"], columns=midx)
+                )
+            return data_sets[self.name]
+
+    @classmethod
+    async def create_async(cls, *args, **kwargs):
+        """
+        Awaitable constructor: builds the endpoint without blocking and then
+        awaits get_request_async().
+        """
+        kwargs["get_request"] = False
+        endpoint = cls(*args, **kwargs)
+        await endpoint.get_request_async()
+        return endpoint
+
+    async def get_request_async(self):
+        self.nba_response = await NBAStatsHTTP().send_api_request_async(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
 
     def get_request_url(self):
         return self.nba_response.get_url()
@@ -83,5 +313,60 @@ class Endpoint:
     def get_normalized_json(self):
         return self.nba_response.get_normalized_json()
 
-    def get_data_frames(self):
-        return [data_set.get_data_frame() for data_set in self.data_sets]
+    def get_data_frames(self, typed=False):
+        return [data_set.get_data_frame(typed=typed) for data_set in self.data_sets]
+
+    def get_columns(self):
+        return [data_set.get_columns() for data_set in self.data_sets]
+
+    def to_parquet(self, directory, compression="zstd"):
+        """
+        Writes every data set to <directory>/<data_set_name>.parquet and
+        returns the paths. The endpoint name, request parameters and data set
+        order are kept in the schema metadata for from_parquet().
+        """
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        paths = []
+        for index, (name, data_set) in enumerate(self.data_sets.items()):
+            metadata = arrow.get_metadata(
+                type(self).__name__, name, index, self.parameters
+            )
+            path = os.path.join(directory, name + ".parquet")
+            arrow.write_parquet(
+                data_set.get_arrow_table(metadata=metadata, parameters=self.parameters),
+                path,
+                compression=compression,
+            )
+            paths.append(path)
+        return paths
+
+    @classmethod
+    def from_parquet(cls, directory, memory_map=True):
+        """
+        Rebuilds an endpoint from a to_parquet() snapshot without requesting
+        the API. The result has no nba_response, so only the data set
+        accessors are available.
+        """
+        tables = [
+            arrow.read_parquet(path, memory_map=memory_map)
+            for path in glob.glob(os.path.join(directory, "*.parquet"))
+        ]
+        tables.sort(key=lambda table: int(table.schema.metadata[arrow.METADATA_INDEX]))
+        endpoint = cls.__new__(cls)
+        endpoint.nba_response = None
+        endpoint.parameters = {}
+        data_sets = {}
+        for table in tables:
+            metadata = table.schema.metadata
+            if metadata[arrow.METADATA_ENDPOINT].decode() != cls.__name__:
+                raise ValueError(
+                    "{} is a snapshot of {}, not {}.".format(
+                        directory, metadata[arrow.METADATA_ENDPOINT].decode(), cls.__name__
+                    )
+                )
+            endpoint.parameters = json.loads(metadata[arrow.METADATA_PARAMETERS])
+            name = metadata[arrow.METADATA_NAME].decode()
+            data_sets[name] = cls.DataSet.from_arrow_table(table, cls.endpoint, name)
+        endpoint.data_sets = cls.DataSets(endpoint=cls.endpoint, data_sets=data_sets)
+        return endpoint
@@ -33,6 +33,26 @@ class AllTimeLeadersGrids(Endpoint):
     team_stats = None
     headers = None
 
+    ast_leaders = Endpoint.DataSetProperty("ASTLeaders")
+    blk_leaders = Endpoint.DataSetProperty("BLKLeaders")
+    dreb_leaders = Endpoint.DataSetProperty("DREBLeaders")
+    fg3_a_leaders = Endpoint.DataSetProperty("FG3ALeaders")
+    fg3_m_leaders = Endpoint.DataSetProperty("FG3MLeaders")
+    fg3_pct_leaders = Endpoint.DataSetProperty("FG3_PCTLeaders")
+    fga_leaders = Endpoint.DataSetProperty("FGALeaders")
+    fgm_leaders = Endpoint.DataSetProperty("FGMLeaders")
+    fg_pct_leaders = Endpoint.DataSetProperty("FG_PCTLeaders")
+    fta_leaders = Endpoint.DataSetProperty("FTALeaders")
+    ftm_leaders = Endpoint.DataSetProperty("FTMLeaders")
+    ft_pct_leaders = Endpoint.DataSetProperty("FT_PCTLeaders")
+    g_p_leaders = Endpoint.DataSetProperty("GPLeaders")
+    oreb_leaders = Endpoint.DataSetProperty("OREBLeaders")
+    pf_leaders = Endpoint.DataSetProperty("PFLeaders")
+    pts_leaders = Endpoint.DataSetProperty("PTSLeaders")
+    reb_leaders = Endpoint.DataSetProperty("REBLeaders")
+    stl_leaders = Endpoint.DataSetProperty("STLLeaders")
+    tov_leaders = Endpoint.DataSetProperty("TOVLeaders")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -68,27 +88,4 @@ class AllTimeLeadersGrids(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.ast_leaders = Endpoint.DataSet(data=data_sets["ASTLeaders"])
-        self.blk_leaders = Endpoint.DataSet(data=data_sets["BLKLeaders"])
-        self.dreb_leaders = Endpoint.DataSet(data=data_sets["DREBLeaders"])
-        self.fg3_a_leaders = Endpoint.DataSet(data=data_sets["FG3ALeaders"])
-        self.fg3_m_leaders = Endpoint.DataSet(data=data_sets["FG3MLeaders"])
-        self.fg3_pct_leaders = Endpoint.DataSet(data=data_sets["FG3_PCTLeaders"])
-        self.fga_leaders = Endpoint.DataSet(data=data_sets["FGALeaders"])
-        self.fgm_leaders = Endpoint.DataSet(data=data_sets["FGMLeaders"])
-        self.fg_pct_leaders = Endpoint.DataSet(data=data_sets["FG_PCTLeaders"])
-        self.fta_leaders = Endpoint.DataSet(data=data_sets["FTALeaders"])
-        self.ftm_leaders = Endpoint.DataSet(data=data_sets["FTMLeaders"])
-        self.ft_pct_leaders = Endpoint.DataSet(data=data_sets["FT_PCTLeaders"])
-        self.g_p_leaders = Endpoint.DataSet(data=data_sets["GPLeaders"])
-        self.oreb_leaders = Endpoint.DataSet(data=data_sets["OREBLeaders"])
-        self.pf_leaders = Endpoint.DataSet(data=data_sets["PFLeaders"])
-        self.pts_leaders = Endpoint.DataSet(data=data_sets["PTSLeaders"])
-        self.reb_leaders = Endpoint.DataSet(data=data_sets["REBLeaders"])
-        self.stl_leaders = Endpoint.DataSet(data=data_sets["STLLeaders"])
-        self.tov_leaders = Endpoint.DataSet(data=data_sets["TOVLeaders"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -30,6 +30,8 @@ class AssistTracker(Endpoint):
     team_stats = None
     headers = None
 
+    assist_tracker = Endpoint.DataSetProperty("AssistTracker")
+
     def __init__(
         self,
         college_nullable="",
@@ -113,9 +115,4 @@ class AssistTracker(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assist_tracker = Endpoint.DataSet(data=data_sets["AssistTracker"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
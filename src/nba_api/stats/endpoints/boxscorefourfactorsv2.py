@@ -55,6 +55,9 @@ class BoxScoreFourFactorsV2(Endpoint):
     team_stats = None
     headers = None
 
+    sql_players_four_factors = Endpoint.DataSetProperty("sqlPlayersFourFactors")
+    sql_teams_four_factors = Endpoint.DataSetProperty("sqlTeamsFourFactors")
+
     def __init__(
         self,
         game_id,
@@ -94,14 +97,4 @@ class BoxScoreFourFactorsV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_four_factors = Endpoint.DataSet(
-            data=data_sets["sqlPlayersFourFactors"]
-        )
-        self.sql_teams_four_factors = Endpoint.DataSet(
-            data=data_sets["sqlTeamsFourFactors"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
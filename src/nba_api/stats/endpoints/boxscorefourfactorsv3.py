@@ -58,10 +58,11 @@ class BoxScoreFourFactorsV3(Endpoint):
 
     nba_response = None
     data_sets = None
-    player_stats = None
-    team_stats = None
     headers = None
 
+    player_stats = Endpoint.DataSetProperty("PlayerStats")
+    team_stats = Endpoint.DataSetProperty("TeamStats")
+
     def __init__(
         self,
         game_id,
@@ -101,10 +102,4 @@ class BoxScoreFourFactorsV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -63,6 +63,9 @@ class BoxScoreMiscV2(Endpoint):
     team_stats = None
     headers = None
 
+    sql_players_misc = Endpoint.DataSetProperty("sqlPlayersMisc")
+    sql_teams_misc = Endpoint.DataSetProperty("sqlTeamsMisc")
+
     def __init__(
         self,
         game_id,
@@ -102,10 +105,4 @@ class BoxScoreMiscV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_misc = Endpoint.DataSet(data=data_sets["sqlPlayersMisc"])
-        self.sql_teams_misc = Endpoint.DataSet(data=data_sets["sqlTeamsMisc"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
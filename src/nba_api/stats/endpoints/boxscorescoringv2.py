@@ -69,6 +69,9 @@ class BoxScoreScoringV2(Endpoint):
     team_stats = None
     headers = None
 
+    sql_players_scoring = Endpoint.DataSetProperty("sqlPlayersScoring")
+    sql_teams_scoring = Endpoint.DataSetProperty("sqlTeamsScoring")
+
     def __init__(
         self,
         game_id,
@@ -108,10 +111,4 @@ class BoxScoreScoringV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_scoring = Endpoint.DataSet(data=data_sets["sqlPlayersScoring"])
-        self.sql_teams_scoring = Endpoint.DataSet(data=data_sets["sqlTeamsScoring"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
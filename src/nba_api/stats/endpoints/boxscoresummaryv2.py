@@ -115,6 +115,16 @@ class BoxScoreSummaryV2(Endpoint):
     team_stats = None
     headers = None
 
+    available_video = Endpoint.DataSetProperty("AvailableVideo")
+    game_info = Endpoint.DataSetProperty("GameInfo")
+    game_summary = Endpoint.DataSetProperty("GameSummary")
+    inactive_players = Endpoint.DataSetProperty("InactivePlayers")
+    last_meeting = Endpoint.DataSetProperty("LastMeeting")
+    line_score = Endpoint.DataSetProperty("LineScore")
+    officials = Endpoint.DataSetProperty("Officials")
+    other_stats = Endpoint.DataSetProperty("OtherStats")
+    season_series = Endpoint.DataSetProperty("SeasonSeries")
+
     def __init__(self, game_id, proxy=None, headers=None, timeout=30, get_request=True):
         self.proxy = proxy
         if headers is not None:
@@ -135,17 +145,4 @@ class BoxScoreSummaryV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.game_summary = Endpoint.DataSet(data=data_sets["GameSummary"])
-        self.inactive_players = Endpoint.DataSet(data=data_sets["InactivePlayers"])
-        self.last_meeting = Endpoint.DataSet(data=data_sets["LastMeeting"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.officials = Endpoint.DataSet(data=data_sets["Officials"])
-        self.other_stats = Endpoint.DataSet(data=data_sets["OtherStats"])
-        self.season_series = Endpoint.DataSet(data=data_sets["SeasonSeries"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -75,6 +75,9 @@ class BoxScoreUsageV2(Endpoint):
     team_stats = None
     headers = None
 
+    sql_players_usage = Endpoint.DataSetProperty("sqlPlayersUsage")
+    sql_teams_usage = Endpoint.DataSetProperty("sqlTeamsUsage")
+
     def __init__(
         self,
         game_id,
@@ -114,10 +117,4 @@ class BoxScoreUsageV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_usage = Endpoint.DataSet(data=data_sets["sqlPlayersUsage"])
-        self.sql_teams_usage = Endpoint.DataSet(data=data_sets["sqlTeamsUsage"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -30,6 +30,8 @@ class CommonAllPlayers(Endpoint):
     team_stats = None
     headers = None
 
+    common_all_players = Endpoint.DataSetProperty("CommonAllPlayers")
+
     def __init__(
         self,
         is_only_current_season=0,
@@ -63,9 +65,4 @@ class CommonAllPlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.common_all_players = Endpoint.DataSet(data=data_sets["CommonAllPlayers"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
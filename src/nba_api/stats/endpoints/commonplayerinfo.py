@@ -57,6 +57,10 @@ class CommonPlayerInfo(Endpoint):
     team_stats = None
     headers = None
 
+    available_seasons = Endpoint.DataSetProperty("AvailableSeasons")
+    common_player_info = Endpoint.DataSetProperty("CommonPlayerInfo")
+    player_headline_stats = Endpoint.DataSetProperty("PlayerHeadlineStats")
+
     def __init__(
         self,
         player_id,
@@ -85,13 +89,4 @@ class CommonPlayerInfo(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
-        self.common_player_info = Endpoint.DataSet(data=data_sets["CommonPlayerInfo"])
-        self.player_headline_stats = Endpoint.DataSet(
-            data=data_sets["PlayerHeadlineStats"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -41,6 +41,9 @@ class CommonTeamRoster(Endpoint):
     team_stats = None
     headers = None
 
+    coaches = Endpoint.DataSetProperty("Coaches")
+    common_team_roster = Endpoint.DataSetProperty("CommonTeamRoster")
+
     def __init__(
         self,
         team_id,
@@ -74,10 +77,4 @@ class CommonTeamRoster(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.coaches = Endpoint.DataSet(data=data_sets["Coaches"])
-        self.common_team_roster = Endpoint.DataSet(data=data_sets["CommonTeamRoster"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
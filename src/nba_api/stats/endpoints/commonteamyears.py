@@ -15,6 +15,8 @@ class CommonTeamYears(Endpoint):
     team_stats = None
     headers = None
 
+    team_years = Endpoint.DataSetProperty("TeamYears")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -42,9 +44,4 @@ class CommonTeamYears(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_years = Endpoint.DataSet(data=data_sets["TeamYears"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -21,6 +21,8 @@ class CumeStatsPlayerGames(Endpoint):
     team_stats = None
     headers = None
 
+    cume_stats_player_games = Endpoint.DataSetProperty("CumeStatsPlayerGames")
+
     def __init__(
         self,
         player_id,
@@ -66,11 +68,4 @@ class CumeStatsPlayerGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.cume_stats_player_games = Endpoint.DataSet(
-            data=data_sets["CumeStatsPlayerGames"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
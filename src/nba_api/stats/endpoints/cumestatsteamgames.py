@@ -21,6 +21,8 @@ class CumeStatsTeamGames(Endpoint):
     team_stats = None
     headers = None
 
+    cume_stats_team_games = Endpoint.DataSetProperty("CumeStatsTeamGames")
+
     def __init__(
         self,
         team_id,
@@ -68,11 +70,4 @@ class CumeStatsTeamGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.cume_stats_team_games = Endpoint.DataSet(
-            data=data_sets["CumeStatsTeamGames"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
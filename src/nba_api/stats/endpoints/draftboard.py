@@ -34,6 +34,8 @@ class DraftBoard(Endpoint):
     team_stats = None
     headers = None
 
+    draft_board = Endpoint.DataSetProperty("DraftBoard")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -77,9 +79,4 @@ class DraftBoard(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_board = Endpoint.DataSet(data=data_sets["DraftBoard"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
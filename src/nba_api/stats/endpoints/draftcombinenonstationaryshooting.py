@@ -46,6 +46,8 @@ class DraftCombineNonStationaryShooting(Endpoint):
     team_stats = None
     headers = None
 
+    results = Endpoint.DataSetProperty("Results")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -74,9 +76,4 @@ class DraftCombineNonStationaryShooting(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
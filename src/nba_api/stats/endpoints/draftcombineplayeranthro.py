@@ -34,6 +34,8 @@ class DraftCombinePlayerAnthro(Endpoint):
     team_stats = None
     headers = None
 
+    results = Endpoint.DataSetProperty("Results")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -62,9 +64,4 @@ class DraftCombinePlayerAnthro(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
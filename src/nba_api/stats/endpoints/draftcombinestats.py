@@ -63,6 +63,8 @@ class DraftCombineStats(Endpoint):
     team_stats = None
     headers = None
 
+    draft_combine_stats = Endpoint.DataSetProperty("DraftCombineStats")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -91,9 +93,4 @@ class DraftCombineStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_combine_stats = Endpoint.DataSet(data=data_sets["DraftCombineStats"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -29,6 +29,8 @@ class DraftHistory(Endpoint):
     team_stats = None
     headers = None
 
+    draft_history = Endpoint.DataSetProperty("DraftHistory")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -72,9 +74,4 @@ class DraftHistory(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_history = Endpoint.DataSet(data=data_sets["DraftHistory"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
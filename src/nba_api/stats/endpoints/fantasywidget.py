@@ -49,6 +49,8 @@ class FantasyWidget(Endpoint):
     team_stats = None
     headers = None
 
+    fantasy_widget_result = Endpoint.DataSetProperty("FantasyWidgetResult")
+
     def __init__(
         self,
         active_players=ActivePlayers.default,
@@ -114,11 +116,4 @@ class FantasyWidget(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.fantasy_widget_result = Endpoint.DataSet(
-            data=data_sets["FantasyWidgetResult"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -48,6 +48,9 @@ class FranchiseHistory(Endpoint):
     team_stats = None
     headers = None
 
+    defunct_teams = Endpoint.DataSetProperty("DefunctTeams")
+    franchise_history = Endpoint.DataSetProperty("FranchiseHistory")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -75,10 +78,4 @@ class FranchiseHistory(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defunct_teams = Endpoint.DataSet(data=data_sets["DefunctTeams"])
-        self.franchise_history = Endpoint.DataSet(data=data_sets["FranchiseHistory"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
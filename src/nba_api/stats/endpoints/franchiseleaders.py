@@ -32,6 +32,8 @@ class FranchiseLeaders(Endpoint):
     team_stats = None
     headers = None
 
+    franchise_leaders = Endpoint.DataSetProperty("FranchiseLeaders")
+
     def __init__(
         self,
         team_id,
@@ -60,9 +62,4 @@ class FranchiseLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.franchise_leaders = Endpoint.DataSet(data=data_sets["FranchiseLeaders"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
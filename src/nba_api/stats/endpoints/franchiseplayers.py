@@ -46,6 +46,8 @@ class FranchisePlayers(Endpoint):
     team_stats = None
     headers = None
 
+    franchise_players = Endpoint.DataSetProperty("FranchisePlayers")
+
     def __init__(
         self,
         team_id,
@@ -81,9 +83,4 @@ class FranchisePlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.franchise_players = Endpoint.DataSet(data=data_sets["FranchisePlayers"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -42,6 +42,9 @@ class GameRotation(Endpoint):
     team_stats = None
     headers = None
 
+    away_team = Endpoint.DataSetProperty("AwayTeam")
+    home_team = Endpoint.DataSetProperty("HomeTeam")
+
     def __init__(
         self,
         game_id,
@@ -70,10 +73,4 @@ class GameRotation(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.away_team = Endpoint.DataSet(data=data_sets["AwayTeam"])
-        self.home_team = Endpoint.DataSet(data=data_sets["HomeTeam"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -20,6 +20,10 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
     team_stats = None
     headers = None
 
+    g_league_alum_box_score_similarity_scores = Endpoint.DataSetProperty(
+        "GLeagueAlumBoxScoreSimilarityScores"
+    )
+
     def __init__(
         self,
         person2_id,
@@ -63,11 +67,4 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.g_league_alum_box_score_similarity_scores = Endpoint.DataSet(
-            data=data_sets["GLeagueAlumBoxScoreSimilarityScores"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -48,6 +48,15 @@ class HomePageV2(Endpoint):
     team_stats = None
     headers = None
 
+    home_page_stat1 = Endpoint.DataSetProperty("HomePageStat1")
+    home_page_stat2 = Endpoint.DataSetProperty("HomePageStat2")
+    home_page_stat3 = Endpoint.DataSetProperty("HomePageStat3")
+    home_page_stat4 = Endpoint.DataSetProperty("HomePageStat4")
+    home_page_stat5 = Endpoint.DataSetProperty("HomePageStat5")
+    home_page_stat6 = Endpoint.DataSetProperty("HomePageStat6")
+    home_page_stat7 = Endpoint.DataSetProperty("HomePageStat7")
+    home_page_stat8 = Endpoint.DataSetProperty("HomePageStat8")
+
     def __init__(
         self,
         game_scope_detailed=GameScopeDetailed.default,
@@ -89,16 +98,4 @@ class HomePageV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.home_page_stat1 = Endpoint.DataSet(data=data_sets["HomePageStat1"])
-        self.home_page_stat2 = Endpoint.DataSet(data=data_sets["HomePageStat2"])
-        self.home_page_stat3 = Endpoint.DataSet(data=data_sets["HomePageStat3"])
-        self.home_page_stat4 = Endpoint.DataSet(data=data_sets["HomePageStat4"])
-        self.home_page_stat5 = Endpoint.DataSet(data=data_sets["HomePageStat5"])
-        self.home_page_stat6 = Endpoint.DataSet(data=data_sets["HomePageStat6"])
-        self.home_page_stat7 = Endpoint.DataSet(data=data_sets["HomePageStat7"])
-        self.home_page_stat8 = Endpoint.DataSet(data=data_sets["HomePageStat8"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -48,6 +48,8 @@ class InfographicFanDuelPlayer(Endpoint):
     team_stats = None
     headers = None
 
+    fan_duel_player = Endpoint.DataSetProperty("FanDuelPlayer")
+
     def __init__(self, game_id, proxy=None, headers=None, timeout=30, get_request=True):
         self.proxy = proxy
         if headers is not None:
@@ -68,9 +70,4 @@ class InfographicFanDuelPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.fan_duel_player = Endpoint.DataSet(data=data_sets["FanDuelPlayer"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -60,9 +60,10 @@ class ISTStandings(Endpoint):
 
     nba_response = None
     data_sets = None
-    standings = None
     headers = None
 
+    standings = Endpoint.DataSetProperty("Standings")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -96,9 +97,4 @@ class ISTStandings(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.standings = Endpoint.DataSet(data=data_sets["Standings"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -94,6 +94,8 @@ class LeagueDashLineups(Endpoint):
     team_stats = None
     headers = None
 
+    lineups = Endpoint.DataSetProperty("Lineups")
+
     def __init__(
         self,
         group_quantity=GroupQuantity.default,
@@ -173,9 +175,4 @@ class LeagueDashLineups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.lineups = Endpoint.DataSet(data=data_sets["Lineups"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -59,6 +59,8 @@ class LeagueDashPlayerBioStats(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_player_bio_stats = Endpoint.DataSetProperty("LeagueDashPlayerBioStats")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -148,11 +150,4 @@ class LeagueDashPlayerBioStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_bio_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerBioStats"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -109,6 +109,8 @@ class LeagueDashPlayerClutch(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_player_clutch = Endpoint.DataSetProperty("LeagueDashPlayerClutch")
+
     def __init__(
         self,
         ahead_behind=AheadBehind.default,
@@ -212,11 +214,4 @@ class LeagueDashPlayerClutch(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_clutch = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerClutch"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -54,6 +54,8 @@ class LeagueDashPlayerPtShot(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_ptshots = Endpoint.DataSetProperty("LeagueDashPTShots")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -151,9 +153,4 @@ class LeagueDashPlayerPtShot(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_ptshots = Endpoint.DataSet(data=data_sets["LeagueDashPTShots"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
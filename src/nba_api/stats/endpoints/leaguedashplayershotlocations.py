@@ -87,6 +87,8 @@ class LeagueDashPlayerShotLocations(Endpoint):
     team_stats = None
     headers = None
 
+    shot_locations = Endpoint.DataSetProperty("ShotLocations")
+
     def __init__(
         self,
         distance_range=DistanceRange.default,
@@ -186,9 +188,4 @@ class LeagueDashPlayerShotLocations(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.shot_locations = Endpoint.DataSet(data=data_sets["ShotLocations"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -105,6 +105,8 @@ class LeagueDashPlayerStats(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_player_stats = Endpoint.DataSetProperty("LeagueDashPlayerStats")
+
     def __init__(
         self,
         last_n_games=LastNGames.default,
@@ -204,11 +206,4 @@ class LeagueDashPlayerStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerStats"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -48,6 +48,8 @@ class LeagueDashPtDefend(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_p_tdefend = Endpoint.DataSetProperty("LeagueDashPTDefend")
+
     def __init__(
         self,
         defense_category=DefenseCategory.default,
@@ -137,11 +139,4 @@ class LeagueDashPtDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_p_tdefend = Endpoint.DataSet(
-            data=data_sets["LeagueDashPTDefend"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
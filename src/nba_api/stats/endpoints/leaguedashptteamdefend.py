@@ -42,6 +42,8 @@ class LeagueDashPtTeamDefend(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_pt_team_defend = Endpoint.DataSetProperty("LeagueDashPtTeamDefend")
+
     def __init__(
         self,
         defense_category=DefenseCategory.default,
@@ -111,11 +113,4 @@ class LeagueDashPtTeamDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_pt_team_defend = Endpoint.DataSet(
-            data=data_sets["LeagueDashPtTeamDefend"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -99,6 +99,8 @@ class LeagueDashTeamClutch(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_team_clutch = Endpoint.DataSetProperty("LeagueDashTeamClutch")
+
     def __init__(
         self,
         ahead_behind=AheadBehind.default,
@@ -190,11 +192,4 @@ class LeagueDashTeamClutch(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_team_clutch = Endpoint.DataSet(
-            data=data_sets["LeagueDashTeamClutch"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -96,6 +96,8 @@ class LeagueDashTeamStats(Endpoint):
     team_stats = None
     headers = None
 
+    league_dash_team_stats = Endpoint.DataSetProperty("LeagueDashTeamStats")
+
     def __init__(
         self,
         last_n_games=LastNGames.default,
@@ -183,11 +185,4 @@ class LeagueDashTeamStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_team_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashTeamStats"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
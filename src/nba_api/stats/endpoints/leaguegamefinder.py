@@ -56,6 +56,8 @@ class LeagueGameFinder(Endpoint):
     team_stats = None
     headers = None
 
+    league_game_finder_results = Endpoint.DataSetProperty("LeagueGameFinderResults")
+
     def __init__(
         self,
         player_or_team_abbreviation=PlayerOrTeamAbbreviation.default,
@@ -259,11 +261,4 @@ class LeagueGameFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_game_finder_results = Endpoint.DataSet(
-            data=data_sets["LeagueGameFinderResults"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -52,6 +52,8 @@ class LeagueGameLog(Endpoint):
     team_stats = None
     headers = None
 
+    league_game_log = Endpoint.DataSetProperty("LeagueGameLog")
+
     def __init__(
         self,
         counter=0,
@@ -97,9 +99,4 @@ class LeagueGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_game_log = Endpoint.DataSet(data=data_sets["LeagueGameLog"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
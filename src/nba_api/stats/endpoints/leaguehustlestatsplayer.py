@@ -58,6 +58,8 @@ class LeagueHustleStatsPlayer(Endpoint):
     team_stats = None
     headers = None
 
+    hustle_stats_player = Endpoint.DataSetProperty("HustleStatsPlayer")
+
     def __init__(
         self,
         per_mode_time=PerModeTime.default,
@@ -135,9 +137,4 @@ class LeagueHustleStatsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.hustle_stats_player = Endpoint.DataSet(data=data_sets["HustleStatsPlayer"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
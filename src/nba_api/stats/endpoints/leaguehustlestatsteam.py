@@ -50,6 +50,8 @@ class LeagueHustleStatsTeam(Endpoint):
     team_stats = None
     headers = None
 
+    hustle_stats_team = Endpoint.DataSetProperty("HustleStatsTeam")
+
     def __init__(
         self,
         per_mode_time=PerModeTime.default,
@@ -127,9 +129,4 @@ class LeagueHustleStatsTeam(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.hustle_stats_team = Endpoint.DataSet(data=data_sets["HustleStatsTeam"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -50,6 +50,8 @@ class LeagueLeaders(Endpoint):
     team_stats = None
     headers = None
 
+    league_leaders = Endpoint.DataSetProperty("LeagueLeaders")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -91,9 +93,4 @@ class LeagueLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_leaders = Endpoint.DataSet(data=data_sets["LeagueLeaders"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
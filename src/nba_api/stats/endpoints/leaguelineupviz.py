@@ -61,6 +61,8 @@ class LeagueLineupViz(Endpoint):
     team_stats = None
     headers = None
 
+    league_lineup_viz = Endpoint.DataSetProperty("LeagueLineupViz")
+
     def __init__(
         self,
         minutes_min,
@@ -142,9 +144,4 @@ class LeagueLineupViz(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_lineup_viz = Endpoint.DataSet(data=data_sets["LeagueLineupViz"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -93,6 +93,10 @@ class LeaguePlayerOnDetails(Endpoint):
     team_stats = None
     headers = None
 
+    players_on_court_league_player_details = Endpoint.DataSetProperty(
+        "PlayersOnCourtLeaguePlayerDetails"
+    )
+
     def __init__(
         self,
         team_id,
@@ -162,11 +166,4 @@ class LeaguePlayerOnDetails(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.players_on_court_league_player_details = Endpoint.DataSet(
-            data=data_sets["PlayersOnCourtLeaguePlayerDetails"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
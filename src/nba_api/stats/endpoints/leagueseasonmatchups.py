@@ -42,6 +42,8 @@ class LeagueSeasonMatchups(Endpoint):
     team_stats = None
     headers = None
 
+    season_matchups = Endpoint.DataSetProperty("SeasonMatchups")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -85,9 +87,4 @@ class LeagueSeasonMatchups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.season_matchups = Endpoint.DataSet(data=data_sets["SeasonMatchups"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -136,6 +136,8 @@ class LeagueStandingsV3(Endpoint):
     team_stats = None
     headers = None
 
+    standings = Endpoint.DataSetProperty("Standings")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -171,9 +173,4 @@ class LeagueStandingsV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.standings = Endpoint.DataSet(data=data_sets["Standings"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -38,6 +38,8 @@ class MatchupsRollup(Endpoint):
     team_stats = None
     headers = None
 
+    matchups_rollup = Endpoint.DataSetProperty("MatchupsRollup")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -81,9 +83,4 @@ class MatchupsRollup(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.matchups_rollup = Endpoint.DataSet(data=data_sets["MatchupsRollup"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -29,6 +29,9 @@ class PlayByPlay(Endpoint):
     team_stats = None
     headers = None
 
+    available_video = Endpoint.DataSetProperty("AvailableVideo")
+    play_by_play = Endpoint.DataSetProperty("PlayByPlay")
+
     def __init__(
         self,
         game_id,
@@ -62,10 +65,4 @@ class PlayByPlay(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.play_by_play = Endpoint.DataSet(data=data_sets["PlayByPlay"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -29,6 +29,8 @@ class PlayerAwards(Endpoint):
     team_stats = None
     headers = None
 
+    player_awards = Endpoint.DataSetProperty("PlayerAwards")
+
     def __init__(
         self, player_id, proxy=None, headers=None, timeout=30, get_request=True
     ):
@@ -51,9 +53,4 @@ class PlayerAwards(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_awards = Endpoint.DataSet(data=data_sets["PlayerAwards"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
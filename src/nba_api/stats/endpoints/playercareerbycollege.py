@@ -44,6 +44,8 @@ class PlayerCareerByCollege(Endpoint):
     team_stats = None
     headers = None
 
+    player_career_by_college = Endpoint.DataSetProperty("PlayerCareerByCollege")
+
     def __init__(
         self,
         college,
@@ -81,11 +83,4 @@ class PlayerCareerByCollege(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_career_by_college = Endpoint.DataSet(
-            data=data_sets["PlayerCareerByCollege"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
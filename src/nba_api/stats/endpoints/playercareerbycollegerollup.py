@@ -123,6 +123,11 @@ class PlayerCareerByCollegeRollup(Endpoint):
     team_stats = None
     headers = None
 
+    east = Endpoint.DataSetProperty("East")
+    midwest = Endpoint.DataSetProperty("Midwest")
+    south = Endpoint.DataSetProperty("South")
+    west = Endpoint.DataSetProperty("West")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -158,12 +163,4 @@ class PlayerCareerByCollegeRollup(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.east = Endpoint.DataSet(data=data_sets["East"])
-        self.midwest = Endpoint.DataSet(data=data_sets["Midwest"])
-        self.south = Endpoint.DataSet(data=data_sets["South"])
-        self.west = Endpoint.DataSet(data=data_sets["West"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -292,6 +292,23 @@ class PlayerCareerStats(Endpoint):
     team_stats = None
     headers = None
 
+    career_totals_all_star_season = Endpoint.DataSetProperty(
+        "CareerTotalsAllStarSeason"
+    )
+    career_totals_college_season = Endpoint.DataSetProperty("CareerTotalsCollegeSeason")
+    career_totals_post_season = Endpoint.DataSetProperty("CareerTotalsPostSeason")
+    career_totals_regular_season = Endpoint.DataSetProperty("CareerTotalsRegularSeason")
+    season_rankings_post_season = Endpoint.DataSetProperty("SeasonRankingsPostSeason")
+    season_rankings_regular_season = Endpoint.DataSetProperty(
+        "SeasonRankingsRegularSeason"
+    )
+    season_totals_all_star_season = Endpoint.DataSetProperty(
+        "SeasonTotalsAllStarSeason"
+    )
+    season_totals_college_season = Endpoint.DataSetProperty("SeasonTotalsCollegeSeason")
+    season_totals_post_season = Endpoint.DataSetProperty("SeasonTotalsPostSeason")
+    season_totals_regular_season = Endpoint.DataSetProperty("SeasonTotalsRegularSeason")
+
     def __init__(
         self,
         player_id,
@@ -325,38 +342,4 @@ class PlayerCareerStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsAllStarSeason"]
-        )
-        self.career_totals_college_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsCollegeSeason"]
-        )
-        self.career_totals_post_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsPostSeason"]
-        )
-        self.career_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsRegularSeason"]
-        )
-        self.season_rankings_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsPostSeason"]
-        )
-        self.season_rankings_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsRegularSeason"]
-        )
-        self.season_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsAllStarSeason"]
-        )
-        self.season_totals_college_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsCollegeSeason"]
-        )
-        self.season_totals_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsPostSeason"]
-        )
-        self.season_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsRegularSeason"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
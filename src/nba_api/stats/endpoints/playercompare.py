@@ -86,6 +86,9 @@ class PlayerCompare(Endpoint):
     team_stats = None
     headers = None
 
+    individual = Endpoint.DataSetProperty("Individual")
+    overall_compare = Endpoint.DataSetProperty("OverallCompare")
+
     def __init__(
         self,
         vs_player_id_list,
@@ -163,10 +166,4 @@ class PlayerCompare(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.individual = Endpoint.DataSet(data=data_sets["Individual"])
-        self.overall_compare = Endpoint.DataSet(data=data_sets["OverallCompare"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
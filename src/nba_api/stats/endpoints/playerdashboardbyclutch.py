@@ -737,6 +737,38 @@ class PlayerDashboardByClutch(Endpoint):
     team_stats = None
     headers = None
 
+    last10_sec3_point2_player_dashboard = Endpoint.DataSetProperty(
+        "Last10Sec3Point2PlayerDashboard"
+    )
+    last10_sec3_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last10Sec3PointPlayerDashboard"
+    )
+    last1_min5_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last1Min5PointPlayerDashboard"
+    )
+    last1_min_plus_minus5_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last1MinPlusMinus5PointPlayerDashboard"
+    )
+    last30_sec3_point2_player_dashboard = Endpoint.DataSetProperty(
+        "Last30Sec3Point2PlayerDashboard"
+    )
+    last30_sec3_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last30Sec3PointPlayerDashboard"
+    )
+    last3_min5_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last3Min5PointPlayerDashboard"
+    )
+    last3_min_plus_minus5_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last3MinPlusMinus5PointPlayerDashboard"
+    )
+    last5_min5_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last5Min5PointPlayerDashboard"
+    )
+    last5_min_plus_minus5_point_player_dashboard = Endpoint.DataSetProperty(
+        "Last5MinPlusMinus5PointPlayerDashboard"
+    )
+    overall_player_dashboard = Endpoint.DataSetProperty("OverallPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -810,41 +842,4 @@ class PlayerDashboardByClutch(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.last10_sec3_point2_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last10Sec3Point2PlayerDashboard"]
-        )
-        self.last10_sec3_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last10Sec3PointPlayerDashboard"]
-        )
-        self.last1_min5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last1Min5PointPlayerDashboard"]
-        )
-        self.last1_min_plus_minus5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last1MinPlusMinus5PointPlayerDashboard"]
-        )
-        self.last30_sec3_point2_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last30Sec3Point2PlayerDashboard"]
-        )
-        self.last30_sec3_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last30Sec3PointPlayerDashboard"]
-        )
-        self.last3_min5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last3Min5PointPlayerDashboard"]
-        )
-        self.last3_min_plus_minus5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last3MinPlusMinus5PointPlayerDashboard"]
-        )
-        self.last5_min5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last5Min5PointPlayerDashboard"]
-        )
-        self.last5_min_plus_minus5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last5MinPlusMinus5PointPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -481,6 +481,16 @@ class PlayerDashboardByGeneralSplits(Endpoint):
     team_stats = None
     headers = None
 
+    days_rest_player_dashboard = Endpoint.DataSetProperty("DaysRestPlayerDashboard")
+    location_player_dashboard = Endpoint.DataSetProperty("LocationPlayerDashboard")
+    month_player_dashboard = Endpoint.DataSetProperty("MonthPlayerDashboard")
+    overall_player_dashboard = Endpoint.DataSetProperty("OverallPlayerDashboard")
+    pre_post_all_star_player_dashboard = Endpoint.DataSetProperty(
+        "PrePostAllStarPlayerDashboard"
+    )
+    starting_position = Endpoint.DataSetProperty("StartingPosition")
+    wins_losses_player_dashboard = Endpoint.DataSetProperty("WinsLossesPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -554,27 +564,4 @@ class PlayerDashboardByGeneralSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.days_rest_player_dashboard = Endpoint.DataSet(
-            data=data_sets["DaysRestPlayerDashboard"]
-        )
-        self.location_player_dashboard = Endpoint.DataSet(
-            data=data_sets["LocationPlayerDashboard"]
-        )
-        self.month_player_dashboard = Endpoint.DataSet(
-            data=data_sets["MonthPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
-        self.pre_post_all_star_player_dashboard = Endpoint.DataSet(
-            data=data_sets["PrePostAllStarPlayerDashboard"]
-        )
-        self.starting_position = Endpoint.DataSet(data=data_sets["StartingPosition"])
-        self.wins_losses_player_dashboard = Endpoint.DataSet(
-            data=data_sets["WinsLossesPlayerDashboard"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -417,6 +417,13 @@ class PlayerDashboardByLastNGames(Endpoint):
     team_stats = None
     headers = None
 
+    game_number_player_dashboard = Endpoint.DataSetProperty("GameNumberPlayerDashboard")
+    last10_player_dashboard = Endpoint.DataSetProperty("Last10PlayerDashboard")
+    last15_player_dashboard = Endpoint.DataSetProperty("Last15PlayerDashboard")
+    last20_player_dashboard = Endpoint.DataSetProperty("Last20PlayerDashboard")
+    last5_player_dashboard = Endpoint.DataSetProperty("Last5PlayerDashboard")
+    overall_player_dashboard = Endpoint.DataSetProperty("OverallPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -490,26 +497,4 @@ class PlayerDashboardByLastNGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_number_player_dashboard = Endpoint.DataSet(
-            data=data_sets["GameNumberPlayerDashboard"]
-        )
-        self.last10_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last10PlayerDashboard"]
-        )
-        self.last15_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last15PlayerDashboard"]
-        )
-        self.last20_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last20PlayerDashboard"]
-        )
-        self.last5_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last5PlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
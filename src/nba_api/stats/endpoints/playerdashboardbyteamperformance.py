@@ -295,6 +295,17 @@ class PlayerDashboardByTeamPerformance(Endpoint):
     team_stats = None
     headers = None
 
+    overall_player_dashboard = Endpoint.DataSetProperty("OverallPlayerDashboard")
+    points_scored_player_dashboard = Endpoint.DataSetProperty(
+        "PointsScoredPlayerDashboard"
+    )
+    ponts_against_player_dashboard = Endpoint.DataSetProperty(
+        "PontsAgainstPlayerDashboard"
+    )
+    score_differential_player_dashboard = Endpoint.DataSetProperty(
+        "ScoreDifferentialPlayerDashboard"
+    )
+
     def __init__(
         self,
         player_id,
@@ -368,20 +379,4 @@ class PlayerDashboardByTeamPerformance(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
-        self.points_scored_player_dashboard = Endpoint.DataSet(
-            data=data_sets["PointsScoredPlayerDashboard"]
-        )
-        self.ponts_against_player_dashboard = Endpoint.DataSet(
-            data=data_sets["PontsAgainstPlayerDashboard"]
-        )
-        self.score_differential_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ScoreDifferentialPlayerDashboard"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -167,6 +167,9 @@ class PlayerDashboardByYearOverYear(Endpoint):
     team_stats = None
     headers = None
 
+    by_year_player_dashboard = Endpoint.DataSetProperty("ByYearPlayerDashboard")
+    overall_player_dashboard = Endpoint.DataSetProperty("OverallPlayerDashboard")
+
     def __init__(
         self,
         player_id,
@@ -240,14 +243,4 @@ class PlayerDashboardByYearOverYear(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.by_year_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ByYearPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
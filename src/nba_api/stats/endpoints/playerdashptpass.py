@@ -72,6 +72,9 @@ class PlayerDashPtPass(Endpoint):
     team_stats = None
     headers = None
 
+    passes_made = Endpoint.DataSetProperty("PassesMade")
+    passes_received = Endpoint.DataSetProperty("PassesReceived")
+
     def __init__(
         self,
         team_id,
@@ -131,10 +134,4 @@ class PlayerDashPtPass(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.passes_made = Endpoint.DataSet(data=data_sets["PassesMade"])
-        self.passes_received = Endpoint.DataSet(data=data_sets["PassesReceived"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -40,6 +40,8 @@ class PlayerDashPtShotDefend(Endpoint):
     team_stats = None
     headers = None
 
+    defending_shots = Endpoint.DataSetProperty("DefendingShots")
+
     def __init__(
         self,
         team_id,
@@ -103,9 +105,4 @@ class PlayerDashPtShotDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defending_shots = Endpoint.DataSet(data=data_sets["DefendingShots"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -175,6 +175,16 @@ class PlayerDashPtShots(Endpoint):
     team_stats = None
     headers = None
 
+    closest_defender10ft_plus_shooting = Endpoint.DataSetProperty(
+        "ClosestDefender10ftPlusShooting"
+    )
+    closest_defender_shooting = Endpoint.DataSetProperty("ClosestDefenderShooting")
+    dribble_shooting = Endpoint.DataSetProperty("DribbleShooting")
+    general_shooting = Endpoint.DataSetProperty("GeneralShooting")
+    overall = Endpoint.DataSetProperty("Overall")
+    shot_clock_shooting = Endpoint.DataSetProperty("ShotClockShooting")
+    touch_time_shooting = Endpoint.DataSetProperty("TouchTimeShooting")
+
     def __init__(
         self,
         team_id,
@@ -238,19 +248,4 @@ class PlayerDashPtShots(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.closest_defender10ft_plus_shooting = Endpoint.DataSet(
-            data=data_sets["ClosestDefender10ftPlusShooting"]
-        )
-        self.closest_defender_shooting = Endpoint.DataSet(
-            data=data_sets["ClosestDefenderShooting"]
-        )
-        self.dribble_shooting = Endpoint.DataSet(data=data_sets["DribbleShooting"])
-        self.general_shooting = Endpoint.DataSet(data=data_sets["GeneralShooting"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
-        self.shot_clock_shooting = Endpoint.DataSet(data=data_sets["ShotClockShooting"])
-        self.touch_time_shooting = Endpoint.DataSet(data=data_sets["TouchTimeShooting"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
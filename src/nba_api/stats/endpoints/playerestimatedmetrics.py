@@ -48,6 +48,8 @@ class PlayerEstimatedMetrics(Endpoint):
     team_stats = None
     headers = None
 
+    player_estimated_metrics = Endpoint.DataSetProperty("PlayerEstimatedMetrics")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -81,11 +83,4 @@ class PlayerEstimatedMetrics(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_estimated_metrics = Endpoint.DataSet(
-            data=data_sets["PlayerEstimatedMetrics"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
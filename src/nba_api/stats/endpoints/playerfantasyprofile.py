@@ -194,6 +194,12 @@ class PlayerFantasyProfile(Endpoint):
     team_stats = None
     headers = None
 
+    days_rest_modified = Endpoint.DataSetProperty("DaysRestModified")
+    last_n_games = Endpoint.DataSetProperty("LastNGames")
+    location = Endpoint.DataSetProperty("Location")
+    opponent = Endpoint.DataSetProperty("Opponent")
+    overall = Endpoint.DataSetProperty("Overall")
+
     def __init__(
         self,
         player_id,
@@ -239,13 +245,4 @@ class PlayerFantasyProfile(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.days_rest_modified = Endpoint.DataSet(data=data_sets["DaysRestModified"])
-        self.last_n_games = Endpoint.DataSet(data=data_sets["LastNGames"])
-        self.location = Endpoint.DataSet(data=data_sets["Location"])
-        self.opponent = Endpoint.DataSet(data=data_sets["Opponent"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
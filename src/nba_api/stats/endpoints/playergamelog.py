@@ -43,6 +43,8 @@ class PlayerGameLog(Endpoint):
     team_stats = None
     headers = None
 
+    player_game_log = Endpoint.DataSetProperty("PlayerGameLog")
+
     def __init__(
         self,
         player_id,
@@ -82,9 +84,4 @@ class PlayerGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_log = Endpoint.DataSet(data=data_sets["PlayerGameLog"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -95,6 +95,8 @@ class PlayerGameLogs(Endpoint):
     team_stats = None
     headers = None
 
+    player_game_logs = Endpoint.DataSetProperty("PlayerGameLogs")
+
     def __init__(
         self,
         date_from_nullable="",
@@ -164,9 +166,4 @@ class PlayerGameLogs(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_logs = Endpoint.DataSet(data=data_sets["PlayerGameLogs"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -36,6 +36,10 @@ class PlayerGameStreakFinder(Endpoint):
     team_stats = None
     headers = None
 
+    player_game_streak_finder_results = Endpoint.DataSetProperty(
+        "PlayerGameStreakFinderResults"
+    )
+
     def __init__(
         self,
         active_streaks_only_nullable="",
@@ -241,11 +245,4 @@ class PlayerGameStreakFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_streak_finder_results = Endpoint.DataSet(
-            data=data_sets["PlayerGameStreakFinderResults"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
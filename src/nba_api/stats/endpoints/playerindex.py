@@ -49,6 +49,8 @@ class PlayerIndex(Endpoint):
     team_stats = None
     headers = None
 
+    player_index = Endpoint.DataSetProperty("PlayerIndex")
+
     def __init__(
         self,
         active_nullable=ActiveNullable.default,
@@ -102,9 +104,4 @@ class PlayerIndex(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_index = Endpoint.DataSet(data=data_sets["PlayerIndex"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
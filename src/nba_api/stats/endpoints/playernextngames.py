@@ -34,6 +34,8 @@ class PlayerNextNGames(Endpoint):
     team_stats = None
     headers = None
 
+    next_n_games = Endpoint.DataSetProperty("NextNGames")
+
     def __init__(
         self,
         player_id,
@@ -71,9 +73,4 @@ class PlayerNextNGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.next_n_games = Endpoint.DataSet(data=data_sets["NextNGames"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
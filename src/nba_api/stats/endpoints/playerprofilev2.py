@@ -385,6 +385,28 @@ class PlayerProfileV2(Endpoint):
     team_stats = None
     headers = None
 
+    career_highs = Endpoint.DataSetProperty("CareerHighs")
+    career_totals_all_star_season = Endpoint.DataSetProperty(
+        "CareerTotalsAllStarSeason"
+    )
+    career_totals_college_season = Endpoint.DataSetProperty("CareerTotalsCollegeSeason")
+    career_totals_post_season = Endpoint.DataSetProperty("CareerTotalsPostSeason")
+    career_totals_preseason = Endpoint.DataSetProperty("CareerTotalsPreseason")
+    career_totals_regular_season = Endpoint.DataSetProperty("CareerTotalsRegularSeason")
+    next_game = Endpoint.DataSetProperty("NextGame")
+    season_highs = Endpoint.DataSetProperty("SeasonHighs")
+    season_rankings_post_season = Endpoint.DataSetProperty("SeasonRankingsPostSeason")
+    season_rankings_regular_season = Endpoint.DataSetProperty(
+        "SeasonRankingsRegularSeason"
+    )
+    season_totals_all_star_season = Endpoint.DataSetProperty(
+        "SeasonTotalsAllStarSeason"
+    )
+    season_totals_college_season = Endpoint.DataSetProperty("SeasonTotalsCollegeSeason")
+    season_totals_post_season = Endpoint.DataSetProperty("SeasonTotalsPostSeason")
+    season_totals_preseason = Endpoint.DataSetProperty("SeasonTotalsPreseason")
+    season_totals_regular_season = Endpoint.DataSetProperty("SeasonTotalsRegularSeason")
+
     def __init__(
         self,
         player_id,
@@ -418,47 +440,4 @@ class PlayerProfileV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_highs = Endpoint.DataSet(data=data_sets["CareerHighs"])
-        self.career_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsAllStarSeason"]
-        )
-        self.career_totals_college_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsCollegeSeason"]
-        )
-        self.career_totals_post_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsPostSeason"]
-        )
-        self.career_totals_preseason = Endpoint.DataSet(
-            data=data_sets["CareerTotalsPreseason"]
-        )
-        self.career_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsRegularSeason"]
-        )
-        self.next_game = Endpoint.DataSet(data=data_sets["NextGame"])
-        self.season_highs = Endpoint.DataSet(data=data_sets["SeasonHighs"])
-        self.season_rankings_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsPostSeason"]
-        )
-        self.season_rankings_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsRegularSeason"]
-        )
-        self.season_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsAllStarSeason"]
-        )
-        self.season_totals_college_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsCollegeSeason"]
-        )
-        self.season_totals_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsPostSeason"]
-        )
-        self.season_totals_preseason = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsPreseason"]
-        )
-        self.season_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsRegularSeason"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -206,6 +206,17 @@ class PlayerVsPlayer(Endpoint):
     team_stats = None
     headers = None
 
+    on_off_court = Endpoint.DataSetProperty("OnOffCourt")
+    overall = Endpoint.DataSetProperty("Overall")
+    player_info = Endpoint.DataSetProperty("PlayerInfo")
+    shot_area_off_court = Endpoint.DataSetProperty("ShotAreaOffCourt")
+    shot_area_on_court = Endpoint.DataSetProperty("ShotAreaOnCourt")
+    shot_area_overall = Endpoint.DataSetProperty("ShotAreaOverall")
+    shot_distance_off_court = Endpoint.DataSetProperty("ShotDistanceOffCourt")
+    shot_distance_on_court = Endpoint.DataSetProperty("ShotDistanceOnCourt")
+    shot_distance_overall = Endpoint.DataSetProperty("ShotDistanceOverall")
+    vs_player_info = Endpoint.DataSetProperty("VsPlayerInfo")
+
     def __init__(
         self,
         vs_player_id,
@@ -277,24 +288,4 @@ class PlayerVsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.on_off_court = Endpoint.DataSet(data=data_sets["OnOffCourt"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
-        self.player_info = Endpoint.DataSet(data=data_sets["PlayerInfo"])
-        self.shot_area_off_court = Endpoint.DataSet(data=data_sets["ShotAreaOffCourt"])
-        self.shot_area_on_court = Endpoint.DataSet(data=data_sets["ShotAreaOnCourt"])
-        self.shot_area_overall = Endpoint.DataSet(data=data_sets["ShotAreaOverall"])
-        self.shot_distance_off_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOffCourt"]
-        )
-        self.shot_distance_on_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOnCourt"]
-        )
-        self.shot_distance_overall = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOverall"]
-        )
-        self.vs_player_info = Endpoint.DataSet(data=data_sets["VsPlayerInfo"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
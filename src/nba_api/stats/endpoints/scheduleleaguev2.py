@@ -166,10 +166,11 @@ class ScheduleLeagueV2(Endpoint):
 
     nba_response = None
     data_sets = None
-    season_games = None
-    season_weeks = None
     headers = None
 
+    season_games = Endpoint.DataSetProperty("SeasonGames")
+    season_weeks = Endpoint.DataSetProperty("SeasonWeeks")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -201,10 +202,4 @@ class ScheduleLeagueV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.season_games = Endpoint.DataSet(data=data_sets["SeasonGames"])
-        self.season_weeks = Endpoint.DataSet(data=data_sets["SeasonWeeks"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
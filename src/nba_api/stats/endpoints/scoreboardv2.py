@@ -136,6 +136,17 @@ class ScoreboardV2(Endpoint):
     team_stats = None
     headers = None
 
+    available = Endpoint.DataSetProperty("Available")
+    east_conf_standings_by_day = Endpoint.DataSetProperty("EastConfStandingsByDay")
+    game_header = Endpoint.DataSetProperty("GameHeader")
+    last_meeting = Endpoint.DataSetProperty("LastMeeting")
+    line_score = Endpoint.DataSetProperty("LineScore")
+    series_standings = Endpoint.DataSetProperty("SeriesStandings")
+    team_leaders = Endpoint.DataSetProperty("TeamLeaders")
+    ticket_links = Endpoint.DataSetProperty("TicketLinks")
+    west_conf_standings_by_day = Endpoint.DataSetProperty("WestConfStandingsByDay")
+    win_probability = Endpoint.DataSetProperty("WinProbability")
+
     def __init__(
         self,
         day_offset=DayOffset.default,
@@ -169,22 +180,4 @@ class ScoreboardV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available = Endpoint.DataSet(data=data_sets["Available"])
-        self.east_conf_standings_by_day = Endpoint.DataSet(
-            data=data_sets["EastConfStandingsByDay"]
-        )
-        self.game_header = Endpoint.DataSet(data=data_sets["GameHeader"])
-        self.last_meeting = Endpoint.DataSet(data=data_sets["LastMeeting"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.series_standings = Endpoint.DataSet(data=data_sets["SeriesStandings"])
-        self.team_leaders = Endpoint.DataSet(data=data_sets["TeamLeaders"])
-        self.ticket_links = Endpoint.DataSet(data=data_sets["TicketLinks"])
-        self.west_conf_standings_by_day = Endpoint.DataSet(
-            data=data_sets["WestConfStandingsByDay"]
-        )
-        self.win_probability = Endpoint.DataSet(data=data_sets["WinProbability"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -73,6 +73,9 @@ class ShotChartDetail(Endpoint):
     team_stats = None
     headers = None
 
+    league_averages = Endpoint.DataSetProperty("LeagueAverages")
+    shot_chart_detail = Endpoint.DataSetProperty("Shot_Chart_Detail")
+
     def __init__(
         self,
         team_id,
@@ -162,10 +165,4 @@ class ShotChartDetail(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_averages = Endpoint.DataSet(data=data_sets["LeagueAverages"])
-        self.shot_chart_detail = Endpoint.DataSet(data=data_sets["Shot_Chart_Detail"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -23,6 +23,8 @@ class ShotChartLeagueWide(Endpoint):
     team_stats = None
     headers = None
 
+    league_wide = Endpoint.DataSetProperty("League_Wide")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -51,9 +53,4 @@ class ShotChartLeagueWide(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_wide = Endpoint.DataSet(data=data_sets["League_Wide"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -65,6 +65,11 @@ class ShotChartLineupDetail(Endpoint):
     team_stats = None
     headers = None
 
+    shot_chart_lineup_detail = Endpoint.DataSetProperty("ShotChartLineupDetail")
+    shot_chart_lineup_league_average = Endpoint.DataSetProperty(
+        "ShotChartLineupLeagueAverage"
+    )
+
     def __init__(
         self,
         context_measure_detailed=ContextMeasureDetailed.default,
@@ -132,14 +137,4 @@ class ShotChartLineupDetail(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.shot_chart_lineup_detail = Endpoint.DataSet(
-            data=data_sets["ShotChartLineupDetail"]
-        )
-        self.shot_chart_lineup_league_average = Endpoint.DataSet(
-            data=data_sets["ShotChartLineupLeagueAverage"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -46,6 +46,8 @@ class SynergyPlayTypes(Endpoint):
     team_stats = None
     headers = None
 
+    synergy_play_type = Endpoint.DataSetProperty("SynergyPlayType")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -87,9 +89,4 @@ class SynergyPlayTypes(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.synergy_play_type = Endpoint.DataSet(data=data_sets["SynergyPlayType"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
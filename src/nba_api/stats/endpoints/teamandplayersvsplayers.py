@@ -171,6 +171,12 @@ class TeamAndPlayersVsPlayers(Endpoint):
     team_stats = None
     headers = None
 
+    players_vs_players = Endpoint.DataSetProperty("PlayersVsPlayers")
+    team_players_vs_players_off = Endpoint.DataSetProperty("TeamPlayersVsPlayersOff")
+    team_players_vs_players_on = Endpoint.DataSetProperty("TeamPlayersVsPlayersOn")
+    team_vs_players = Endpoint.DataSetProperty("TeamVsPlayers")
+    team_vs_players_off = Endpoint.DataSetProperty("TeamVsPlayersOff")
+
     def __init__(
         self,
         vs_team_id,
@@ -268,17 +274,4 @@ class TeamAndPlayersVsPlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.players_vs_players = Endpoint.DataSet(data=data_sets["PlayersVsPlayers"])
-        self.team_players_vs_players_off = Endpoint.DataSet(
-            data=data_sets["TeamPlayersVsPlayersOff"]
-        )
-        self.team_players_vs_players_on = Endpoint.DataSet(
-            data=data_sets["TeamPlayersVsPlayersOn"]
-        )
-        self.team_vs_players = Endpoint.DataSet(data=data_sets["TeamVsPlayers"])
-        self.team_vs_players_off = Endpoint.DataSet(data=data_sets["TeamVsPlayersOff"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
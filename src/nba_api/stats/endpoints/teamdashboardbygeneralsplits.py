@@ -387,6 +387,15 @@ class TeamDashboardByGeneralSplits(Endpoint):
     team_stats = None
     headers = None
 
+    days_rest_team_dashboard = Endpoint.DataSetProperty("DaysRestTeamDashboard")
+    location_team_dashboard = Endpoint.DataSetProperty("LocationTeamDashboard")
+    month_team_dashboard = Endpoint.DataSetProperty("MonthTeamDashboard")
+    overall_team_dashboard = Endpoint.DataSetProperty("OverallTeamDashboard")
+    pre_post_all_star_team_dashboard = Endpoint.DataSetProperty(
+        "PrePostAllStarTeamDashboard"
+    )
+    wins_losses_team_dashboard = Endpoint.DataSetProperty("WinsLossesTeamDashboard")
+
     def __init__(
         self,
         team_id,
@@ -460,26 +469,4 @@ class TeamDashboardByGeneralSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.days_rest_team_dashboard = Endpoint.DataSet(
-            data=data_sets["DaysRestTeamDashboard"]
-        )
-        self.location_team_dashboard = Endpoint.DataSet(
-            data=data_sets["LocationTeamDashboard"]
-        )
-        self.month_team_dashboard = Endpoint.DataSet(
-            data=data_sets["MonthTeamDashboard"]
-        )
-        self.overall_team_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallTeamDashboard"]
-        )
-        self.pre_post_all_star_team_dashboard = Endpoint.DataSet(
-            data=data_sets["PrePostAllStarTeamDashboard"]
-        )
-        self.wins_losses_team_dashboard = Endpoint.DataSet(
-            data=data_sets["WinsLossesTeamDashboard"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
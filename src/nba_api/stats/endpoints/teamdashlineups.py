@@ -150,6 +150,9 @@ class TeamDashLineups(Endpoint):
     team_stats = None
     headers = None
 
+    lineups = Endpoint.DataSetProperty("Lineups")
+    overall = Endpoint.DataSetProperty("Overall")
+
     def __init__(
         self,
         team_id,
@@ -227,10 +230,4 @@ class TeamDashLineups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.lineups = Endpoint.DataSet(data=data_sets["Lineups"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
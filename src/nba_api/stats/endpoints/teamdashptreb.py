@@ -122,6 +122,12 @@ class TeamDashPtReb(Endpoint):
     team_stats = None
     headers = None
 
+    num_contested_rebounding = Endpoint.DataSetProperty("NumContestedRebounding")
+    overall_rebounding = Endpoint.DataSetProperty("OverallRebounding")
+    reb_distance_rebounding = Endpoint.DataSetProperty("RebDistanceRebounding")
+    shot_distance_rebounding = Endpoint.DataSetProperty("ShotDistanceRebounding")
+    shot_type_rebounding = Endpoint.DataSetProperty("ShotTypeRebounding")
+
     def __init__(
         self,
         team_id,
@@ -183,21 +189,4 @@ class TeamDashPtReb(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.num_contested_rebounding = Endpoint.DataSet(
-            data=data_sets["NumContestedRebounding"]
-        )
-        self.overall_rebounding = Endpoint.DataSet(data=data_sets["OverallRebounding"])
-        self.reb_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["RebDistanceRebounding"]
-        )
-        self.shot_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotDistanceRebounding"]
-        )
-        self.shot_type_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotTypeRebounding"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -46,6 +46,8 @@ class TeamEstimatedMetrics(Endpoint):
     team_stats = None
     headers = None
 
+    team_estimated_metrics = Endpoint.DataSetProperty("TeamEstimatedMetrics")
+
     def __init__(
         self,
         league_id=LeagueID.default,
@@ -79,11 +81,4 @@ class TeamEstimatedMetrics(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_estimated_metrics = Endpoint.DataSet(
-            data=data_sets["TeamEstimatedMetrics"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -43,6 +43,8 @@ class TeamGameLog(Endpoint):
     team_stats = None
     headers = None
 
+    team_game_log = Endpoint.DataSetProperty("TeamGameLog")
+
     def __init__(
         self,
         team_id,
@@ -82,9 +84,4 @@ class TeamGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_log = Endpoint.DataSet(data=data_sets["TeamGameLog"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -87,6 +87,8 @@ class TeamGameLogs(Endpoint):
     team_stats = None
     headers = None
 
+    team_game_logs = Endpoint.DataSetProperty("TeamGameLogs")
+
     def __init__(
         self,
         date_from_nullable="",
@@ -156,9 +158,4 @@ class TeamGameLogs(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_logs = Endpoint.DataSet(data=data_sets["TeamGameLogs"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
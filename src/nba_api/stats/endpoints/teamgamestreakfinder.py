@@ -36,6 +36,10 @@ class TeamGameStreakFinder(Endpoint):
     team_stats = None
     headers = None
 
+    team_game_streak_finder_parameters_results = Endpoint.DataSetProperty(
+        "TeamGameStreakFinderParametersResults"
+    )
+
     def __init__(
         self,
         active_streaks_only_nullable="",
@@ -439,11 +443,4 @@ class TeamGameStreakFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_streak_finder_parameters_results = Endpoint.DataSet(
-            data=data_sets["TeamGameStreakFinderParametersResults"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -33,6 +33,8 @@ class TeamHistoricalLeaders(Endpoint):
     team_stats = None
     headers = None
 
+    career_leaders_by_team = Endpoint.DataSetProperty("CareerLeadersByTeam")
+
     def __init__(
         self,
         team_id,
@@ -66,11 +68,4 @@ class TeamHistoricalLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_leaders_by_team = Endpoint.DataSet(
-            data=data_sets["CareerLeadersByTeam"]
-        )
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -49,6 +49,10 @@ class TeamInfoCommon(Endpoint):
     team_stats = None
     headers = None
 
+    available_seasons = Endpoint.DataSetProperty("AvailableSeasons")
+    team_info_common = Endpoint.DataSetProperty("TeamInfoCommon")
+    team_season_ranks = Endpoint.DataSetProperty("TeamSeasonRanks")
+
     def __init__(
         self,
         team_id,
@@ -84,11 +88,4 @@ class TeamInfoCommon(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
-        self.team_info_common = Endpoint.DataSet(data=data_sets["TeamInfoCommon"])
-        self.team_season_ranks = Endpoint.DataSet(data=data_sets["TeamSeasonRanks"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -154,6 +154,9 @@ class TeamPlayerDashboard(Endpoint):
     team_stats = None
     headers = None
 
+    players_season_totals = Endpoint.DataSetProperty("PlayersSeasonTotals")
+    team_overall = Endpoint.DataSetProperty("TeamOverall")
+
     def __init__(
         self,
         team_id,
@@ -227,12 +230,4 @@ class TeamPlayerDashboard(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.players_season_totals = Endpoint.DataSet(
-            data=data_sets["PlayersSeasonTotals"]
-        )
-        self.team_overall = Endpoint.DataSet(data=data_sets["TeamOverall"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -304,6 +304,16 @@ class TeamVsPlayer(Endpoint):
     team_stats = None
     headers = None
 
+    on_off_court = Endpoint.DataSetProperty("OnOffCourt")
+    overall = Endpoint.DataSetProperty("Overall")
+    shot_area_off_court = Endpoint.DataSetProperty("ShotAreaOffCourt")
+    shot_area_on_court = Endpoint.DataSetProperty("ShotAreaOnCourt")
+    shot_area_overall = Endpoint.DataSetProperty("ShotAreaOverall")
+    shot_distance_off_court = Endpoint.DataSetProperty("ShotDistanceOffCourt")
+    shot_distance_on_court = Endpoint.DataSetProperty("ShotDistanceOnCourt")
+    shot_distance_overall = Endpoint.DataSetProperty("ShotDistanceOverall")
+    vs_player_overall = Endpoint.DataSetProperty("vsPlayerOverall")
+
     def __init__(
         self,
         vs_player_id,
@@ -377,23 +387,4 @@ class TeamVsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.on_off_court = Endpoint.DataSet(data=data_sets["OnOffCourt"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
-        self.shot_area_off_court = Endpoint.DataSet(data=data_sets["ShotAreaOffCourt"])
-        self.shot_area_on_court = Endpoint.DataSet(data=data_sets["ShotAreaOnCourt"])
-        self.shot_area_overall = Endpoint.DataSet(data=data_sets["ShotAreaOverall"])
-        self.shot_distance_off_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOffCourt"]
-        )
-        self.shot_distance_on_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOnCourt"]
-        )
-        self.shot_distance_overall = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOverall"]
-        )
-        self.vs_player_overall = Endpoint.DataSet(data=data_sets["vsPlayerOverall"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
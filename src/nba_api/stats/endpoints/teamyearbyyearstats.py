@@ -47,9 +47,10 @@ class TeamYearByYearStats(Endpoint):
     nba_response = None
     data_sets = None
     player_stats = None
-    team_stats = None
     headers = None
 
+    team_stats = Endpoint.DataSetProperty("TeamStats")
+
     def __init__(
         self,
         team_id,
@@ -85,9 +86,4 @@ class TeamYearByYearStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -124,8 +124,4 @@ class VideoDetailsAsset(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
@@ -41,6 +41,9 @@ class WinProbabilityPBP(Endpoint):
     team_stats = None
     headers = None
 
+    game_info = Endpoint.DataSetProperty("GameInfo")
+    win_prob_p_bp = Endpoint.DataSetProperty("WinProbPBP")
+
     def __init__(
         self,
         game_id,
@@ -69,10 +72,4 @@ class WinProbabilityPBP(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.win_prob_p_bp = Endpoint.DataSet(data=data_sets["WinProbPBP"])
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
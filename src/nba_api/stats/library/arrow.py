@@ -0,0 +1,127 @@
+import json
+import importlib.util
+import numpy as np
+
+from nba_api.stats.library import schema
+from nba_api.stats.library.columns import to_array as to_column
+
+# pyarrow is imported by the first export or import; it adds noticeably to
+# the import time of every endpoint otherwise.
+PYARROW = importlib.util.find_spec("pyarrow") is not None
+pyarrow = None
+
+# Keys stored in the Arrow schema metadata of exported data sets.
+METADATA_ENDPOINT = b"nba_api.endpoint"
+METADATA_NAME = b"nba_api.data_set"
+METADATA_INDEX = b"nba_api.index"
+METADATA_PARAMETERS = b"nba_api.parameters"
+
+NUMERIC_DTYPES = frozenset([schema.INT16, schema.INT32, "int64", schema.FLOAT64])
+
+
+def require_pyarrow():
+    global pyarrow
+    if not PYARROW:
+        raise Exception("Import Missing - Failed to import pyarrow.")
+    if pyarrow is None:
+        importlib.import_module("pyarrow.parquet")
+        pyarrow = importlib.import_module("pyarrow")
+    return pyarrow
+
+
+def _to_numbers(name, values, dtype):
+    # The schema registry's dtype alone decides the Arrow type, so every
+    # snapshot of a data set has the same schema; NaN is a JSON null.
+    arrow_type = pyarrow.float64() if dtype == schema.FLOAT64 else pyarrow.int64()
+    if all(value is None for value in values):
+        return pyarrow.array(values, type=arrow_type)
+    array = to_column(values)
+    if array.dtype.kind not in "iuf":
+        raise ValueError("Column {} mixes numbers with other values.".format(name))
+    if array.dtype.kind == "f" and arrow_type == pyarrow.int64():
+        present = array[~np.isnan(array)]
+        if not np.array_equal(present, np.round(present)):
+            raise ValueError(
+                "Column {} has fractional values but its schema is {}; override it "
+                "with schema.registry.set_dtype(..., schema.FLOAT64).".format(name, dtype)
+            )
+    return pyarrow.array(array, type=arrow_type, from_pandas=True)
+
+
+def to_array(name, values, dtype=None):
+    """
+    Converts one column's values (a list from the rowSet) to an Arrow array
+    of the type its schema registry dtype names: string for STRING, a
+    dictionary of strings for CATEGORY, nullable int64 for the integer dtypes
+    and float64 for FLOAT64. Other columns are inferred, so integers with
+    nulls stay int64. Raises ValueError for a column that mixes value types
+    or does not fit its dtype.
+    """
+    require_pyarrow()
+    if dtype in NUMERIC_DTYPES:
+        return _to_numbers(name, values, dtype)
+    if dtype == schema.STRING:
+        values = schema.apply_dtype(name, to_column(values), dtype)
+    try:
+        if dtype == schema.CATEGORY:
+            return pyarrow.array(values, type=pyarrow.string()).dictionary_encode()
+        if dtype == schema.STRING:
+            return pyarrow.array(values, type=pyarrow.string())
+        return pyarrow.array(values, from_pandas=True)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+        raise ValueError("Column {} mixes value types: {}".format(name, e))
+
+
+def to_table(columns, metadata=None, dtypes=None):
+    """
+    Builds an Arrow table from a DataSet's columns (name -> list of values),
+    typing each column from dtypes ({name: schema registry dtype}).
+    """
+    require_pyarrow()
+    names = list(columns)
+    if any(not isinstance(name, str) for name in names):
+        raise ValueError("Only data sets with single-level headers can be exported.")
+    dtypes = dtypes or {}
+    arrays = [to_array(name, columns[name], dtypes.get(name)) for name in names]
+    return pyarrow.Table.from_arrays(arrays, names=names, metadata=metadata)
+
+
+def from_table(table):
+    """
+    Returns the {"headers": ..., "data": ...} dict of a DataSet from an Arrow table.
+    """
+    columns = table.to_pydict()
+    return {
+        "headers": list(columns),
+        "data": [list(row) for row in zip(*columns.values())],
+    }
+
+
+def to_numpy(column):
+    """
+    Returns one column of an Arrow table as the NumPy array a rowSet column
+    would give (nulls as NaN in numeric columns, None in object ones).
+    """
+    if pyarrow.types.is_dictionary(column.type):
+        # Dictionary columns convert index by index, so decode them first.
+        column = column.cast(column.type.value_type)
+    return column.to_numpy()
+
+
+def get_metadata(endpoint, name, index, parameters):
+    return {
+        METADATA_ENDPOINT: endpoint,
+        METADATA_NAME: name,
+        METADATA_INDEX: str(index),
+        METADATA_PARAMETERS: json.dumps(parameters, default=str),
+    }
+
+
+def write_parquet(table, path, compression="zstd"):
+    require_pyarrow()
+    pyarrow.parquet.write_table(table, path, compression=compression)
+
+
+def read_parquet(path, memory_map=True):
+    require_pyarrow()
+    return pyarrow.parquet.read_table(path, memory_map=memory_map)
@@ -0,0 +1,81 @@
+import numpy as np
+
+from operator import itemgetter
+
+# Python value types that map onto a fixed-width NumPy dtype.
+_NUMERIC_DTYPES = {
+    frozenset([bool]): np.bool_,
+    frozenset([int]): np.int64,
+    frozenset([float]): np.float64,
+    frozenset([int, float]): np.float64,
+    frozenset([int, type(None)]): np.float64,
+    frozenset([float, type(None)]): np.float64,
+    frozenset([int, float, type(None)]): np.float64,
+}
+
+
+def to_array(values):
+    """
+    Converts one column of a rowSet to a typed array: bool, int64 or float64
+    (None becoming NaN) when every value allows it, otherwise object.
+    """
+    dtype = _NUMERIC_DTYPES.get(frozenset(map(type, values)), object)
+    if dtype is not object:
+        try:
+            return np.array(values, dtype=dtype)
+        except OverflowError:
+            pass
+    # fromiter keeps nested lists as elements instead of broadcasting them.
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def get_unique_names(names):
+    """
+    Returns the column names with repeated headers suffixed by their
+    occurrence ("PTS", "PTS" -> "PTS", "PTS_1"), so every column keeps its
+    own key. For multi-level (tuple) names the last level is suffixed.
+    """
+    seen = set(names)
+    counts = {}
+    unique = []
+    for name in names:
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        if count:
+            while True:
+                if isinstance(name, tuple):
+                    candidate = name[:-1] + ("{}_{}".format(name[-1], count),)
+                else:
+                    candidate = "{}_{}".format(name, count)
+                if candidate not in seen:
+                    break
+                count += 1
+            seen.add(candidate)
+            name = candidate
+        unique.append(name)
+    return unique
+
+
+def transpose(headers, rows):
+    """
+    Transposes a rowSet into one list of values per header, in header order.
+    Returns None when the rows do not line up with the headers.
+    """
+    width = len(headers)
+    if any(len(row) != width for row in rows):
+        return None
+    # One pass per column; zip(*rows) would build a huge argument tuple.
+    return [list(map(itemgetter(i), rows)) for i in range(width)]
+
+
+def to_columns(headers, rows):
+    """
+    Transposes a rowSet into one typed array per header, in header order.
+    Returns None when the rows do not line up with the headers.
+    """
+    values = transpose(headers, rows)
+    if values is None:
+        return None
+    if not rows:
+        return [np.empty(0, dtype=object) for _ in headers]
+    return [to_array(column) for column in values]
@@ -45,6 +45,8 @@ except ImportError:
         "Cache-Control": "no-cache",
     }
 
+ERROR_MESSAGE = b'{"Message":"An error has occurred."}'
+
 
 class NBAStatsParser:
     def __init__(self, nba_dict):
@@ -77,13 +79,7 @@ class NBAStatsResponse(http.NBAResponse):
                 headers = result["headers"]
                 row_set = result["rowSet"]
 
-                rows = []
-                for raw_row in row_set:
-                    row = {}
-                    for i in range(len(headers)):
-                        row[headers[i]] = raw_row[i]
-                    rows.append(row)
-                data[name] = rows
+                data[name] = [dict(zip(headers, raw_row)) for raw_row in row_set]
 
         return data
 
@@ -91,15 +87,18 @@ class NBAStatsResponse(http.NBAResponse):
         return json.dumps(self.get_normalized_dict())
 
     def get_parameters(self):
-        if not self.valid_json() or "parameters" not in self.get_dict():
+        if not self.valid_json():
+            return None
+        raw_dict = self.get_dict()
+        if "parameters" not in raw_dict:
             return None
 
-        parameters = self.get_dict()["parameters"]
+        parameters = raw_dict["parameters"]
         if isinstance(parameters, dict):
             return parameters
 
         parameters = {}
-        for parameter in self.get_dict()["parameters"]:
+        for parameter in raw_dict["parameters"]:
             for key, value in parameter.items():
                 parameters.update({key: value})
         return parameters
@@ -149,7 +148,7 @@ class NBAStatsResponse(http.NBAResponse):
             }
         else:
             # Process Tabular Json
-            self.parser = NBAStatsParser(nba_dict=self.get_dict())
+            self.parser = NBAStatsParser(nba_dict=raw_dict)
             endpoint_parser = self.parser.change_parser(endpoint)
             return endpoint_parser.get_data_sets()
 
@@ -162,6 +161,7 @@ class NBAStatsHTTP(http.NBAHTTP):
     headers = STATS_HEADERS
 
     def clean_contents(self, contents):
-        if '{"Message":"An error has occurred."}' in contents:
-            return "<Error><Message>An error has occurred.</Message></Error>"
+        # The error payload is the whole body, so only the head needs checking.
+        if ERROR_MESSAGE in contents[:256]:
+            return b"<Error><Message>An error has occurred.</Message></Error>"
         return contents
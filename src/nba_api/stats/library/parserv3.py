@@ -1,63 +1,80 @@
+from operator import itemgetter
+
+
+def _first(records):
+    return records[0] if records else {}
+
+
+class FlatSpec:
+    """
+    The keys one level of a nested V3 record contributes to a flattened row,
+    taken once from a sample record, and a picker returning their values from
+    any record of that level. Levels that keep every key take the values in
+    the record's own order; the others select the keys in header order, with
+    None for keys a record lacks.
+    """
+
+    __slots__ = ("keys", "pick", "_getter")
+
+    def __init__(self, record, exclude=()):
+        self.keys = tuple(key for key in record if key not in exclude)
+        if len(self.keys) == len(record):
+            self.pick = dict.values
+            return
+        if not self.keys:
+            self._getter = lambda record: ()
+        elif len(self.keys) == 1:
+            key = self.keys[0]
+            self._getter = lambda record: (record[key],)
+        else:
+            self._getter = itemgetter(*self.keys)
+        self.pick = self._pick
+
+    def _pick(self, record):
+        try:
+            return self._getter(record)
+        except KeyError:
+            return tuple(record.get(key) for key in self.keys)
+
+
 class NBAStatsBoxscoreParserV3:
+    # Team keys that are not columns of the team rows.
+    team_exclude = ("players", "statistics")
+
     def __init__(self, nba_dict):
         self.nba_dict = nba_dict
+        self._spec = None
+
+    def get_spec(self):
+        if self._spec is None:
+            self._spec = self.compile_spec()
+        return self._spec
+
+    def compile_spec(self):
+        root = self.nba_dict[list(self.nba_dict.keys())[1]]
+        team = root["homeTeam"]
+        player = _first(team["players"])
+        return {
+            "root": root,
+            "game": ("gameId",) if "gameId" in root else (),
+            "team": FlatSpec(team, self.team_exclude),
+            "team_stats": FlatSpec(team.get("statistics") or {}),
+            "player": FlatSpec(player, ("statistics",)),
+            "player_stats": FlatSpec(player.get("statistics") or {}),
+        }
 
-    def get_team_headers(self, headers=tuple(), level=0):
-        if level == 0:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
-            headers = headers + tuple(
-                [header for header in tmp.keys() if header == "gameId"]
-            )
-            return self.get_team_headers(headers, level=1)
-        elif level == 1:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]
-            headers = headers + tuple(
-                [
-                    header
-                    for header in tmp.keys()
-                    if header not in ("players", "statistics")
-                ]
-            )
-            return self.get_team_headers(headers, level=2)
-        else:
-            try:
-                tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"][
-                    "statistics"
-                ]
-            except KeyError:
-                return list(headers)
-            headers = headers + tuple([header for header in tmp.keys()])
-            return list(headers)
-
-    def get_players_headers(self, headers=tuple(), level=0):
-        if level == 0:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
-            headers = headers + tuple(
-                [header for header in tmp.keys() if header == "gameId"]
-            )
-            return self.get_players_headers(headers, level=1)
-        elif level == 1:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]
-            headers = headers + tuple(
-                [
-                    header
-                    for header in tmp.keys()
-                    if header not in ("players", "statistics")
-                ]
-            )
-            return self.get_players_headers(headers, level=2)
-        elif level == 2:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]["players"][0]
-            headers = headers + tuple(
-                [header for header in tmp.keys() if header != "statistics"]
-            )
-            return self.get_players_headers(headers, level=3)
-        else:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]["players"][
-                0
-            ]["statistics"]
-            headers = headers + tuple([header for header in tmp.keys()])
-            return list(headers)
+    def get_team_headers(self):
+        spec = self.get_spec()
+        return list(spec["game"] + spec["team"].keys + spec["team_stats"].keys)
+
+    def get_players_headers(self):
+        spec = self.get_spec()
+        return list(
+            spec["game"]
+            + spec["team"].keys
+            + spec["player"].keys
+            + spec["player_stats"].keys
+        )
 
     def get_data_sets(self):
         results = {"PlayerStats": None, "TeamStats": None}
@@ -70,64 +87,34 @@ class NBAStatsBoxscoreParserV3:
         return results
 
     def get_team_data(self):
-        raw_dict = self.nba_dict[list(self.nba_dict.keys())[1]]
-        home_team_info = [
-            value
-            for key, value in raw_dict["homeTeam"].items()
-            if key not in ("players", "statistics")
-        ]
-        home_team_stats = [x for x in raw_dict["homeTeam"]["statistics"].values()]
-
-        away_team_info = [
-            value
-            for key, value in raw_dict["awayTeam"].items()
-            if key not in ("players", "statistics")
-        ]
-        away_team_stats = [x for x in raw_dict["awayTeam"]["statistics"].values()]
+        spec = self.get_spec()
+        root = spec["root"]
+        team_pick, stats_pick = spec["team"].pick, spec["team_stats"].pick
         return [
-            [raw_dict["gameId"]] + home_team_info + home_team_stats,
-            [raw_dict["gameId"]] + away_team_info + away_team_stats,
+            [root["gameId"], *team_pick(team), *stats_pick(team["statistics"])]
+            for team in (root["homeTeam"], root["awayTeam"])
         ]
 
     def get_player_data(self):
-        raw_dict = self.nba_dict[list(self.nba_dict.keys())[1]]
-        game_id = [raw_dict["gameId"]]
+        spec = self.get_spec()
+        root = spec["root"]
+        team_pick = spec["team"].pick
+        player_pick, stats_pick = spec["player"].pick, spec["player_stats"].pick
         data = []
-        for team in ["awayTeam", "homeTeam"]:
-            team_info = [
-                [
-                    value
-                    for key, value in raw_dict[team].items()
-                    if key not in ("players", "statistics")
-                ]
-            ]
-            n_pl = len(raw_dict[team]["players"])
-            play_info = [
-                [
-                    value
-                    for key, value in raw_dict[team]["players"][i].items()
-                    if key != "statistics"
-                ]
-                for i in range(len(raw_dict[team]["players"]))
-            ]
-            play_stats = [
+        for team in (root["awayTeam"], root["homeTeam"]):
+            team_info = (root["gameId"], *team_pick(team))
+            data.extend(
                 [
-                    value
-                    for key, value in raw_dict[team]["players"][i]["statistics"].items()
+                    [*team_info, *player_pick(player), *stats_pick(player["statistics"])]
+                    for player in team["players"]
                 ]
-                for i in range(len(raw_dict[team]["players"]))
-            ]
-            stats = [
-                [x, *y, *z, *w]
-                for x, y, z, w in zip(
-                    game_id * n_pl, team_info * n_pl, play_info, play_stats
-                )
-            ]
-            data = data + stats
+            )
         return data
 
 
 class NBAStatsBoxscoreTraditionalParserV3(NBAStatsBoxscoreParserV3):
+    team_exclude = ("players", "statistics", "starters", "bench")
+
     def __init__(self, nba_dict):
         super().__init__(nba_dict)
 
@@ -135,49 +122,17 @@ class NBAStatsBoxscoreTraditionalParserV3(NBAStatsBoxscoreParserV3):
         return self.get_team_headers() + ["startersBench"]
 
     def get_start_bench_data(self):
-        raw_dict = self.nba_dict[list(self.nba_dict.keys())[1]]
-        home_team_info = [
-            value
-            for key, value in raw_dict["homeTeam"].items()
-            if key not in ("players", "statistics", "starters", "bench")
-        ]
-        home_team_starter = raw_dict["homeTeam"]["starters"]
-        home_team_bench = raw_dict["homeTeam"]["bench"]
-        home_team_starter_stats = (
-            [x for x in home_team_starter.values()] + ["Starters"]
-            if home_team_starter is not None
-            else ["Starters"]
-        )
-        home_team_bench_stats = (
-            [x for x in home_team_bench.values()] + ["Bench"]
-            if home_team_bench is not None
-            else ["Bench"]
-        )
-
-        away_team_info = [
-            value
-            for key, value in raw_dict["awayTeam"].items()
-            if key not in ("players", "statistics", "starters", "bench")
-        ]
-        away_team_starter = raw_dict["awayTeam"]["starters"]
-        away_team_bench = raw_dict["awayTeam"]["bench"]
-        away_team_starter_stats = (
-            [x for x in away_team_starter.values()] + ["Starters"]
-            if away_team_starter is not None
-            else ["Starters"]
-        )
-        away_team_bench_stats = (
-            [x for x in away_team_bench.values()] + ["Bench"]
-            if away_team_bench is not None
-            else ["Bench"]
-        )
-
-        return [
-            [raw_dict["gameId"]] + home_team_info + home_team_starter_stats,
-            [raw_dict["gameId"]] + home_team_info + home_team_bench_stats,
-            [raw_dict["gameId"]] + away_team_info + away_team_starter_stats,
-            [raw_dict["gameId"]] + away_team_info + away_team_bench_stats,
-        ]
+        spec = self.get_spec()
+        root = spec["root"]
+        team_pick = spec["team"].pick
+        data = []
+        for team in (root["homeTeam"], root["awayTeam"]):
+            team_info = [root["gameId"], *team_pick(team)]
+            for group, label in (("starters", "Starters"), ("bench", "Bench")):
+                stats = team[group]
+                values = list(stats.values()) if stats is not None else []
+                data.append(team_info + values + [label])
+        return data
 
     def get_data_sets(self):
         results = {
@@ -185,23 +140,15 @@ class NBAStatsBoxscoreTraditionalParserV3(NBAStatsBoxscoreParserV3):
             "TeamStarterBenchStats": None,
             "TeamStats": None,
         }
-        team_head = [
-            x for x in self.get_team_headers() if x not in ("starters", "bench")
-        ]
+        team_head = self.get_team_headers()
         player_head = [
             x for x in self.get_players_headers() if x not in ("starters", "bench")
         ]
         start_bench_head = [
-            x
-            for x in self.get_start_bench_headers()
-            if x not in ("starters", "bench", "plusMinusPoints")
-        ]
-        team_data = [
-            [y for y in x if not isinstance(y, dict)] for x in self.get_team_data()
-        ]
-        pl_data = [
-            [y for y in x if not isinstance(y, dict)] for x in self.get_player_data()
+            x for x in self.get_start_bench_headers() if x != "plusMinusPoints"
         ]
+        team_data = self.get_team_data()
+        pl_data = self.get_player_data()
         start_bench_data = self.get_start_bench_data()
         results["TeamStats"] = {"headers": team_head, "data": team_data}
         results["PlayerStats"] = {"headers": player_head, "data": pl_data}
@@ -215,68 +162,56 @@ class NBAStatsBoxscoreTraditionalParserV3(NBAStatsBoxscoreParserV3):
 class NBAStatsBoxscoreMatchupsParserV3:
     def __init__(self, nba_dict):
         self.nba_dict = nba_dict
+        self._spec = None
+
+    def get_spec(self):
+        if self._spec is None:
+            self._spec = self.compile_spec()
+        return self._spec
+
+    def compile_spec(self):
+        root = self.nba_dict[list(self.nba_dict.keys())[1]]
+        team = root["homeTeam"]
+        player = _first(team["players"])
+        matchup = _first(player.get("matchups"))
+        return {
+            "root": root,
+            "game": ("gameId",) if "gameId" in root else (),
+            "team": FlatSpec(team, ("players", "statistics")),
+            "player": FlatSpec(player, ("matchups",)),
+            "matchup": FlatSpec(matchup, ("statistics",)),
+            "matchup_stats": FlatSpec(matchup.get("statistics") or {}),
+        }
 
-    def get_players_headers(self, headers=tuple(), level=0):
-        if level == 0:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
-            headers = headers + tuple(
-                [header for header in tmp.keys() if header == "gameId"]
-            )
-            return self.get_players_headers(headers, level=1)
-        elif level == 1:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]
-            headers = headers + tuple(
-                [
-                    header
-                    for header in tmp.keys()
-                    if header not in ("players", "statistics")
-                ]
-            )
-            return self.get_players_headers(headers, level=2)
-        elif level == 2:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]["players"][0]
-            headers = headers + tuple(
-                [header + "Off" for header in tmp.keys() if header != "matchups"]
-            )
-            return self.get_players_headers(headers, level=3)
-        elif level == 3:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]["players"][
-                0
-            ]["matchups"][0]
-            headers = headers + tuple(
-                [header + "Def" for header in tmp.keys() if header != "statistics"]
-            )
-            return self.get_players_headers(headers, level=4)
-        else:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["homeTeam"]["players"][
-                0
-            ]["matchups"][0]["statistics"]
-            headers = headers + tuple([header for header in tmp.keys()])
-            return list(headers)
+    def get_players_headers(self):
+        spec = self.get_spec()
+        return (
+            list(spec["game"] + spec["team"].keys)
+            + [header + "Off" for header in spec["player"].keys]
+            + [header + "Def" for header in spec["matchup"].keys]
+            + list(spec["matchup_stats"].keys)
+        )
 
     def get_player_data(self):
-        tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
+        spec = self.get_spec()
+        root = spec["root"]
+        team_pick, player_pick = spec["team"].pick, spec["player"].pick
+        matchup_pick, stats_pick = spec["matchup"].pick, spec["matchup_stats"].pick
         pl_data = []
-        for team in ["homeTeam", "awayTeam"]:
-            team_info = [tmp["gameId"]] + [
-                value for key, value in tmp[team].items() if key != "players"
-            ]
-            for i, def_pl in enumerate(tmp[team]["players"]):
-                for j, off_pl in enumerate(tmp[team]["players"][i]["matchups"]):
-                    def_data = [
-                        value
-                        for key, value in tmp[team]["players"][i].items()
-                        if key != "matchups"
-                    ]
-                    off_data = [
-                        value
-                        for key, value in tmp[team]["players"][i]["matchups"][j].items()
-                        if key != "statistics"
+        for team in (root["homeTeam"], root["awayTeam"]):
+            team_info = (root["gameId"], *team_pick(team))
+            for player in team["players"]:
+                player_info = (*team_info, *player_pick(player))
+                pl_data.extend(
+                    [
+                        [
+                            *player_info,
+                            *matchup_pick(matchup),
+                            *stats_pick(matchup["statistics"]),
+                        ]
+                        for matchup in player["matchups"]
                     ]
-                    off_stats = list(
-                        tmp[team]["players"][i]["matchups"][j]["statistics"].values()
-                    )
-                    pl_data.append(team_info + def_data + off_data + off_stats)
+                )
         return pl_data
 
     def get_data_sets(self):
@@ -290,30 +225,37 @@ class NBAStatsBoxscoreMatchupsParserV3:
 class NBAStatsPlayByPlayParserV3:
     def __init__(self, nba_dict):
         self.nba_dict = nba_dict
+        self._spec = None
+
+    def get_spec(self):
+        if self._spec is None:
+            self._spec = self.compile_spec()
+        return self._spec
+
+    def compile_spec(self):
+        root = self.nba_dict[list(self.nba_dict.keys())[1]]
+        return {
+            "root": root,
+            "game": ("gameId",) if "gameId" in root else (),
+            "action": FlatSpec(_first(root["actions"])),
+        }
 
-    def get_playbyplay_headers(self, headers=tuple(), level=0):
-        if level == 0:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
-            headers = headers + tuple(
-                [header for header in tmp.keys() if header == "gameId"]
-            )
-            return self.get_playbyplay_headers(headers, level=1)
-        else:
-            tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["actions"][0]
-            headers = headers + tuple([header for header in tmp.keys()])
-            return headers
+    def get_playbyplay_headers(self):
+        spec = self.get_spec()
+        return spec["game"] + spec["action"].keys
 
     def get_playbyplay_data(self):
-        return [
-            [self.nba_dict["game"]["gameId"]] + list(x.values())
-            for x in self.nba_dict["game"]["actions"]
-        ]
+        spec = self.get_spec()
+        root = spec["root"]
+        game_id = root["gameId"]
+        action_pick = spec["action"].pick
+        return [[game_id, *action_pick(action)] for action in root["actions"]]
 
     def get_videoavailable_headers(self):
         return "videoAvailable"
 
     def get_videoavailable_data(self):
-        return self.nba_dict[list(self.nba_dict.keys())[1]]["videoAvailable"]
+        return self.get_spec()["root"]["videoAvailable"]
 
     def get_data_sets(self):
         results = {"PlayByPlay": None, "AvailableVideo": None}
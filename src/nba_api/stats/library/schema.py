@@ -0,0 +1,200 @@
+import re
+import json
+import importlib.util
+
+import numpy as np
+
+# pandas is imported when a dtype first needs it (nullable integers,
+# categoricals); it dominates the import time of every endpoint otherwise.
+PANDAS = importlib.util.find_spec("pandas") is not None
+pandas = None
+
+
+def _import_pandas():
+    global pandas
+    if pandas is None:
+        pandas = importlib.import_module("pandas")
+    return pandas
+
+
+STRING = "string"
+CATEGORY = "category"
+INT16 = "int16"
+INT32 = "int32"
+FLOAT64 = "float64"
+
+# Integer widths tried, smallest first, when a column's values do not fit the
+# dtype its schema asks for (e.g. career point totals in an int16 column).
+_INT_WIDTHS = (INT16, INT32, "int64")
+
+# Zero-padded identifiers that the API occasionally returns as numbers.
+ID_WIDTHS = {"GAME_ID": 10, "SEASON_ID": 5, "LEAGUE_ID": 2}
+
+# Counting stats, legacy and V3 (normalized) names.
+COUNT_COLUMNS = frozenset(
+    """
+    AST ASSISTS BLK BLKA BLOCKS BLOCKS_RECEIVED DD2 DREB EVENTMSGACTIONTYPE
+    EVENTMSGTYPE EVENTNUM FG2A FG2M FG3A FG3M FGA FGM FIELD_GOALS_ATTEMPTED
+    FIELD_GOALS_MADE FOULS_PERSONAL FREE_THROWS_ATTEMPTED FREE_THROWS_MADE FTA
+    FTM G GP GS L LOSSES OREB PERIOD PF PFD PLUS_MINUS PLUS_MINUS_POINTS POINTS
+    PTS REB REBOUNDS_DEFENSIVE REBOUNDS_OFFENSIVE REBOUNDS_TOTAL STEALS STL TD3
+    THREE_POINTERS_ATTEMPTED THREE_POINTERS_MADE TOV TURNOVERS W WINS
+    """.split()
+)
+
+# (pattern, dtype) pairs matched in order against the normalized column name.
+COLUMN_RULES = (
+    (re.compile(r"(^|_)GAME_ID$|^SEASON_ID$|^LEAGUE_ID$"), STRING),
+    (re.compile(r"(^|_)(ABBREVIATION|TRICODE)$|^WL$"), CATEGORY),
+    (re.compile(r"^PTS_(QTR|OT)\d+$|_RANK$|^RANK_"), INT16),
+    (re.compile(r"(^|_)(PERSON|PLAYER|TEAM)_ID$"), INT32),
+)
+
+# Data sets whose counting stats are always averages (e.g. career per-game
+# headline stats), as (endpoint, data set).
+AVERAGE_DATA_SETS = frozenset([("commonplayerinfo", "PlayerHeadlineStats")])
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def normalize_column(column):
+    """
+    Maps V3 camelCase headers onto the legacy UPPER_SNAKE names, e.g.
+    teamTricode -> TEAM_TRICODE.
+    """
+    return _CAMEL_BOUNDARY.sub("_", column).upper()
+
+
+class SchemaRegistry:
+    """
+    Column dtypes per endpoint and data set. Dtypes come from name-based rules
+    (COUNT_COLUMNS and COLUMN_RULES) unless overridden for a specific endpoint
+    and data set with set_dtype(); None leaves a column as inferred. Counts
+    are FLOAT64 in AVERAGE_DATA_SETS and for requests with a PerMode other
+    than Totals.
+    """
+
+    def __init__(
+        self,
+        rules=COLUMN_RULES,
+        count_columns=COUNT_COLUMNS,
+        average_data_sets=AVERAGE_DATA_SETS,
+    ):
+        self.rules = tuple(rules)
+        self.count_columns = frozenset(count_columns)
+        self.average_data_sets = frozenset(average_data_sets)
+        self._overrides = {}
+
+    def set_dtype(self, endpoint, data_set, column, dtype):
+        self._overrides[(endpoint.lower(), data_set, column)] = dtype
+
+    def get_column_dtype(self, column):
+        name = normalize_column(column)
+        if name in self.count_columns:
+            return INT16
+        for pattern, dtype in self.rules:
+            if pattern.search(name):
+                return dtype
+        return None
+
+    def get_schema(self, endpoint, data_set, columns, parameters=None):
+        """
+        Returns {column: dtype}; parameters are the request's, which decide
+        whether counts are totals or averages.
+        """
+        endpoint = (endpoint or "").lower()
+        averages = (endpoint, data_set) in self.average_data_sets or (
+            (parameters or {}).get("PerMode") or "Totals"
+        ) != "Totals"
+        schema = {}
+        for column in columns:
+            key = (endpoint, data_set, column)
+            if key in self._overrides:
+                dtype = self._overrides[key]
+            else:
+                dtype = self.get_column_dtype(column)
+                if averages and dtype == INT16 and normalize_column(column) in self.count_columns:
+                    dtype = FLOAT64
+            if dtype is not None:
+                schema[column] = dtype
+        return schema
+
+    def get_endpoint_schema(self, endpoint, expected_data):
+        """
+        Returns {data_set: {column: dtype}} for an endpoint's expected_data.
+        """
+        return {
+            data_set: self.get_schema(endpoint, data_set, columns)
+            for data_set, columns in expected_data.items()
+            if columns and all(isinstance(column, str) for column in columns)
+        }
+
+    def load_analysis(self, path):
+        """
+        Returns the schema of every endpoint in an endpoint analysis file
+        (analysis_archive/stats/analysis.json).
+        """
+        with open(path) as f:
+            analysis = json.load(f)
+        return {
+            endpoint: self.get_endpoint_schema(endpoint, details["data_sets"])
+            for endpoint, details in analysis.items()
+            if details.get("data_sets")
+        }
+
+
+registry = SchemaRegistry()
+
+
+def _to_strings(column, values):
+    if values.dtype == object and set(map(type, values)) <= {str, type(None)}:
+        return values
+    width = ID_WIDTHS.get(normalize_column(column))
+    strings = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        if value is None or isinstance(value, str):
+            strings[i] = value
+        elif isinstance(value, float) and value != value:
+            strings[i] = None
+        elif width is not None and isinstance(value, (int, np.integer, float)):
+            strings[i] = str(int(value)).zfill(width)
+        else:
+            strings[i] = str(value)
+    return strings
+
+
+def _to_integers(values, dtype):
+    if values.dtype.kind in "iu":
+        for width in _INT_WIDTHS[_INT_WIDTHS.index(dtype):]:
+            info = np.iinfo(width)
+            if not len(values) or (values.min() >= info.min and values.max() <= info.max):
+                return values.astype(width)
+        return values
+    if values.dtype.kind == "f" and PANDAS:
+        present = values[~np.isnan(values)]
+        if not np.array_equal(present, np.round(present)):
+            # Per-game averages and other fractional values stay float.
+            return values
+        for width in _INT_WIDTHS[_INT_WIDTHS.index(dtype):]:
+            info = np.iinfo(width)
+            if not len(present) or (present.min() >= info.min and present.max() <= info.max):
+                # Nullable integers keep the missing values.
+                return _import_pandas().array(values, dtype=width.capitalize())
+    return values
+
+
+def apply_dtype(column, values, dtype):
+    """
+    Converts one column array to the dtype its schema names. Integer
+    conversions that would lose information (fractional counts, out-of-range
+    values) are skipped and numeric identifiers are zero-padded to their width.
+    """
+    if dtype == STRING:
+        return _to_strings(column, values)
+    if dtype == CATEGORY:
+        if values.dtype == object and PANDAS:
+            return _import_pandas().Categorical(values)
+        return values
+    if dtype in _INT_WIDTHS:
+        return _to_integers(values, dtype)
+    return values.astype(dtype)
@@ -0,0 +1,101 @@
+import json
+import mmap
+import zlib
+import struct
+
+import numpy as np
+
+MAGIC = b"NBASTAT1"
+# Text columns are one zlib-compressed, newline-separated UTF-8 blob; every
+# other column is a raw little-endian array of the stored NumPy dtype.
+TEXT = "text"
+_ALIGNMENT = 8
+
+
+def _get_dtype(values):
+    if all(isinstance(value, bool) for value in values):
+        return "|b1"
+    if all(isinstance(value, int) for value in values):
+        if all(-(2**31) <= value < 2**31 for value in values):
+            return "<i4"
+        return "<i8"
+    if all(isinstance(value, str) for value in values):
+        return TEXT
+    raise ValueError("Unsupported column values: {!r}".format(values[:3]))
+
+
+def _encode_column(values):
+    dtype = _get_dtype(values)
+    if dtype != TEXT:
+        return dtype, np.asarray(values, dtype=dtype).tobytes()
+    if any("\n" in value for value in values):
+        raise ValueError("Text values may not contain newlines.")
+    return dtype, zlib.compress("\n".join(values).encode("utf-8"), 9)
+
+
+def write_static_data(path, tables, updated=None):
+    """
+    Writes tables ({name: (column_names, rows)}) column by column into one
+    binary file: a JSON header describing every column segment, then the
+    segments themselves, each 8-byte aligned so numeric columns can be mapped
+    without copying.
+    """
+    header = {"updated": updated, "tables": {}}
+    segments = []
+    offset = 0
+    for name, (column_names, rows) in tables.items():
+        columns = {}
+        for i, column in enumerate(column_names):
+            dtype, segment = _encode_column([row[i] for row in rows])
+            columns[column] = {"dtype": dtype, "offset": offset, "nbytes": len(segment)}
+            padding = -len(segment) % _ALIGNMENT
+            segments.append(segment + b"\0" * padding)
+            offset += len(segment) + padding
+        header["tables"][name] = {"rows": len(rows), "columns": columns}
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix_length = len(MAGIC) + 4 + len(header_bytes)
+    header_bytes += b" " * (-prefix_length % _ALIGNMENT)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for segment in segments:
+            f.write(segment)
+
+
+def read_static_data(path, memory_map=False):
+    """
+    Reads a file written by write_static_data(). Returns {"updated": ...,
+    "tables": {name: {column: values}}} where numeric columns are NumPy arrays
+    (views on a read-only memory map when memory_map is True) and text columns
+    are lists of str.
+    """
+    with open(path, "rb") as f:
+        if memory_map:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError("{} is not a static data file.".format(path))
+    (header_length,) = struct.unpack_from("<I", buffer, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(bytes(buffer[start: start + header_length]))
+    start += header_length
+
+    tables = {}
+    for name, table in header["tables"].items():
+        columns = {}
+        for column, spec in table["columns"].items():
+            offset = start + spec["offset"]
+            if spec["dtype"] == TEXT:
+                text = zlib.decompress(buffer[offset: offset + spec["nbytes"]]).decode("utf-8")
+                columns[column] = text.split("\n") if table["rows"] else []
+            elif not table["rows"]:
+                columns[column] = np.empty(0, dtype=spec["dtype"])
+            else:
+                columns[column] = np.frombuffer(
+                    buffer, dtype=spec["dtype"], count=table["rows"], offset=offset
+                )
+        tables[name] = columns
+    return {"updated": header["updated"], "tables": tables}
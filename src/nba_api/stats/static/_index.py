@@ -0,0 +1,111 @@
+import re
+
+from bisect import bisect_left
+
+_REGEX_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _parse_literal(pattern):
+    """
+    Splits a pattern that is a plain string, optionally anchored with ^ and/or
+    $, into (literal, anchored_start, anchored_end). Returns None for any
+    other regular expression.
+    """
+    anchored_start = pattern.startswith("^")
+    anchored_end = pattern.endswith("$")
+    literal = pattern[1 if anchored_start else 0: -1 if anchored_end else None]
+    if not literal.isascii() or _REGEX_CHARACTERS.intersection(literal):
+        return None
+    return literal.lower(), anchored_start, anchored_end
+
+
+class SearchColumn:
+    """
+    One column of a static table prepared for re.search(pattern, value, re.I)
+    lookups. Values are normalized and lowercased once. Plain-string
+    patterns are answered from a hash map (exact matches), a sorted prefix
+    index (^prefix) or a substring scan. Any other pattern, and any value that
+    is not ASCII after normalization, goes through the regex so results stay
+    identical to a full scan.
+    """
+
+    def __init__(self, values, normalize=str):
+        self.values = [normalize(str(value)) for value in values]
+        self.lowered = [value.lower() for value in self.values]
+        self.unsafe = [i for i, value in enumerate(self.values) if not value.isascii()]
+        self.exact = {}
+        for i, value in enumerate(self.lowered):
+            self.exact.setdefault(value, []).append(i)
+        ordered = sorted(range(len(self.lowered)), key=self.lowered.__getitem__)
+        self._prefix_keys = [self.lowered[i] for i in ordered]
+        self._prefix_rows = ordered
+
+    def _search_regex(self, pattern, rows):
+        regex = re.compile(pattern, flags=re.I)
+        values = self.values
+        return [i for i in rows if regex.search(values[i])]
+
+    def search(self, pattern):
+        """
+        Returns the positions of the matching values, in ascending order.
+        """
+        parsed = _parse_literal(pattern)
+        if parsed is None:
+            return self._search_regex(pattern, range(len(self.values)))
+        literal, anchored_start, anchored_end = parsed
+        lowered = self.lowered
+        if anchored_start and anchored_end:
+            rows = self.exact.get(literal, [])
+        elif anchored_start:
+            start = bisect_left(self._prefix_keys, literal)
+            end = start
+            while end < len(self._prefix_keys) and self._prefix_keys[end].startswith(literal):
+                end += 1
+            rows = self._prefix_rows[start:end]
+        elif anchored_end:
+            rows = [i for i, value in enumerate(lowered) if value.endswith(literal)]
+        else:
+            rows = [i for i, value in enumerate(lowered) if literal in value]
+        if not self.unsafe:
+            return sorted(rows)
+        unsafe = set(self.unsafe)
+        rows = [i for i in rows if i not in unsafe]
+        return sorted(rows + self._search_regex(pattern, self.unsafe))
+
+
+class StaticIndex:
+    """
+    Lazily built search columns over the rows of a static table.
+    """
+
+    def __init__(self, rows, normalize=str):
+        self.rows = rows
+        self.normalize = normalize
+        self._columns = {}
+
+    def get_column(self, column):
+        search_column = self._columns.get(column)
+        if search_column is None:
+            search_column = SearchColumn(
+                [row[column] for row in self.rows], self.normalize
+            )
+            self._columns[column] = search_column
+        return search_column
+
+    def search(self, pattern, column):
+        rows = self.rows
+        return [rows[i] for i in self.get_column(column).search(pattern)]
+
+
+_indexes = {}
+
+
+def get_index(rows, normalize=str):
+    """
+    Returns the StaticIndex of a table (a list of rows), built on first use.
+    """
+    key = (id(rows), normalize)
+    index = _indexes.get(key)
+    if index is None or index.rows is not rows:
+        index = _indexes[key] = StaticIndex(rows, normalize)
+    return index
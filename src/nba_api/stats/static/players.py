@@ -1,5 +1,4 @@
-import re
-from nba_api.stats.library.data import players, wnba_players
+from nba_api.stats.library import data
 from nba_api.stats.library.data import (
     player_index_id,
     player_index_full_name,
@@ -7,15 +6,20 @@ from nba_api.stats.library.data import (
     player_index_last_name,
     player_index_is_active,
 )
+from nba_api.stats.static._index import get_index
 import unicodedata
 
 
-def _find_players(regex_pattern, row_id, players=players):
-    players_found = []
-    for player in players:
-        if re.search(_strip_accents(regex_pattern), _strip_accents(str(player[row_id])), flags=re.I):
-            players_found.append(_get_player_dict(player))
-    return players_found
+def _find_players(regex_pattern, row_id, players=None):
+    # Same matches as re.search(pattern, value, flags=re.I) over the
+    # accent-stripped values, answered from an index built on first use.
+    if players is None:
+        players = data.players
+    index = get_index(players, normalize=_strip_accents)
+    return [
+        _get_player_dict(player)
+        for player in index.search(_strip_accents(regex_pattern), row_id)
+    ]
 
 
 def _strip_accents(inputstr: str) -> str:
@@ -28,7 +32,7 @@ def _strip_accents(inputstr: str) -> str:
     return ''.join(charx for charx in normalizedstr if unicodedata.category(charx) != 'Mn')
 
 
-def _find_player_by_id(player_id, players=players):
+def _find_player_by_id(player_id, players=None):
     regex_pattern = "^{}$".format(player_id)
     players_list = _find_players(regex_pattern, player_index_id, players=players)
     if len(players_list) > 1:
@@ -39,14 +43,18 @@ def _find_player_by_id(player_id, players=players):
         return players_list[0]
 
 
-def _get_players(players=players):
+def _get_players(players=None):
+    if players is None:
+        players = data.players
     players_list = []
     for player in players:
         players_list.append(_get_player_dict(player))
     return players_list
 
 
-def _get_active_players(players=players):
+def _get_active_players(players=None):
+    if players is None:
+        players = data.players
     players_list = []
     for player in players:
         if player[player_index_is_active]:
@@ -54,7 +62,9 @@ def _get_active_players(players=players):
     return players_list
 
 
-def _get_inactive_players(players=players):
+def _get_inactive_players(players=None):
+    if players is None:
+        players = data.players
     players_list = []
     for player in players:
         if not player[player_index_is_active]:
@@ -101,28 +111,35 @@ def get_inactive_players():
 
 
 def find_wnba_players_by_full_name(regex_pattern):
-    return _find_players(regex_pattern, player_index_full_name, players=wnba_players)
+    return _find_players(regex_pattern, player_index_full_name, players=data.wnba_players)
 
 
 def find_wnba_players_by_first_name(regex_pattern):
-    return _find_players(regex_pattern, player_index_first_name, players=wnba_players)
+    return _find_players(regex_pattern, player_index_first_name, players=data.wnba_players)
 
 
 def find_wnba_players_by_last_name(regex_pattern):
-    return _find_players(regex_pattern, player_index_last_name, players=wnba_players)
+    return _find_players(regex_pattern, player_index_last_name, players=data.wnba_players)
 
 
 def find_wnba_player_by_id(player_id):
-    return _find_player_by_id(player_id, players=wnba_players)
+    return _find_player_by_id(player_id, players=data.wnba_players)
 
 
 def get_wnba_players():
-    return _get_players(players=wnba_players)
+    return _get_players(players=data.wnba_players)
 
 
 def get_wnba_active_players():
-    return _get_active_players(players=wnba_players)
+    return _get_active_players(players=data.wnba_players)
 
 
 def get_wnba_inactive_players():
-    return _get_inactive_players(players=wnba_players)
+    return _get_inactive_players(players=data.wnba_players)
+
+
+def __getattr__(name):
+    # players and wnba_players are loaded on first use.
+    if name in data.PLAYER_TABLES:
+        return getattr(data, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
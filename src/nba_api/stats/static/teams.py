@@ -1,4 +1,3 @@
-import re
 from nba_api.stats.library.data import teams, wnba_teams
 from nba_api.stats.library.data import (
     team_index_id,
@@ -12,14 +11,16 @@ from nba_api.stats.library.data import (
     team_index_year_founded,
 )
 from nba_api.stats.library.data import team_index_championship_year
+from nba_api.stats.static._index import get_index
 
 
 def _find_teams(regex_pattern, row_id, teams=teams):
-    teams_found = []
-    for team in teams:
-        if re.search(regex_pattern, str(team[row_id]), flags=re.I):
-            teams_found.append(_get_team_dict(team))
-    return teams_found
+    # Same matches as re.search(pattern, value, flags=re.I), answered from an
+    # index built on first use.
+    return [
+        _get_team_dict(team)
+        for team in get_index(teams).search(regex_pattern, row_id)
+    ]
 
 
 def _find_team_name_by_id(team_id, teams=teams):
@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nba_api.library.bulk import fetch_many
+from nba_api.library.http import NBAHTTP
+from nba_api.stats.endpoints.playbyplayv2 import PlayByPlayV2
+
+
+class SlowEndpoint:
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def __init__(self, value, delay=0.02):
+        with self.lock:
+            SlowEndpoint.running += 1
+            SlowEndpoint.peak = max(SlowEndpoint.peak, SlowEndpoint.running)
+        try:
+            time.sleep(delay)
+            if value < 0:
+                raise ValueError(value)
+            self.value = value
+        finally:
+            with self.lock:
+                SlowEndpoint.running -= 1
+
+
+def test_fetch_many_reports_results_and_failures():
+    SlowEndpoint.peak = 0
+    kwargs = [{"value": i} for i in range(-2, 10)]
+    results = list(fetch_many(SlowEndpoint, iter(kwargs), concurrency=3))
+
+    assert sorted(result.index for result in results) == list(range(12))
+    failures = [result for result in results if not result.ok]
+    assert sorted(result.kwargs["value"] for result in failures) == [-2, -1]
+    assert all(isinstance(result.error, ValueError) for result in failures)
+    assert all(result.endpoint.value == result.kwargs["value"] for result in results if result.ok)
+    assert SlowEndpoint.peak <= 3
+
+
+def test_fetch_many_streams_in_completion_order():
+    kwargs = [{"value": 1, "delay": 0.3}, {"value": 2, "delay": 0.01}]
+    results = fetch_many(SlowEndpoint, kwargs, concurrency=2)
+    assert next(results).kwargs["value"] == 2
+    assert next(results).kwargs["value"] == 1
+
+
+def test_fetch_many_rate():
+    started = time.monotonic()
+    kwargs = [{"value": i, "delay": 0} for i in range(5)]
+    assert len(list(fetch_many(SlowEndpoint, kwargs, concurrency=5, rate=20))) == 5
+    # One immediate call, then four more at 20 per second.
+    assert time.monotonic() - started >= 0.18
+
+
+def test_fetch_many_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        list(fetch_many(SlowEndpoint, [], concurrency=0))
+
+
+def test_fetch_many_endpoints():
+    def get(url, params=None, **kwargs):
+        game_id = dict(params)["GameID"]
+        if game_id == "0022300002":
+            raise requests.exceptions.ConnectionError()
+        response = Mock()
+        response.status_code = 200
+        response.url = url
+        response.headers = {}
+        response.content = json.dumps(
+            {
+                "resultSets": [
+                    {"name": "PlayByPlay", "headers": ["GAME_ID"], "rowSet": [[game_id]]}
+                ]
+            }
+        ).encode("utf-8")
+        return response
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = get
+    NBAHTTP.set_session(session)
+    try:
+        results = list(
+            fetch_many(
+                PlayByPlayV2,
+                ({"game_id": "00223{:05d}".format(i)} for i in range(1, 5)),
+                concurrency=2,
+            )
+        )
+    finally:
+        NBAHTTP._session = None
+
+    loaded = {
+        result.kwargs["game_id"]: result.endpoint.play_by_play.get_dict()["data"]
+        for result in results
+        if result.ok
+    }
+    assert loaded == {
+        "0022300001": [["0022300001"]],
+        "0022300003": [["0022300003"]],
+        "0022300004": [["0022300004"]],
+    }
+    [failure] = [result for result in results if not result.ok]
+    assert failure.kwargs == {"game_id": "0022300002"}
+    assert isinstance(failure.error, requests.exceptions.ConnectionError)
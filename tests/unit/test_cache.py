@@ -0,0 +1,164 @@
+import pytest
+import requests
+from datetime import date, timedelta
+from unittest.mock import Mock
+from nba_api.library import cache as response_cache
+from nba_api.library.cache import CachePolicy, FOREVER, ResponseCache
+from nba_api.library.http import NBAHTTP
+from nba_api.stats.library.http import NBAStatsHTTP
+
+BASE_URL = "https://stats.nba.com/stats/playbyplayv2"
+PARAMETERS = [("EndPeriod", 0), ("GameID", "0021700807"), ("StartPeriod", 0)]
+# A GameID of the season in progress, whose games may still be live.
+_SEASON = date.today().year if date.today().month >= 7 else date.today().year - 1
+CURRENT = [("GameID", "002{:02d}00807".format(_SEASON % 100))]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    yield response_cache
+    response_cache.close()
+
+
+def test_policy_ttls():
+    policy = CachePolicy()
+    assert policy.get_ttl("PlayByPlayV2", PARAMETERS) is FOREVER
+    assert policy.get_ttl("leaguegamefinder", []) == 0
+    yesterday = (date.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+    assert policy.get_ttl("scoreboardv2", [("GameDate", yesterday)]) is FOREVER
+    today = date.today().strftime("%m/%d/%Y")
+    assert policy.get_ttl("scoreboardv2", [("GameDate", today)]) == 10
+    assert policy.get_ttl("scoreboardv2", [("GameDate", "")]) == 10
+
+
+def test_round_trip(cache):
+    assert cache.get("playbyplayv2", BASE_URL, PARAMETERS) is None
+    cache.set("playbyplayv2", BASE_URL, PARAMETERS, '{"a": 1}', 200, "url")
+    assert cache.get("playbyplayv2", BASE_URL, list(reversed(PARAMETERS))) == (
+        b'{"a": 1}',
+        200,
+        "url",
+    )
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_uncacheable_endpoint_is_not_stored(cache):
+    cache.set("leaguegamefinder", BASE_URL, PARAMETERS, "{}", 200, "url")
+    assert len(cache) == 0
+
+
+def test_expired_entry(cache, monkeypatch):
+    cache.policy.set_ttl("leaguegamefinder", 60)
+    cache.set("leaguegamefinder", BASE_URL, PARAMETERS, "{}", 200, "url")
+    now = response_cache.time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 61)
+    assert cache.get("leaguegamefinder", BASE_URL, PARAMETERS) is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / "lru.sqlite"), max_bytes=70, compression_level=0)
+    clock = iter(range(100))
+    monkeypatch.setattr(response_cache.time, "time", lambda: next(clock))
+    for game_id in ("1", "2", "3"):
+        cache.set("playbyplayv2", BASE_URL, [("GameID", game_id)], "x" * 10, 200, "url")
+    # Touch game 1 so game 2 becomes the least recently used entry.
+    assert cache.get("playbyplayv2", BASE_URL, [("GameID", "1")]) is not None
+    cache.set("playbyplayv2", BASE_URL, [("GameID", "4")], "x" * 10, 200, "url")
+    assert cache.get_size() <= 70
+    assert cache.get("playbyplayv2", BASE_URL, [("GameID", "2")]) is None
+    assert cache.get("playbyplayv2", BASE_URL, [("GameID", "1")]) is not None
+    cache.close()
+
+
+def test_nbahttp_serves_repeat_requests_from_cache(cache):
+    mock_response = Mock()
+    mock_response.content = b'{"resource": "playbyplay", "resultSets": []}'
+    mock_response.status_code = 200
+    mock_response.url = BASE_URL
+    session = Mock(spec=requests.Session)
+    session.get.return_value = mock_response
+    NBAHTTP.set_session(session)
+    NBAHTTP.set_cache(cache)
+    try:
+        for _ in range(2):
+            response = NBAStatsHTTP().send_api_request(
+                endpoint="playbyplayv2", parameters=dict(PARAMETERS)
+            )
+            assert response.get_dict() == {"resource": "playbyplay", "resultSets": []}
+    finally:
+        NBAHTTP._session = None
+        NBAHTTP.set_cache(None)
+    assert session.get.call_count == 1
+
+
+def test_game_ttl_only_keeps_finished_games_forever(cache):
+    policy = CachePolicy()
+    summary = '{"resultSets": [{"name": "GameSummary", "headers": ["GAME_ID", "GAME_STATUS_ID"], "rowSet": [["1", %d]]}]}'
+    assert policy.get_ttl("boxscoresummaryv2", CURRENT, contents=summary % 3) is FOREVER
+    assert policy.get_ttl("boxscoresummaryv2", CURRENT, contents=summary % 2) == response_cache.IN_PROGRESS_TTL
+    assert policy.get_ttl("boxscoretraditionalv3", CURRENT, contents=b'{"gameStatus": 2}') == response_cache.IN_PROGRESS_TTL
+
+    play_by_play = (
+        '{"resultSets": [{"name": "PlayByPlay", "headers": ["EVENTMSGTYPE", "PERIOD", "SCORE"], '
+        '"rowSet": [[1, 4, "98 - 100"], [13, %d, null]]}]}'
+    )
+    assert policy.get_ttl("playbyplayv2", CURRENT, contents=play_by_play % 4) is FOREVER
+    assert policy.get_ttl("playbyplayv2", CURRENT, contents=play_by_play % 3) == response_cache.IN_PROGRESS_TTL
+    actions = '{"game": {"actions": [{"period": 4, "actionType": "2pt", "scoreHome": "%s", "scoreAway": "99"}, ' \
+        '{"period": 4, "actionType": "period", "subType": "end", "scoreHome": "", "scoreAway": ""}]}}'
+    assert policy.get_ttl("playbyplayv3", CURRENT, contents=actions % "101") is FOREVER
+    assert policy.get_ttl("playbyplayv3", CURRENT, contents=actions % "99") == response_cache.IN_PROGRESS_TTL
+    # A response that does not show the game's status is not trusted forever.
+    assert policy.get_ttl("boxscoretraditionalv2", CURRENT, contents='{"resultSets": []}') == response_cache.IN_PROGRESS_TTL
+
+
+def test_game_ttl_recognizes_completed_box_scores():
+    policy = CachePolicy()
+    team_stats = {
+        "name": "TeamStats",
+        "headers": ["GAME_ID", "TEAM_ID", "MIN", "PTS"],
+        "rowSet": [["1", 1, "240:00", 101], ["1", 2, "240:00", 99]],
+    }
+    box_score = {"resource": "boxscore", "resultSets": [team_stats]}
+    assert policy.get_ttl("boxscoretraditionalv2", CURRENT, box_score) is FOREVER
+    team_stats["rowSet"] = [["1", 1, "265.000000:00", 110], ["1", 2, "265.000000:00", 108]]
+    assert policy.get_ttl("boxscoretraditionalv2", CURRENT, box_score) is FOREVER
+    # Mid-overtime, and tied at the end of regulation.
+    team_stats["rowSet"] = [["1", 1, "250:00", 104], ["1", 2, "250:00", 101]]
+    assert policy.get_ttl("boxscoretraditionalv2", CURRENT, box_score) == response_cache.IN_PROGRESS_TTL
+    team_stats["rowSet"] = [["1", 1, "240:00", 99], ["1", 2, "240:00", 99]]
+    assert policy.get_ttl("boxscoretraditionalv2", CURRENT, box_score) == response_cache.IN_PROGRESS_TTL
+
+    v3 = {
+        "boxScoreTraditional": {
+            "homeTeam": {"statistics": {"minutes": "240:00", "points": 120}},
+            "awayTeam": {"statistics": {"minutes": "240:00", "points": 111}},
+        }
+    }
+    assert policy.get_ttl("boxscoretraditionalv3", CURRENT, v3) is FOREVER
+
+    # Any box score with rows from a past season is final, whatever it shows.
+    advanced = {"resultSets": [{"headers": ["GAME_ID", "OFF_RATING"], "rowSet": [["1", 110.2]]}]}
+    assert policy.get_ttl("boxscoreadvancedv2", PARAMETERS, advanced) is FOREVER
+    assert policy.get_ttl("boxscoreadvancedv2", CURRENT, advanced) == response_cache.IN_PROGRESS_TTL
+    assert policy.get_ttl("boxscoreadvancedv2", PARAMETERS, {"resultSets": []}) == response_cache.IN_PROGRESS_TTL
+
+
+def test_in_progress_game_expires(cache, monkeypatch):
+    body = '{"resultSets": [{"name": "GameSummary", "headers": ["GAME_STATUS_ID"], "rowSet": [[2]]}]}'
+    cache.set("boxscoresummaryv2", BASE_URL, CURRENT, body, 200, "url")
+    assert cache.get("boxscoresummaryv2", BASE_URL, CURRENT) is not None
+    now = response_cache.time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + response_cache.IN_PROGRESS_TTL + 1)
+    assert cache.get("boxscoresummaryv2", BASE_URL, CURRENT) is None
+
+
+def test_set_uses_decoded_response(cache, monkeypatch):
+    def loads(contents):
+        raise AssertionError("decoded twice")
+
+    monkeypatch.setattr(response_cache.json, "loads", loads)
+    cache.set("boxscoresummaryv2", BASE_URL, CURRENT, "{}", 200, "url", data={"gameStatus": 3})
+    assert cache.get("boxscoresummaryv2", BASE_URL, CURRENT) is not None
@@ -0,0 +1,105 @@
+from nba_api.library.checkpoint import FAILED, OK, PENDING, CheckpointStore, download
+
+
+class FlakyEndpoint:
+    calls = []
+    failing = set()
+
+    def __init__(self, game_id):
+        FlakyEndpoint.calls.append(game_id)
+        if game_id in FlakyEndpoint.failing:
+            raise ConnectionError(game_id)
+        self.game_id = game_id
+
+
+def test_checkpoint_store(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    assert store.add("2023-24", ["a", "b", "c"]) == 3
+    assert store.add("2023-24", ["c", "d"]) == 1
+    store.mark_ok("2023-24", "a", {"margin": 3})
+    store.mark_failed("2023-24", "b", ValueError("boom"))
+
+    assert store.get_pending("2023-24") == ["b", "c", "d"]
+    assert store.get_pending("2023-24", max_attempts=1) == ["c", "d"]
+    assert store.get_counts("2023-24") == {OK: 1, FAILED: 1, PENDING: 2}
+    assert store.get_status("2023-24", "b") == {
+        "status": FAILED,
+        "attempts": 1,
+        "error": "ValueError: boom",
+    }
+    assert store.get_results("2023-24") == [("a", {"margin": 3})]
+    assert store.get_failed("2023-24") == [("b", 1, "ValueError: boom")]
+    assert store.get_counts("2022-23") == {}
+    store.close()
+
+
+def test_download_resumes(tmp_path):
+    path = str(tmp_path / "checkpoint.sqlite")
+    keys = ["g1", "g2", "g3"]
+    FlakyEndpoint.calls = []
+    FlakyEndpoint.failing = {"g2"}
+
+    store = CheckpointStore(path)
+    outcomes = dict(
+        download(
+            store,
+            "job",
+            FlakyEndpoint,
+            keys,
+            lambda key: {"game_id": key},
+            process=lambda key, endpoint: endpoint.game_id.upper(),
+            concurrency=2,
+        )
+    )
+    assert outcomes == {"g1": OK, "g2": FAILED, "g3": OK}
+    store.close()
+
+    # A new run retries only the failure.
+    FlakyEndpoint.calls = []
+    FlakyEndpoint.failing = set()
+    store = CheckpointStore(path)
+    assert dict(
+        download(store, "job", FlakyEndpoint, keys, lambda key: {"game_id": key})
+    ) == {"g2": OK}
+    assert FlakyEndpoint.calls == ["g2"]
+    assert store.get_status("job", "g2")["attempts"] == 2
+    assert store.get_results("job") == [("g1", "G1"), ("g2", None), ("g3", "G3")]
+
+
+def test_download_records_process_errors(tmp_path):
+    FlakyEndpoint.failing = set()
+    store = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+
+    def process(key, endpoint):
+        raise KeyError("SCOREMARGIN")
+
+    assert list(
+        download(store, "job", FlakyEndpoint, ["g1"], lambda key: {"game_id": key}, process)
+    ) == [("g1", FAILED)]
+    assert store.get_failed("job") == [("g1", 1, "KeyError: 'SCOREMARGIN'")]
+
+
+def test_download_processes_on_the_workers(tmp_path):
+    import threading
+
+    FlakyEndpoint.failing = set()
+    store = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    threads = {}
+
+    def process(key, endpoint):
+        threads[key] = threading.current_thread().name
+        return key
+
+    keys = ["g1", "g2"]
+    assert sorted(download(store, "job", FlakyEndpoint, keys, lambda key: {"game_id": key}, process)) == [
+        ("g1", OK), ("g2", OK)
+    ]
+    assert all(name.startswith("nba_api-fetch") for name in threads.values())
+
+    store = CheckpointStore(str(tmp_path / "serial.sqlite"))
+    list(
+        download(
+            store, "job", FlakyEndpoint, keys, lambda key: {"game_id": key}, process, process_in_worker=False
+        )
+    )
+    assert set(threads.values()) == {threading.current_thread().name}
@@ -1,7 +1,10 @@
+import asyncio
+import json
 import pytest
 import requests
 from unittest.mock import Mock
-from nba_api.library.http import NBAHTTP
+from nba_api.library import json_decoder
+from nba_api.library.http import NBAHTTP, NBAResponse
 from nba_api.stats.endpoints import AllTimeLeadersGrids
 
 @pytest.fixture
@@ -9,7 +12,7 @@ def mock_session():
     session = Mock(spec=requests.Session)
     # Mock the get method to return a response-like object
     mock_response = Mock()
-    mock_response.text = '{"resource": "alltimeleadersgrids", "resultSets": {}}'
+    mock_response.content = b'{"resource": "alltimeleadersgrids", "resultSets": {}}'
     mock_response.status_code = 200
     mock_response.url = "http://stats.nba.com/stats/alltimeleadersgrids"
     session.get.return_value = mock_response
@@ -66,3 +69,192 @@ def cleanup():
     yield
     # Clean up after each test
     NBAHTTP._session = None
+
+
+def test_nbaresponse_decodes_once(monkeypatch):
+    calls = []
+    decoder = json_decoder.get_decoder()
+
+    def counting_decoder(contents):
+        calls.append(contents)
+        return decoder(contents)
+
+    monkeypatch.setattr(json_decoder, "_decoder", counting_decoder)
+    response = NBAResponse(response='{"a": [1, 2]}', status_code=200, url="url")
+    assert response.valid_json()
+    assert response.get_dict() == {"a": [1, 2]}
+    assert response.get_json() == '{"a": [1, 2]}'
+    assert len(calls) == 1
+
+
+def test_nbaresponse_invalid_json_raises_json_decode_error():
+    response = NBAResponse(response="<Error></Error>", status_code=200, url="url")
+    assert not response.valid_json()
+    with pytest.raises(json.JSONDecodeError):
+        response.get_dict()
+
+
+def test_nbaresponse_parses_bytes():
+    response = NBAResponse(response=b'{"a": "\xc3\xa9"}', status_code=200, url="url")
+    assert response.get_dict() == {"a": "\u00e9"}
+    assert response.get_content() == b'{"a": "\xc3\xa9"}'
+    assert response.get_response() == '{"a": "\u00e9"}'
+
+
+def test_nbaresponse_drops_contents_after_parsing():
+    response = NBAResponse(
+        response=b'{"a": [1, 2]}', status_code=200, url="url", keep_contents=False
+    )
+    assert response.get_dict() == {"a": [1, 2]}
+    assert response._response is None
+    assert response.get_response() == '{"a": [1, 2]}'
+
+
+def test_stats_clean_contents_flags_error_payload():
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    contents = NBAStatsHTTP().clean_contents(b'{"Message":"An error has occurred."}')
+    assert contents == b"<Error><Message>An error has occurred.</Message></Error>"
+    assert NBAStatsHTTP().clean_contents(b'{"resultSets": []}') == b'{"resultSets": []}'
+
+
+def test_set_decoder(monkeypatch):
+    monkeypatch.setattr(json_decoder, "_decoder", json_decoder.get_decoder())
+    json_decoder.set_decoder("json")
+    assert json_decoder.get_decoder() is json_decoder.DECODERS["json"]
+    with pytest.raises(ValueError):
+        json_decoder.set_decoder("not-a-decoder")
+
+
+class FakeAsyncResponse:
+    def __init__(self, text, status=200, url="https://cdn.nba.com/static/json/liveData/x"):
+        self._text = text
+        self.status = status
+        self.url = url
+        self.headers = {}
+
+    async def read(self):
+        return self._text.encode("utf-8")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeAsyncSession:
+    closed = False
+
+    def __init__(self, text, status=200):
+        self.text = text
+        self.status = status
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeAsyncResponse(self.text, status=self.status, url=url)
+
+
+def test_send_api_request_async_uses_async_session():
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    session = FakeAsyncSession('{"resource": "x", "resultSets": []}')
+    NBAHTTP.set_async_session(session)
+    try:
+        response = asyncio.run(
+            NBAStatsHTTP().send_api_request_async(
+                endpoint="alltimeleadersgrids",
+                parameters={"TopX": 5, "SeasonType": None},
+            )
+        )
+    finally:
+        NBAHTTP._async_session = None
+    assert response.get_dict() == {"resource": "x", "resultSets": []}
+    url, kwargs = session.calls[0]
+    assert url == "https://stats.nba.com/stats/alltimeleadersgrids"
+    assert kwargs["params"] == [("TopX", "5")]
+
+
+def test_send_api_request_async_handles_304_without_validator():
+    from nba_api.live.nba.library.http import NBALiveHTTP
+
+    NBALiveHTTP.clear_validators()
+    NBAHTTP.set_async_session(FakeAsyncSession("", status=304))
+    try:
+        response = asyncio.run(
+            NBALiveHTTP().send_api_request_async(
+                endpoint="boxscore/boxscore_0022000180.json", parameters={}
+            )
+        )
+    finally:
+        NBAHTTP._async_session = None
+    assert response._status_code == 304
+    assert not response.valid_json()
+
+
+def test_replacing_async_session_closes_the_old_one():
+    pytest.importorskip("aiohttp")
+
+    async def open_session():
+        return NBAHTTP.get_async_session()
+
+    async def replace():
+        first = NBAHTTP.get_async_session()
+        NBAHTTP.set_async_session(None)
+        await asyncio.sleep(0)
+        return first
+
+    try:
+        assert asyncio.run(replace()).closed
+        # A session left open by an earlier event loop is closed when the
+        # next loop replaces it.
+        second = asyncio.run(open_session())
+        third = asyncio.run(open_session())
+        assert second.closed and not third.closed
+    finally:
+        NBAHTTP.set_async_session(None)
+
+
+def test_live_endpoint_create_async():
+    from nba_api.live.nba.endpoints import scoreboard
+
+    session = FakeAsyncSession(
+        '{"scoreboard": {"gameDate": "2021-01-15", "games": []}}'
+    )
+    NBAHTTP.set_async_session(session)
+    try:
+        board = asyncio.run(scoreboard.ScoreBoard.create_async())
+    finally:
+        NBAHTTP._async_session = None
+    assert board.score_board_date == "2021-01-15"
+    assert board.games.get_dict() == []
+
+
+def test_live_conditional_get_reuses_response_on_304():
+    from nba_api.live.nba.library.http import NBALiveHTTP
+
+    NBALiveHTTP.clear_validators()
+    first = Mock()
+    first.content = b'{"game": {"gameId": "0022000180"}}'
+    first.status_code = 200
+    first.url = "https://cdn.nba.com/static/json/liveData/boxscore/boxscore_0022000180.json"
+    first.headers = {"ETag": '"abc"', "Last-Modified": "Sat, 16 Jan 2021 00:40:31 GMT"}
+    not_modified = Mock()
+    not_modified.status_code = 304
+    not_modified.headers = {}
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = [first, not_modified]
+    NBAHTTP.set_session(session)
+
+    endpoint = "boxscore/boxscore_0022000180.json"
+    response = NBALiveHTTP().send_api_request(endpoint=endpoint, parameters={})
+    assert response.get_dict() == {"game": {"gameId": "0022000180"}}
+    cached = NBALiveHTTP().send_api_request(endpoint=endpoint, parameters={})
+
+    assert cached is response
+    sent_headers = session.get.call_args_list[1].kwargs["headers"]
+    assert sent_headers["If-None-Match"] == '"abc"'
+    assert sent_headers["If-Modified-Since"] == "Sat, 16 Jan 2021 00:40:31 GMT"
+    assert "If-None-Match" not in NBALiveHTTP.headers
+    NBALiveHTTP.clear_validators()
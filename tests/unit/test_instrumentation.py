@@ -0,0 +1,109 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from nba_api.library.http import NBAHTTP
+from nba_api.library.instrumentation import (
+    Instrumentation,
+    RequestSample,
+    normalize_endpoint,
+)
+from nba_api.library.retry import RetryPolicy
+from nba_api.live.nba.library.http import NBALiveHTTP
+from nba_api.stats.library.http import NBAStatsHTTP
+
+
+def make_response(status_code, content=b"{}"):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.url = "https://stats.nba.com/stats/playbyplayv2"
+    response.headers = {}
+    response.elapsed = timedelta(milliseconds=20)
+    return response
+
+
+@pytest.fixture
+def instrumentation():
+    instrumentation = Instrumentation()
+    NBAHTTP.set_instrumentation(instrumentation)
+    yield instrumentation
+    NBAHTTP.set_instrumentation(None)
+    NBAHTTP.set_retry_policy(None)
+    NBAHTTP._session = None
+
+
+def test_normalize_endpoint():
+    assert normalize_endpoint("playbyplayv2") == "playbyplayv2"
+    assert (
+        normalize_endpoint("boxscore/boxscore_0022000180.json") == "boxscore/boxscore_{id}"
+    )
+    assert (
+        normalize_endpoint("scoreboard/todaysScoreboard_00.json")
+        == "scoreboard/todaysscoreboard_{id}"
+    )
+
+
+def test_record_and_export():
+    samples = []
+    instrumentation = Instrumentation(buckets=(0.1, 1.0), callback=samples.append)
+    sample = RequestSample("boxscore/boxscore_0022000180.json")
+    sample.status_code = 200
+    sample.bytes = 1024
+    sample.ttfb = 0.05
+    sample.total = 0.5
+    instrumentation.record(sample)
+
+    assert samples == [sample]
+    stats = instrumentation.get_stats()["boxscore/boxscore_{id}"]
+    assert stats["responses"] == {"network:200": 1}
+    assert stats["latency"]["total"]["count"] == 1
+    assert stats["latency"]["parse"]["count"] == 0
+
+    text = instrumentation.to_prometheus()
+    labels = 'endpoint="boxscore/boxscore_{id}",phase="ttfb"'
+    assert 'nba_api_request_duration_seconds_bucket{%s,le="0.1"} 1' % labels in text
+    assert 'nba_api_request_duration_seconds_bucket{%s,le="+Inf"} 1' % labels in text
+    assert (
+        'nba_api_responses_total{endpoint="boxscore/boxscore_{id}",'
+        'source="network",status="200"} 1'
+    ) in text
+    assert 'nba_api_response_bytes_total{endpoint="boxscore/boxscore_{id}"} 1024' in text
+
+
+def test_send_api_request_records_retries(instrumentation):
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = [
+        make_response(503),
+        make_response(200, b'{"resultSets": []}'),
+    ]
+    NBAHTTP.set_session(session)
+    NBAHTTP.set_retry_policy(RetryPolicy(backoff_factor=0, jitter=False))
+
+    NBAStatsHTTP().send_api_request(endpoint="playbyplayv2", parameters={})
+
+    stats = instrumentation.get_stats()["playbyplayv2"]
+    assert stats["responses"] == {"network:200": 1}
+    assert stats["retries"] == 1
+    assert stats["bytes"] == len(b'{"resultSets": []}')
+    for phase in ("ttfb", "download", "parse", "total"):
+        assert stats["latency"][phase]["count"] == 1
+
+
+def test_send_api_request_records_errors(instrumentation):
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = requests.exceptions.ConnectionError()
+    NBALiveHTTP.set_session(session)
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            NBALiveHTTP().send_api_request(
+                endpoint="boxscore/boxscore_0022000180.json", parameters={}
+            )
+    finally:
+        NBALiveHTTP._session = None
+
+    stats = instrumentation.get_stats()["boxscore/boxscore_{id}"]
+    assert stats["errors"] == {"ConnectionError": 1}
+    assert stats["responses"] == {}
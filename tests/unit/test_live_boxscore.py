@@ -2,6 +2,7 @@ import pytest
 import json
 from nba_api.library.http import NBAHTTP, NBAResponse
 from nba_api.live.nba.endpoints import boxscore
+from nba_api.live.nba.library.gamestate import get_game_state, parse_game_state
 from nba_api.live.nba.library.http import NBALiveHTTP
 
 content = {
@@ -549,3 +550,35 @@ def test_officials_dict(nba_http_patch):
 
 def test_game_details_dict(nba_http_patch):
     assert boxscore.BoxScore(game_id).game_details.get_dict() == game_details
+
+
+def test_game_state(nba_http_patch):
+    state = boxscore.BoxScore(game_id).game_state
+    assert state.game_id == game_id
+    assert state.game_status == 3
+    assert state.game_status_text == "Final"
+    assert state.period == 4
+    assert state.game_clock == "PT00M00.00S"
+    assert state.home_score == content["game"]["homeTeam"]["score"]
+    assert state.away_score == content["game"]["awayTeam"]["score"]
+
+
+def test_game_state_only(nba_http_patch):
+    box_score = boxscore.BoxScore(game_id, game_state_only=True)
+    assert box_score.game_state == boxscore.BoxScore(game_id).game_state
+    assert box_score.game is None
+    assert box_score.home_team_player_stats is None
+    assert box_score.game_details is None
+
+
+def test_parse_game_state():
+    expected = get_game_state(content["game"])
+    assert parse_game_state(json.dumps(content)) == expected
+    assert parse_game_state(json.dumps(content, separators=(",", ":")).encode()) == expected
+
+    # Layouts the scan cannot vouch for are left to the full decode.
+    game = dict(content["game"])
+    game["homeTeam"] = {"periods": [{"score": 1}], **game["homeTeam"]}
+    assert parse_game_state(json.dumps({"game": game})) is None
+    game = {"homeTeam": content["game"]["homeTeam"], **content["game"]}
+    assert parse_game_state(json.dumps({"game": game})) is None
@@ -0,0 +1,47 @@
+import pytest
+
+from nba_api.live.nba.library.clock import get_elapsed, get_elapsed_many, parse_clock
+
+
+@pytest.mark.parametrize(
+    "game_clock, remaining",
+    [
+        ("PT12M00.00S", 720.0),
+        ("PT02M31.40S", 151.4),
+        ("PT00M00.00S", 0.0),
+        ("PT0M5S", 5.0),
+        ("PT00M09.7S", 9.7),
+        ("", None),
+        (None, None),
+        ("2:31", None),
+        ("PTxxM31.40S", None),
+    ],
+)
+def test_parse_clock(game_clock, remaining):
+    assert parse_clock(game_clock) == pytest.approx(remaining)
+    assert parse_clock(game_clock) == pytest.approx(remaining)
+
+
+def test_get_elapsed():
+    assert get_elapsed(1, "PT12M00.00S") == 0
+    assert get_elapsed(3, "PT00M00.00S") == 2160
+    assert get_elapsed(4, "PT02M31.40S") == pytest.approx(2728.6)
+    assert get_elapsed(5, "PT04M00.00S") == 2940
+    assert get_elapsed(6, "PT00M00.50S") == pytest.approx(3479.5)
+    assert get_elapsed(4, "PT01M00.00S", period_seconds=600) == 2340
+    assert get_elapsed(0, "PT12M00.00S") is None
+    assert get_elapsed(4, "") is None
+
+
+def test_get_elapsed_many():
+    actions = [
+        {"period": 1, "clock": "PT12M00.00S"},
+        {"period": 4, "clock": "PT02M31.40S"},
+        {"period": 5, "clock": "PT04M00.00S"},
+        {"period": 2, "clock": ""},
+        {"clock": "PT01M00.00S"},
+    ]
+    assert get_elapsed_many(actions) == [
+        get_elapsed(action.get("period"), action["clock"]) for action in actions
+    ]
+    assert get_elapsed_many([{"period": 3, "gameClock": "PT06M00.00S"}], clock_key="gameClock") == [1800]
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import queue
+
+import pytest
+
+from nba_api.library.http import NBAHTTP, NBAResponse
+from nba_api.live.nba.library.hub import LiveGameHub
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+
+def make_game(game_id, home_score, away_score, status=2):
+    return {
+        "gameId": game_id,
+        "gameStatus": status,
+        "gameStatusText": "Q3 5:00",
+        "period": 3,
+        "gameClock": "PT05M00.00S",
+        "homeTeam": {"teamId": 1, "teamName": "Celtics", "score": home_score},
+        "awayTeam": {"teamId": 2, "teamName": "Magic", "score": away_score},
+    }
+
+
+def make_box_score(game_id, home_score, away_score):
+    game = make_game(game_id, home_score, away_score)
+    game["homeTeam"]["players"] = []
+    game["awayTeam"]["players"] = []
+    return {"game": game}
+
+
+@pytest.fixture
+def feeds(monkeypatch):
+    feeds = {
+        "scoreboard/todaysScoreboard_00.json": {
+            "scoreboard": {
+                "gameDate": "2021-01-16",
+                "games": [make_game("A", 50, 48), make_game("B", 30, 31)],
+            }
+        },
+        "boxscore/boxscore_A.json": make_box_score("A", 50, 48),
+        "boxscore/boxscore_C.json": make_box_score("C", 10, 12),
+    }
+    requests = []
+
+    def send_api_request(self, endpoint, parameters, referer=None, proxy=None, headers=None, timeout=None):
+        requests.append(endpoint)
+        url = NBALiveHTTP.base_url.format(endpoint=endpoint)
+        if endpoint not in feeds:
+            return NBAResponse(response=b"", status_code=404, url=url)
+        return NBAResponse(response=json.dumps(feeds[endpoint]), status_code=200, url=url)
+
+    async def send_api_request_async(self, *args, **kwargs):
+        return send_api_request(self, *args, **kwargs)
+
+    monkeypatch.setattr(NBAHTTP, "send_api_request", send_api_request)
+    monkeypatch.setattr(NBAHTTP, "send_api_request_async", send_api_request_async)
+    feeds["requests"] = requests
+    return feeds
+
+
+def test_hub_fans_out_one_scoreboard_request(feeds):
+    hub = LiveGameHub()
+    updates_a = hub.subscribe("A", queue.Queue())
+    updates_b = []
+    hub.subscribe("B", updates_b.append)
+
+    assert [game_id for game_id, _ in hub.tick()] == ["A", "B"]
+    assert feeds["requests"] == ["scoreboard/todaysScoreboard_00.json"]
+    update = updates_a.get_nowait()
+    assert (update.state.home_score, update.state.away_score) == (50, 48)
+    assert update.game["homeTeam"]["teamName"] == "Celtics"
+    assert update.box_score is None
+    assert updates_b[0].state.away_score == 31
+
+    # Unchanged games are not delivered again.
+    assert hub.tick() == []
+    assert updates_a.empty() and len(updates_b) == 1
+    feeds["scoreboard/todaysScoreboard_00.json"]["scoreboard"]["games"][1] = make_game("B", 33, 31)
+    assert [game_id for game_id, _ in hub.tick()] == ["B"]
+    assert hub.get_state("B").home_score == 33
+    assert feeds["requests"] == ["scoreboard/todaysScoreboard_00.json"] * 3
+
+    # A tick limited to some games leaves the others pending.
+    games = feeds["scoreboard/todaysScoreboard_00.json"]["scoreboard"]["games"]
+    games[:] = [make_game("A", 52, 48), make_game("B", 33, 34)]
+    assert [game_id for game_id, _ in hub.tick(["B"])] == ["B"]
+    assert [game_id for game_id, _ in hub.tick()] == ["A"]
+
+
+def test_hub_fetches_box_scores_only_when_needed(feeds):
+    hub = LiveGameHub()
+    updates_a = hub.subscribe("A", queue.Queue(), detail=lambda state: state.period >= 3)
+    updates_c = hub.subscribe("C", queue.Queue())
+    updates_d = hub.subscribe("D", queue.Queue())
+
+    hub.tick()
+    assert sorted(feeds["requests"]) == [
+        "boxscore/boxscore_A.json",
+        "boxscore/boxscore_C.json",
+        "boxscore/boxscore_D.json",
+        "scoreboard/todaysScoreboard_00.json",
+    ]
+    assert updates_a.get_nowait().box_score.game_state.home_score == 50
+    # C is not on the scoreboard, so its state comes from its BoxScore.
+    assert updates_c.get_nowait().state.away_score == 12
+    update = updates_d.get_nowait()
+    assert update.state is None and update.error is not None
+
+    hub.unsubscribe("C")
+    hub.unsubscribe("D")
+    del feeds["requests"][:]
+    hub.tick()
+    assert feeds["requests"] == ["scoreboard/todaysScoreboard_00.json"]
+    assert hub.get_game_ids() == ["A"]
+
+
+def test_hub_tick_async(feeds):
+    hub = LiveGameHub()
+    updates = hub.subscribe("A", asyncio.Queue(), detail=True)
+    updates_c = hub.subscribe("C", asyncio.Queue())
+
+    asyncio.run(hub.tick_async())
+    assert updates.get_nowait().box_score.game_state.game_id == "A"
+    assert updates_c.get_nowait().state.game_id == "C"
+    assert len(feeds["requests"]) == 3
+
+
+def test_hub_backs_off_games_off_the_scoreboard(feeds):
+    hub = LiveGameHub()
+    hub.subscribe("C", queue.Queue())
+    updates_d = hub.subscribe("D", queue.Queue())
+
+    def fetched(now):
+        del feeds["requests"][:]
+        hub.tick(now=now)
+        return sorted(endpoint for endpoint in feeds["requests"] if endpoint.startswith("boxscore"))
+
+    assert fetched(0) == ["boxscore/boxscore_C.json", "boxscore/boxscore_D.json"]
+    # D failed: it waits miss_backoff, then twice that after failing again.
+    assert fetched(1) == ["boxscore/boxscore_C.json"]
+    assert fetched(hub.miss_backoff) == ["boxscore/boxscore_C.json", "boxscore/boxscore_D.json"]
+    assert fetched(hub.miss_backoff * 2) == ["boxscore/boxscore_C.json"]
+    assert fetched(hub.miss_backoff * 3) == ["boxscore/boxscore_C.json", "boxscore/boxscore_D.json"]
+    assert updates_d.qsize() == 3
+
+    # A final game off the scoreboard is not fetched again.
+    box_score = make_box_score("C", 100, 98)
+    box_score["game"]["gameStatus"] = 3
+    feeds["boxscore/boxscore_C.json"] = box_score
+    assert fetched(200) == ["boxscore/boxscore_C.json"]
+    assert fetched(201) == []
+    assert hub.get_state("C").game_status == 3
+
+
+def test_hub_does_not_track_games_unsubscribed_during_a_tick(feeds):
+    hub = LiveGameHub()
+    hub.subscribe("A", lambda update: hub.unsubscribe("B"))
+    hub.subscribe("B", queue.Queue())
+    hub.tick()
+    assert hub.get_state("B") is None
+    assert hub.get_game_ids() == ["A"]
+
+
+def test_hub_tick_async_raises_a_cancelled_fetch(feeds, monkeypatch):
+    from nba_api.live.nba.library import hub as hub_module
+
+    async def create_async(**kwargs):
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(hub_module.BoxScore, "create_async", create_async)
+    hub = LiveGameHub()
+    updates = hub.subscribe("C", asyncio.Queue())
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(hub.tick_async())
+    assert updates.empty() and hub.get_state("C") is None
@@ -127,3 +127,40 @@ def test_get_actions_dict(nba_http_patch):
 
 def test_get_dict(nba_http_patch):
     assert playbyplay.PlayByPlay(game_id).get_dict() == content
+
+
+def make_action(action_number, edited="2021-01-16T00:40:31Z"):
+    return {"actionNumber": action_number, "orderNumber": action_number * 10000, "edited": edited}
+
+
+def test_stream_yields_new_and_edited_actions():
+    stream = playbyplay.PlayByPlayStream()
+    first = [make_action(1), make_action(2, "2021-01-16T00:41:00Z")]
+    assert list(stream.get_delta(game_id, first)) == first
+    assert list(stream.get_delta(game_id, first)) == []
+
+    edited = make_action(1, "2021-01-16T00:41:00.5Z")
+    new = make_action(3, "2021-01-16T00:40:59Z")
+    assert list(stream.get_delta(game_id, [edited, first[1], new])) == [edited, new]
+    assert stream.get_cursor(game_id).action_number == 3
+
+    # Cursors are per game.
+    assert list(stream.get_delta("0022000181", first)) == first
+    stream.reset(game_id)
+    assert list(stream.get_delta(game_id, first)) == first
+
+
+def test_stream_yields_out_of_order_edits():
+    stream = playbyplay.PlayByPlayStream()
+    first = [make_action(1, "2021-01-16T00:40:00Z"), make_action(2, "2021-01-16T00:40:00Z")]
+    assert list(stream.get_delta(game_id, first)) == first
+
+    edited = [make_action(1, "2021-01-16T00:42:00Z"), make_action(2, "2021-01-16T00:41:00Z")]
+    assert list(stream.get_delta(game_id, edited)) == edited
+    assert list(stream.get_delta(game_id, edited)) == []
+
+
+def test_stream_poll(nba_http_patch):
+    stream = playbyplay.PlayByPlayStream()
+    assert list(stream.poll(game_id)) == actions
+    assert list(stream.poll(game_id)) == []
@@ -0,0 +1,80 @@
+import pytest
+
+from nba_api.live.nba.library.gamestate import GameState
+from nba_api.live.nba.library.scheduler import PollScheduler
+
+
+def make_state(status=2, text="Q3 5:00", period=3, clock="PT05M00.00S", home=50, away=48):
+    return GameState("A", status, text, period, clock, 1, home, 2, away)
+
+
+def test_get_interval_by_phase():
+    scheduler = PollScheduler()
+    start = 1_000_000.0
+    game = {"gameTimeUTC": "1970-01-12T13:46:40Z"}
+    pregame = make_state(status=1, text="7:30 pm ET", period=0, clock="")
+    assert scheduler.get_interval(pregame, game, now=start - 3600) == scheduler.pregame_max
+    assert scheduler.get_interval(pregame, game, now=start - 100) == 50
+    assert scheduler.get_interval(pregame, game, now=start + 60) == scheduler.pregame_min
+    assert scheduler.get_interval(pregame) == scheduler.pregame_max
+
+    assert scheduler.get_interval(make_state(period=1)) == scheduler.first_half
+    assert scheduler.get_interval(make_state(text="Half", period=2, clock="")) == scheduler.halftime
+    assert scheduler.get_interval(make_state(text="End Q3", clock="PT00M00.00S")) == scheduler.period_break
+    assert scheduler.get_interval(make_state()) == scheduler.second_half
+    assert scheduler.get_interval(make_state(), stopped_for=60) == scheduler.stoppage
+    assert scheduler.get_interval(make_state(period=4, clock="PT02M31.40S")) == scheduler.clutch
+    assert scheduler.get_interval(make_state(period=5, clock="PT02M31.40S", home=70)) == scheduler.second_half
+    assert scheduler.get_interval(make_state(status=3, text="Final")) is None
+
+
+def test_stoppages():
+    scheduler = PollScheduler()
+    # A Q1 timeout never polls faster than live first-half play.
+    assert scheduler.get_interval(make_state(period=1), stopped_for=60) == scheduler.first_half
+
+    # A clutch clock that has not moved between 1s polls is a feed that has
+    # not refreshed yet; clutch time keeps its cadence either way.
+    clutch = make_state(period=4, clock="PT02M31.40S")
+    assert scheduler.update("A", clutch, now=0) == scheduler.clutch
+    assert scheduler.update("A", clutch, now=1) == scheduler.clutch
+    assert scheduler.update("A", clutch, now=30) == scheduler.clutch
+
+    # Outside clutch time, the clock must stay put past feed_refresh.
+    live = make_state()
+    assert scheduler.update("B", live, now=0) == scheduler.second_half
+    assert scheduler.update("B", live, now=scheduler.feed_refresh) == scheduler.second_half
+    assert scheduler.update("B", live, now=scheduler.feed_refresh + 5) == scheduler.stoppage
+    assert scheduler.update("B", make_state(clock="PT04M50.00S"), now=20) == scheduler.second_half
+
+
+def test_schedule_and_backoff():
+    scheduler = PollScheduler(backoff_factor=2, max_backoff=10, jitter=False)
+    scheduler.add("A", now=0)
+    scheduler.add("B", now=0)
+    assert scheduler.get_due(now=0) == ["A", "B"]
+
+    assert scheduler.update("A", make_state(), now=0) == scheduler.second_half
+    assert [scheduler.record_error("B", now=0) for _ in range(4)] == [2, 4, 8, 10]
+    assert scheduler.get_errors("B") == 4
+    assert scheduler.get_delay(now=0) == scheduler.second_half
+    assert scheduler.get_due(now=scheduler.second_half) == ["A"]
+    assert scheduler.get_due(now=10) == ["A", "B"]
+
+    assert scheduler.update("B", make_state(status=3), now=10) is None
+    assert scheduler.get_errors("B") == 0
+    assert scheduler.get_due(now=100) == ["A"]
+    scheduler.remove("A")
+    assert scheduler.get_delay() is None
+
+
+def test_backoff_jitter_keeps_half():
+    scheduler = PollScheduler(backoff_factor=4)
+    assert all(2 <= scheduler.get_backoff(1) <= 4 for _ in range(100))
+
+
+def test_shared_budget():
+    assert PollScheduler().reserve(5) == 0
+    scheduler = PollScheduler(rate=10, burst=2)
+    assert scheduler.reserve() == 0
+    assert scheduler.reserve(2) == pytest.approx(0.1, abs=0.01)
@@ -0,0 +1,146 @@
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from nba_api.library.http import NBAHTTP
+from nba_api.library.pool import (
+    ConcurrencyLimiter,
+    get_connection_stats,
+    get_pool_defaults,
+    mount_adapters,
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    connection_headers = []
+
+    def do_GET(self):
+        self.connection_headers.append(self.headers.get("Connection"))
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}/".format(httpd.server_address[1])
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def pool_settings():
+    names = (
+        "pool_connections",
+        "pool_maxsize",
+        "pool_block",
+        "keep_alive",
+        "async_pool_size",
+        "async_limit_per_host",
+        "_concurrency_limiter",
+    )
+    saved = {name: NBAHTTP.__dict__[name] for name in names}
+    yield
+    for name, value in saved.items():
+        setattr(NBAHTTP, name, value)
+    NBAHTTP._session = None
+
+
+def test_pool_defaults_follow_worker_count():
+    assert get_pool_defaults()["pool_maxsize"] == 10
+    assert get_pool_defaults(4)["pool_maxsize"] == 10
+    assert get_pool_defaults(32)["pool_maxsize"] == 32
+
+
+def test_configure_pool_remounts_existing_session(pool_settings):
+    session = requests.Session()
+    NBAHTTP.set_session(session)
+    NBAHTTP.configure_pool(workers=24, max_per_host=6)
+
+    adapter = session.get_adapter("https://stats.nba.com/stats/")
+    assert adapter._pool_maxsize == 24
+    assert NBAHTTP.async_limit_per_host == 6
+    assert NBAHTTP._concurrency_limiter.max_per_host == 6
+
+    NBAHTTP.configure_pool()
+    assert session.get_adapter("https://stats.nba.com/")._pool_maxsize == 10
+    assert NBAHTTP._concurrency_limiter is None
+
+
+def test_new_session_uses_configured_pool(pool_settings):
+    NBAHTTP._session = None
+    NBAHTTP.configure_pool(pool_maxsize=16)
+    adapter = NBAHTTP.get_session().get_adapter("https://cdn.nba.com/")
+    assert adapter._pool_maxsize == 16
+
+
+def test_concurrency_limiter_caps_requests_per_host():
+    limiter = ConcurrencyLimiter(max_per_host=2)
+
+    def work():
+        with limiter.slot("https://stats.nba.com/stats/playbyplayv2"):
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = limiter.get_stats()["stats.nba.com"]
+    assert stats["requests"] == 6
+    assert stats["max_in_flight"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["waited"] >= 1
+
+
+def test_concurrency_limiter_unlimited_host():
+    limiter = ConcurrencyLimiter(limits={"stats.nba.com": 1})
+    with limiter.slot("https://cdn.nba.com/a"):
+        with limiter.slot("https://cdn.nba.com/b"):
+            assert limiter.get_stats()["cdn.nba.com"]["in_flight"] == 2
+
+
+def test_connection_stats_count_reused_connections(server):
+    session = mount_adapters(requests.Session(), 10, 10, False)
+    for _ in range(3):
+        assert session.get(server).status_code == 200
+
+    stats = get_connection_stats(session)["http://127.0.0.1"]
+    assert stats["requests"] == 3
+    assert stats["connections"] == 1
+    assert stats["reused"] == 2
+    assert stats["idle"] == 1
+    session.close()
+
+
+def test_keep_alive_off_sends_connection_close(server, pool_settings):
+    NBAHTTP.configure_pool(keep_alive=False)
+    NBAHTTP._session = None
+
+    class LocalHTTP(NBAHTTP):
+        base_url = server + "{endpoint}"
+
+    KeepAliveHandler.connection_headers = []
+    try:
+        response = LocalHTTP().send_api_request("test", {})
+        assert response.get_dict() == {"ok": True}
+        assert KeepAliveHandler.connection_headers == ["close"]
+        assert LocalHTTP.get_pool_stats()["keep_alive"] is False
+    finally:
+        LocalHTTP._session = None
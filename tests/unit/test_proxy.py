@@ -0,0 +1,65 @@
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP
+from nba_api.library.proxy import ProxyPool
+from nba_api.library.retry import RetryPolicy
+from nba_api.stats.library.http import NBAStatsHTTP
+
+PROXIES = ["http://a:8080", "http://b:8080", "http://c:8080"]
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    NBAHTTP._session = None
+    NBAHTTP.set_retry_policy(None)
+    NBAHTTP.set_proxy_pool(None)
+    NBAHTTP._proxy_pools.clear()
+
+
+def test_requires_proxies():
+    with pytest.raises(ValueError):
+        ProxyPool([])
+
+
+def test_prefers_faster_proxy():
+    pool = ProxyPool(PROXIES[:2])
+    pool.record_success("http://a:8080", 0.1)
+    pool.record_success("http://b:8080", 2.0)
+    assert {pool.choose() for _ in range(20)} == {"http://a:8080"}
+
+
+def test_failing_proxy_cools_down():
+    pool = ProxyPool(PROXIES, max_consecutive_failures=2)
+    for _ in range(2):
+        pool.record_failure("http://a:8080")
+    stats = pool.get_stats()
+    assert stats["http://a:8080"]["cooling_down"]
+    assert stats["http://a:8080"]["failures"] == 2
+    assert "http://a:8080" not in {pool.choose() for _ in range(50)}
+    pool.record_response("http://b:8080", 403, 0.2)
+    assert pool.get_stats()["http://b:8080"]["error_rate"] > 0
+
+
+def test_send_api_request_routes_around_bad_proxy():
+    blocked = Mock(status_code=403, content=b"", url="u", headers={})
+    ok = Mock(status_code=200, content=b'{"resultSets": []}', url="u", headers={})
+
+    def get(**kwargs):
+        return blocked if kwargs["proxies"]["https"] == "http://a:8080" else ok
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = get
+    NBAHTTP.set_session(session)
+    NBAHTTP.set_retry_policy(
+        RetryPolicy(max_retries=3, backoff_factor=0, retry_on_status=(403,))
+    )
+    for _ in range(10):
+        response = NBAStatsHTTP().send_api_request(
+            endpoint="playbyplayv2", parameters={}, proxy=PROXIES[:2]
+        )
+        assert response.get_dict() == {"resultSets": []}
+    stats = NBAHTTP.get_proxy_pool(PROXIES[:2]).get_stats()
+    assert stats["http://b:8080"]["failures"] == 0
+    assert stats["http://a:8080"]["requests"] <= 3
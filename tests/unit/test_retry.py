@@ -0,0 +1,95 @@
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library import http as nba_http
+from nba_api.library.http import NBAHTTP
+from nba_api.library.ratelimit import RateLimiter, TokenBucket
+from nba_api.library.retry import RetryPolicy
+from nba_api.stats.library.http import NBAStatsHTTP
+
+
+def make_response(status_code, content=b"{}", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.url = "https://stats.nba.com/stats/playbyplayv2"
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    yield
+    NBAHTTP._session = None
+    NBAHTTP.set_rate_limiter(None)
+    NBAHTTP.set_retry_policy(None)
+
+
+def test_token_bucket_burst_then_waits():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_per_host_stats(monkeypatch):
+    limiter = RateLimiter(default_rate=None, rates={"stats.nba.com": 1})
+    monkeypatch.setattr("nba_api.library.ratelimit.time.sleep", lambda s: None)
+    limiter.acquire("https://stats.nba.com/stats/a")
+    limiter.acquire("https://stats.nba.com/stats/b")
+    limiter.acquire("https://cdn.nba.com/static/json/liveData/c")
+    stats = limiter.get_stats()
+    assert stats["stats.nba.com"]["requests"] == 2
+    assert stats["stats.nba.com"]["delayed"] == 1
+    assert stats["cdn.nba.com"]["delayed"] == 0
+
+
+def test_retry_policy_backoff_without_jitter():
+    policy = RetryPolicy(max_retries=2, backoff_factor=1, jitter=False)
+    assert policy.get_delay(0, 0, status_code=503) == 1
+    assert policy.get_delay(1, 0, status_code=503) == 2
+    assert policy.get_delay(2, 0, status_code=503) is None
+    assert policy.get_delay(0, 0, status_code=404) is None
+    assert policy.get_delay(0, 0, status_code=429, retry_after=5) == 5
+    stats = policy.get_stats()
+    assert stats["retries"] == 3
+    assert stats["gave_up"] == 1
+    assert stats["status_codes"] == {503: 2, 429: 1}
+
+
+def test_retry_policy_max_elapsed():
+    policy = RetryPolicy(max_retries=10, backoff_factor=1, jitter=False, max_elapsed=3)
+    assert policy.get_delay(0, 1.5, status_code=500) == 1
+    assert policy.get_delay(1, 1.5, status_code=500) is None
+
+
+def test_send_api_request_retries(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(nba_http.time, "sleep", sleeps.append)
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = [
+        requests.exceptions.ConnectionError("reset"),
+        make_response(429, headers={"Retry-After": "2"}),
+        make_response(200, b'{"resultSets": []}'),
+    ]
+    NBAHTTP.set_session(session)
+    NBAHTTP.set_retry_policy(RetryPolicy(max_retries=3, backoff_factor=0.5, jitter=False))
+    limiter = RateLimiter()
+    NBAHTTP.set_rate_limiter(limiter)
+
+    response = NBAStatsHTTP().send_api_request(endpoint="playbyplayv2", parameters={})
+
+    assert response.get_dict() == {"resultSets": []}
+    assert session.get.call_count == 3
+    assert sleeps == [0.5, 2.0]
+    assert limiter.get_stats()["stats.nba.com"]["throttled_responses"] == 1
+
+
+def test_send_api_request_without_policy_raises():
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = requests.exceptions.ConnectionError("reset")
+    NBAHTTP.set_session(session)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        NBAStatsHTTP().send_api_request(endpoint="playbyplayv2", parameters={})
+    assert session.get.call_count == 1
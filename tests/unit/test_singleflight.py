@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.singleflight import SingleFlight
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+
+def run_concurrently(target, count):
+    results = [None] * count
+    errors = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results, errors = run_concurrently(lambda: group.do("key", slow), 5)
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.shared == 4
+
+
+def test_errors_are_shared():
+    group = SingleFlight()
+
+    def failing():
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    _, errors = run_concurrently(lambda: group.do("key", failing), 3)
+    assert all(isinstance(error, ValueError) for error in errors)
+
+
+def test_sequential_calls_are_not_shared():
+    group = SingleFlight()
+    assert group.do("key", lambda: 1) == 1
+    assert group.do("key", lambda: 2) == 2
+
+
+def test_do_async():
+    group = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"game": 1}
+
+    async def main():
+        return await asyncio.gather(*(group.do_async("key", fetch) for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_do_async_leader_cancellation_does_not_reach_followers():
+    group = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return {"game": 1}
+
+    async def main():
+        leader = asyncio.ensure_future(group.do_async("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do_async("key", fetch))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(leader, 0.01)
+        result = await follower
+        assert group._async_calls == {}
+        return result
+
+    assert asyncio.run(main()) == {"game": 1}
+
+
+def test_send_api_request_coalesces_identical_requests():
+    response = Mock()
+    response.content = b'{"game": {"gameId": "0022000180"}}'
+    response.status_code = 200
+    response.url = "https://cdn.nba.com/static/json/liveData/boxscore/boxscore_0022000180.json"
+    response.headers = {}
+
+    def slow_get(**kwargs):
+        time.sleep(0.2)
+        return response
+
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = slow_get
+    NBALiveHTTP.set_session(session)
+    try:
+        results, errors = run_concurrently(
+            lambda: NBALiveHTTP().send_api_request(
+                endpoint="boxscore/boxscore_0022000180.json", parameters={}
+            ),
+            4,
+        )
+    finally:
+        # Drop the subclass attribute so NBAHTTP.set_session() applies again.
+        del NBALiveHTTP._session
+    assert errors == [None] * 4
+    assert session.get.call_count == 1
+    assert all(result is results[0] for result in results)
@@ -1,4 +1,10 @@
-from nba_api.stats.static import teams
+import subprocess
+import sys
+
+import pytest
+
+from nba_api.stats.library.static_data import read_static_data, write_static_data
+from nba_api.stats.static import players, teams
 
 
 def test_nba_teams():
@@ -7,3 +13,45 @@ def test_nba_teams():
 
 def test_wnba_teams():
     assert len(teams.wnba_teams) == 12
+
+
+def test_players_load_on_first_use():
+    code = (
+        "import sys\n"
+        "from nba_api.stats.static import players, teams\n"
+        "from nba_api.stats.library import data\n"
+        "print('players' in vars(data), 'numpy' in sys.modules)\n"
+        "players.find_player_by_id(2544)\n"
+        "print('players' in vars(data), 'wnba_players' in vars(data))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+    assert output == ["False False", "True False"]
+
+
+def test_player_rows():
+    assert players.players[0] == [76001, "Abdelnaby", "Alaa", "Alaa Abdelnaby", False]
+    assert all(isinstance(player[0], int) for player in players.wnba_players)
+    assert players.find_player_by_id(2544)["full_name"] == "LeBron James"
+
+
+def test_static_data_round_trip(tmp_path):
+    path = str(tmp_path / "static_data.bin")
+    rows = [[1, "Dončić", True], [2 ** 40, "", False]]
+    write_static_data(
+        path, {"people": (("id", "name", "active"), rows), "empty": (("id",), [])}, "today"
+    )
+    for memory_map in (False, True):
+        static_data = read_static_data(path, memory_map=memory_map)
+        assert static_data["updated"] == "today"
+        people = static_data["tables"]["people"]
+        assert people["id"].tolist() == [1, 2 ** 40]
+        assert people["name"] == ["Dončić", ""]
+        assert people["active"].tolist() == [True, False]
+        assert len(static_data["tables"]["empty"]["id"]) == 0
+
+
+def test_static_data_rejects_newlines(tmp_path):
+    with pytest.raises(ValueError):
+        write_static_data(str(tmp_path / "x.bin"), {"t": (("name",), [["a\nb"]])})
@@ -0,0 +1,74 @@
+import re
+
+import pytest
+
+from nba_api.stats.library import data
+from nba_api.stats.static import players, teams
+from nba_api.stats.static._index import SearchColumn
+
+PATTERNS = [
+    "Luka Dončić",
+    "^Luka",
+    "^luka dončić$",
+    "ic$",
+    "^(Dončić|Jokić)$",
+    "^[NK]ikola",
+    " Nikola Jokić ",
+    "NIKOLA JOKIĆ",
+    "O-M Prosper",
+    "^Paul 'The Bear'",
+    "",
+    "^",
+    "$",
+    "^Zz",
+    "zzzz",
+]
+
+
+def scan(pattern, rows, column, normalize=str):
+    pattern = normalize(pattern)
+    return [row for row in rows if re.search(pattern, normalize(str(row[column])), flags=re.I)]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_player_searches_match_full_scan(pattern):
+    strip = players._strip_accents
+    for column, find in (
+        (data.player_index_full_name, players.find_players_by_full_name),
+        (data.player_index_first_name, players.find_players_by_first_name),
+        (data.player_index_last_name, players.find_players_by_last_name),
+    ):
+        expected = [
+            players._get_player_dict(row)
+            for row in scan(pattern, data.players, column, strip)
+        ]
+        assert find(pattern) == expected
+
+
+def test_player_by_id():
+    assert players.find_player_by_id(2544)["full_name"] == "LeBron James"
+    assert players.find_player_by_id("2544")["full_name"] == "LeBron James"
+    assert players.find_player_by_id(1) is None
+    assert players.find_wnba_player_by_id(data.wnba_players[0][0])["id"] == data.wnba_players[0][0]
+
+
+def test_team_lookups():
+    assert teams.find_team_name_by_id(1610612747)["abbreviation"] == "LAL"
+    assert teams.find_team_by_abbreviation("lal")["id"] == 1610612747
+    assert teams.find_team_by_abbreviation("XY.") is None
+    assert teams.find_teams_by_city("^los") == [
+        teams._get_team_dict(row) for row in scan("^los", data.teams, data.team_index_city)
+    ]
+    assert teams.find_wnba_teams_by_state("new") == [
+        teams._get_team_dict(row)
+        for row in scan("new", data.wnba_teams, data.team_index_state)
+    ]
+
+
+def test_search_column_non_ascii_values():
+    # "ſ" (long s) matches "s" under re.I but does not lowercase to it.
+    column = SearchColumn(["ſam", "Sam", "Ann"])
+    for pattern in ("sam", "^s", "^sam$", "am$", "^S.m"):
+        assert column.search(pattern) == [
+            i for i, value in enumerate(column.values) if re.search(pattern, value, re.I)
+        ]
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pandas import DataFrame
 from nba_api.stats.endpoints._base import Endpoint
@@ -26,3 +27,148 @@ def test_headers_present_and_nonempty():
     assert isinstance(result, DataFrame)
     assert result.empty
     assert list(result.columns) == ["GAME_ID", "LEAG_TIX"]
+
+
+def test_get_columns_are_typed_arrays():
+    data = {
+        "headers": ["GAME_ID", "TEAM_ID", "PTS", "FG_PCT", "WL"],
+        "data": [
+            ["0022300001", 1610612747, 107, 0.5, "W"],
+            ["0022300002", 1610612738, 99, None, None],
+        ],
+    }
+    columns = Endpoint.DataSet(data).get_columns()
+    assert list(columns) == data["headers"]
+    assert columns["GAME_ID"].dtype == object
+    assert columns["TEAM_ID"].dtype == np.int64
+    assert columns["FG_PCT"].dtype == np.float64
+    assert np.isnan(columns["FG_PCT"][1])
+    assert list(columns["WL"]) == ["W", None]
+
+
+def test_columnar_data_frame_matches_row_construction():
+    data = {
+        "headers": ["GAME_ID", "PTS", "FG_PCT", "WL"],
+        "data": [["0022300001", 107, 0.5, "W"], ["0022300002", 99, None, "L"]],
+    }
+    result = Endpoint.DataSet(data).get_data_frame(typed=False)
+    expected = DataFrame(data["data"], columns=data["headers"])
+    assert result.equals(expected)
+    assert list(result.dtypes) == list(expected.dtypes)
+
+
+def test_duplicate_headers_fall_back_to_rows():
+    data = {"headers": ["PTS", "PTS"], "data": [[1, 2]]}
+    result = Endpoint.DataSet(data).get_data_frame()
+    assert list(result.columns) == ["PTS", "PTS"]
+    assert result.iloc[0].tolist() == [1, 2]
+
+
+def test_multi_level_headers():
+    data = {
+        "headers": [
+            {"name": "SHOT_CATEGORY", "columnsToSkip": 1, "columnSpan": 2,
+             "columnNames": ["Restricted Area"]},
+            {"name": "columns", "columnNames": ["PLAYER", "FGM", "FGA"]},
+        ],
+        "data": [["LeBron James", 5, 7]],
+    }
+    data_set = Endpoint.DataSet(data)
+    frame = data_set.get_data_frame()
+    assert list(frame.columns.names) == ["SHOT_CATEGORY", "columns"]
+    assert frame[("Restricted Area", "FGA")].tolist() == [7]
+    assert data_set.get_columns()[("", "PLAYER")].tolist() == ["LeBron James"]
+
+
+def test_data_sets_load_lazily_and_behave_like_a_list():
+    calls = []
+    raw = {
+        "GameHeader": {"headers": ["GAME_ID"], "data": [["0022300001"]]},
+        "LineScore": {"headers": ["PTS"], "data": [[101]]},
+    }
+
+    class Response:
+        def get_data_sets(self):
+            calls.append(1)
+            return raw
+
+    data_sets = Endpoint.DataSets(Response(), "scoreboardv2")
+    assert calls == []
+    assert len(data_sets) == 2
+    assert data_sets.keys() == ["GameHeader", "LineScore"]
+    assert data_sets[0] is data_sets["GameHeader"]
+    assert [ds.get_dict() for ds in data_sets] == list(raw.values())
+    assert "LineScore" in data_sets
+    assert data_sets.get("Missing") is None
+    assert calls == [1]
+
+
+def test_data_set_property_reads_named_data_set():
+    from nba_api.stats.endpoints.scoreboardv2 import ScoreboardV2
+
+    board = ScoreboardV2(get_request=False)
+    with pytest.raises(AttributeError):
+        board.game_header
+    board.data_sets = Endpoint.DataSets(
+        endpoint=board.endpoint,
+        data_sets={
+            "GameHeader": Endpoint.DataSet(
+                {"headers": ["GAME_ID"], "data": [["0022300001"]]}
+            )
+        },
+    )
+    assert board.game_header.get_dict()["data"] == [["0022300001"]]
+    assert board.game_header is board.data_sets[0]
+    assert isinstance(ScoreboardV2.game_header, Endpoint.DataSetProperty)
+
+
+def test_typed_data_frame_uses_schema_dtypes():
+    data = {
+        "headers": ["GAME_ID", "TEAM_ID", "TEAM_ABBREVIATION", "PTS", "FG_PCT", "AST"],
+        "data": [
+            [22300061, 1610612747, "LAL", 107, 0.5, None],
+            ["0022300062", 1610612738, "BOS", 40000, 0.4, 25],
+        ],
+    }
+    data_set = Endpoint.DataSet(data, endpoint="leaguegamefinder", key="Results")
+    assert data_set.get_data_frame()["GAME_ID"].tolist() == [22300061, "0022300062"]
+    frame = data_set.get_data_frame(typed=True)
+    assert frame["GAME_ID"].tolist() == ["0022300061", "0022300062"]
+    assert frame["TEAM_ID"].dtype == np.int32
+    assert frame["TEAM_ABBREVIATION"].dtype == "category"
+    assert frame["PTS"].dtype == np.int32
+    assert frame["FG_PCT"].dtype == np.float64
+    assert str(frame["AST"].dtype) == "Int16"
+    assert frame["AST"].isna().tolist() == [True, False]
+
+
+def test_schema_registry_overrides_and_fractional_counts():
+    from nba_api.stats.library import schema
+
+    registry = schema.SchemaRegistry()
+    registry.set_dtype("LeagueDashPlayerStats", "LeagueDashPlayerStats", "PTS", None)
+    assert registry.get_schema(
+        "leaguedashplayerstats", "LeagueDashPlayerStats", ["PTS", "teamTricode"]
+    ) == {"teamTricode": "category"}
+
+    per_game = schema.apply_dtype("PTS", np.array([25.3, 7.0]), "int16")
+    assert per_game.dtype == np.float64
+
+
+def test_get_columns_keeps_duplicate_headers():
+    columns = Endpoint.DataSet({"headers": ["PTS", "PTS"], "data": [[1, 2]]}).get_columns()
+    assert list(columns) == ["PTS", "PTS_1"]
+    assert [values.tolist() for values in columns.values()] == [[1], [2]]
+
+
+def test_schema_registry_counts_are_averages_per_mode():
+    from nba_api.stats.library import schema
+
+    columns = ["PLAYER_ID", "PTS", "PTS_RANK"]
+    assert schema.registry.get_schema("leaguedashplayerstats", "LeagueDashPlayerStats", columns) == {
+        "PLAYER_ID": "int32", "PTS": "int16", "PTS_RANK": "int16"
+    }
+    assert schema.registry.get_schema(
+        "leaguedashplayerstats", "LeagueDashPlayerStats", columns, {"PerMode": "PerGame"}
+    ) == {"PLAYER_ID": "int32", "PTS": "float64", "PTS_RANK": "int16"}
+    assert schema.registry.get_schema("CommonPlayerInfo", "PlayerHeadlineStats", ["PTS"]) == {"PTS": "float64"}
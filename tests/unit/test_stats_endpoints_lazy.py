@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+import nba_api.stats.endpoints as endpoints
+
+
+def test_endpoint_modules_load_on_first_use():
+    code = (
+        "import sys\n"
+        "from nba_api.stats.endpoints import ScoreboardV2\n"
+        "print(sorted(name for name in sys.modules"
+        " if name.startswith('nba_api.stats.endpoints.')))\n"
+        "print([name for name in ('aiohttp', 'pandas', 'pyarrow') if name in sys.modules])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+    assert output == [
+        "['nba_api.stats.endpoints._base', 'nba_api.stats.endpoints.scoreboardv2']",
+        "[]",
+    ]
+
+
+def test_endpoint_attributes():
+    from nba_api.stats.endpoints.playbyplayv2 import PlayByPlayV2
+
+    assert endpoints.PlayByPlayV2 is PlayByPlayV2
+    assert endpoints.playbyplayv2.PlayByPlayV2 is PlayByPlayV2
+    assert "LeagueGameFinder" in dir(endpoints)
+    assert all(name in dir(endpoints) for name in endpoints.__all__)
+    with pytest.raises(AttributeError):
+        endpoints.NotAnEndpoint
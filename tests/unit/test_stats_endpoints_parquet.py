@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from nba_api.stats.endpoints._base import Endpoint
+from nba_api.stats.endpoints.commonteamyears import CommonTeamYears
+from nba_api.stats.endpoints.leaguegamefinder import LeagueGameFinder
+from nba_api.stats.library.http import NBAStatsResponse
+
+pytest.importorskip("pyarrow")
+
+HEADERS = ["SEASON_ID", "TEAM_ID", "TEAM_ABBREVIATION", "GAME_ID", "PTS", "FG_PCT"]
+ROWS = [
+    ["22023", 1610612747, "LAL", "0022300061", 107, 0.489],
+    ["22023", 1610612738, "BOS", "0022300062", 108, None],
+]
+
+
+def make_game_finder():
+    payload = {
+        "resource": "leaguegamefinder",
+        "parameters": {"PlayerOrTeam": "T"},
+        "resultSets": [
+            {"name": "LeagueGameFinderResults", "headers": HEADERS, "rowSet": ROWS}
+        ],
+    }
+    endpoint = LeagueGameFinder(get_request=False)
+    endpoint.nba_response = NBAStatsResponse(
+        response=json.dumps(payload).encode("utf-8"), status_code=200, url="url"
+    )
+    endpoint.load_response()
+    return endpoint
+
+
+def test_data_set_arrow_round_trip():
+    data_set = Endpoint.DataSet({"headers": HEADERS, "data": ROWS})
+    table = data_set.get_arrow_table()
+    assert table.column_names == HEADERS
+    assert str(table.schema.field("TEAM_ID").type) == "int64"
+    assert str(table.schema.field("GAME_ID").type) == "string"
+    assert table.column("FG_PCT").null_count == 1
+    assert Endpoint.DataSet.from_arrow_table(table).get_dict() == {
+        "headers": HEADERS,
+        "data": ROWS,
+    }
+
+
+def test_endpoint_parquet_snapshot(tmp_path):
+    endpoint = make_game_finder()
+    paths = endpoint.to_parquet(str(tmp_path / "games"))
+    assert [p.split("/")[-1] for p in paths] == ["LeagueGameFinderResults.parquet"]
+
+    restored = LeagueGameFinder.from_parquet(str(tmp_path / "games"))
+    assert restored.parameters == endpoint.parameters
+    assert restored.league_game_finder_results.get_dict() == {
+        "headers": HEADERS,
+        "data": ROWS,
+    }
+    assert restored.get_data_frames()[0].equals(endpoint.get_data_frames()[0])
+    assert restored.get_data_frames(typed=True)[0].equals(endpoint.get_data_frames(typed=True)[0])
+
+
+def test_from_parquet_rejects_other_endpoint(tmp_path):
+    make_game_finder().to_parquet(str(tmp_path))
+    with pytest.raises(ValueError):
+        CommonTeamYears.from_parquet(str(tmp_path))
+
+
+def test_arrow_schema_comes_from_schema_registry():
+    with_nulls = Endpoint.DataSet(
+        {"headers": HEADERS, "data": [[22023, 1610612747, "LAL", 22300061, None, 0.5]]},
+        endpoint="leaguegamefinder",
+        key="LeagueGameFinderResults",
+    )
+    complete = Endpoint.DataSet(
+        {"headers": HEADERS, "data": ROWS},
+        endpoint="leaguegamefinder",
+        key="LeagueGameFinderResults",
+    )
+    table = with_nulls.get_arrow_table()
+    assert table.schema == complete.get_arrow_table().schema
+    assert str(table.schema.field("PTS").type) == "int64"
+    assert str(table.schema.field("TEAM_ABBREVIATION").type) == "dictionary<values=string, indices=int32, ordered=0>"
+    assert table.column("GAME_ID").to_pylist() == ["0022300061"]
+    assert table.column("PTS").to_pylist() == [None]
+
+
+def test_arrow_integers_with_nulls_stay_integers():
+    data_set = Endpoint.DataSet(
+        {"headers": ["PTS", "MIN_RANK", "OTHER", "AVG"], "data": [[1, None, 3, 2.5], [None, 4, None, None]]}
+    )
+    table = data_set.get_arrow_table()
+    assert [str(field.type) for field in table.schema] == ["int64", "int64", "int64", "double"]
+    assert Endpoint.DataSet.from_arrow_table(table).get_dict()["data"] == data_set.get_dict()["data"]
+
+
+def test_arrow_schema_does_not_depend_on_values():
+    per_game = {"PerMode": "PerGame"}
+    averages = Endpoint.DataSet({"headers": ["PTS"], "data": [[25.3], [7.0]]})
+    whole = Endpoint.DataSet({"headers": ["PTS"], "data": [[25.0], [7.0]]})
+    assert str(averages.get_arrow_table(parameters=per_game).schema.field("PTS").type) == "double"
+    assert str(whole.get_arrow_table(parameters=per_game).schema.field("PTS").type) == "double"
+    assert str(whole.get_arrow_table().schema.field("PTS").type) == "int64"
+    # Totals never silently turn into floats.
+    with pytest.raises(ValueError):
+        averages.get_arrow_table()
+
+
+def test_arrow_rejects_mixed_types():
+    with pytest.raises(ValueError):
+        Endpoint.DataSet({"headers": ["VALUE"], "data": [[1], ["one"]]}).get_arrow_table()
+    with pytest.raises(ValueError):
+        Endpoint.DataSet({"headers": ["PTS"], "data": [[1], ["DNP"]]}).get_arrow_table()
+
+
+def test_arrow_keeps_duplicate_headers():
+    data = {"headers": ["PTS", "PTS", "PTS_1"], "data": [[1, 2, 3]]}
+    table = Endpoint.DataSet(data).get_arrow_table()
+    assert table.column_names == ["PTS", "PTS_2", "PTS_1"]
+    assert table.to_pylist() == [{"PTS": 1, "PTS_2": 2, "PTS_1": 3}]
+
+
+def test_parquet_data_set_reads_arrow_columns(tmp_path):
+    path = str(tmp_path / "games.parquet")
+    Endpoint.DataSet({"headers": HEADERS, "data": ROWS}).to_parquet(path)
+    data_set = Endpoint.DataSet.from_parquet(path)
+    columns = data_set.get_columns()
+    assert data_set._data is None
+    assert columns["PTS"].tolist() == [107, 108]
+    assert columns["TEAM_ABBREVIATION"].tolist() == ["LAL", "BOS"]
+    assert columns["FG_PCT"][0] == 0.489 and columns["FG_PCT"][1] != columns["FG_PCT"][1]
+    assert list(data_set.get_data_frame().columns) == HEADERS
+    assert data_set._data is None
+    assert data_set.get_dict() == {"headers": HEADERS, "data": ROWS}
@@ -0,0 +1,138 @@
+from nba_api.stats.library.parserv3 import (
+    FlatSpec,
+    NBAStatsBoxscoreMatchupsParserV3,
+    NBAStatsBoxscoreParserV3,
+    NBAStatsBoxscoreTraditionalParserV3,
+    NBAStatsPlayByPlayParserV3,
+)
+
+
+def make_team(team_id, tricode, **extra):
+    team = {
+        "teamId": team_id,
+        "teamTricode": tricode,
+        "players": [
+            {
+                "personId": team_id + 1,
+                "nameI": "A. Player",
+                "statistics": {"minutes": "30:00", "points": 10},
+            },
+            {
+                "personId": team_id + 2,
+                "nameI": "B. Player",
+                "statistics": {"minutes": "18:00", "points": 4},
+            },
+        ],
+        "statistics": {"minutes": "240:00", "points": 100, "plusMinusPoints": 5},
+    }
+    team.update(extra)
+    return team
+
+
+def make_boxscore(**extra):
+    return {
+        "meta": {"version": 1},
+        "boxScoreAdvanced": {
+            "gameId": "0022300061",
+            "homeTeam": make_team(10, "LAL", **extra),
+            "awayTeam": make_team(20, "BOS", **extra),
+        },
+    }
+
+
+def test_flat_spec():
+    spec = FlatSpec({"a": 1, "b": 2, "c": {}}, exclude=("c",))
+    assert spec.keys == ("a", "b")
+    assert spec.pick({"b": 4, "a": 3, "c": {}}) == (3, 4)
+    assert spec.pick({"a": 5}) == (5, None)
+    assert list(FlatSpec({"a": 1}).pick({"a": 2})) == [2]
+
+
+def test_boxscore_parser():
+    data_sets = NBAStatsBoxscoreParserV3(make_boxscore()).get_data_sets()
+    assert data_sets["TeamStats"] == {
+        "headers": [
+            "gameId", "teamId", "teamTricode", "minutes", "points", "plusMinusPoints",
+        ],
+        "data": [
+            ["0022300061", 10, "LAL", "240:00", 100, 5],
+            ["0022300061", 20, "BOS", "240:00", 100, 5],
+        ],
+    }
+    assert data_sets["PlayerStats"] == {
+        "headers": [
+            "gameId", "teamId", "teamTricode", "personId", "nameI", "minutes", "points",
+        ],
+        "data": [
+            ["0022300061", 20, "BOS", 21, "A. Player", "30:00", 10],
+            ["0022300061", 20, "BOS", 22, "B. Player", "18:00", 4],
+            ["0022300061", 10, "LAL", 11, "A. Player", "30:00", 10],
+            ["0022300061", 10, "LAL", 12, "B. Player", "18:00", 4],
+        ],
+    }
+
+
+def test_boxscore_traditional_parser():
+    bench = {"minutes": "90:00", "points": 40}
+    data_sets = NBAStatsBoxscoreTraditionalParserV3(
+        make_boxscore(starters={"minutes": "150:00", "points": 60}, bench=bench)
+    ).get_data_sets()
+    assert data_sets["TeamStats"]["headers"] == [
+        "gameId", "teamId", "teamTricode", "minutes", "points", "plusMinusPoints",
+    ]
+    assert data_sets["TeamStats"]["data"][0] == ["0022300061", 10, "LAL", "240:00", 100, 5]
+    assert data_sets["TeamStarterBenchStats"] == {
+        "headers": ["gameId", "teamId", "teamTricode", "minutes", "points", "startersBench"],
+        "data": [
+            ["0022300061", 10, "LAL", "150:00", 60, "Starters"],
+            ["0022300061", 10, "LAL", "90:00", 40, "Bench"],
+            ["0022300061", 20, "BOS", "150:00", 60, "Starters"],
+            ["0022300061", 20, "BOS", "90:00", 40, "Bench"],
+        ],
+    }
+
+
+def test_boxscore_matchups_parser():
+    payload = make_boxscore()
+    for side in ("homeTeam", "awayTeam"):
+        team = payload["boxScoreAdvanced"][side]
+        del team["statistics"]
+        for player in team["players"]:
+            statistics = player.pop("statistics")
+            player["matchups"] = [
+                {"personId": 99, "nameI": "D. Player", "statistics": statistics},
+            ]
+    data_sets = NBAStatsBoxscoreMatchupsParserV3(payload).get_data_sets()
+    assert data_sets["PlayerStats"]["headers"] == [
+        "gameId", "teamId", "teamTricode", "personIdOff", "nameIOff",
+        "personIdDef", "nameIDef", "minutes", "points",
+    ]
+    assert data_sets["PlayerStats"]["data"] == [
+        ["0022300061", 10, "LAL", 11, "A. Player", 99, "D. Player", "30:00", 10],
+        ["0022300061", 10, "LAL", 12, "B. Player", 99, "D. Player", "18:00", 4],
+        ["0022300061", 20, "BOS", 21, "A. Player", 99, "D. Player", "30:00", 10],
+        ["0022300061", 20, "BOS", 22, "B. Player", 99, "D. Player", "18:00", 4],
+    ]
+
+
+def test_playbyplay_parser():
+    payload = {
+        "meta": {"version": 1},
+        "game": {
+            "gameId": "0022300061",
+            "videoAvailable": 1,
+            "actions": [
+                {"actionNumber": 1, "clock": "PT12M00.00S", "description": "Jump Ball"},
+                {"actionNumber": 2, "clock": "PT11M40.00S", "description": "MISS"},
+            ],
+        },
+    }
+    data_sets = NBAStatsPlayByPlayParserV3(payload).get_data_sets()
+    assert data_sets["PlayByPlay"] == {
+        "headers": ("gameId", "actionNumber", "clock", "description"),
+        "data": [
+            ["0022300061", 1, "PT12M00.00S", "Jump Ball"],
+            ["0022300061", 2, "PT11M40.00S", "MISS"],
+        ],
+    }
+    assert data_sets["AvailableVideo"] == {"headers": ["videoAvailable"], "data": [[1]]}
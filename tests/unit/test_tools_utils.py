@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("py_clob_client")
+pytest.importorskip("agents.polymarket.gamma")
+
+from tools.utils import get_time_played_from_clock  # noqa: E402
+
+
+def test_time_played_matches_whole_second_tables():
+    # 2:31.4 left shows as PCTIMESTRING "2:31", i.e. 2729 seconds played.
+    assert get_time_played_from_clock(4, "PT02M31.40S") == 2729
+    assert get_time_played_from_clock(4, "PT02M31.00S") == 2729
+    assert get_time_played_from_clock(4, "PT02M30.90S") == 2730
+    assert get_time_played_from_clock(5, "PT00M00.50S") == 3180
+    assert get_time_played_from_clock(3, "", "Q3 5:00") == 1860
@@ -0,0 +1,157 @@
+"""
+Times the V3 box score, matchups and play-by-play parsers against the legacy
+implementation on synthetic payloads shaped like the live API responses, and
+checks both produce the same data sets.
+
+    python -m tools.benchmarks.parserv3 [--number 200]
+"""
+
+import argparse
+import timeit
+
+from nba_api.stats.library import parserv3
+from tools.benchmarks import legacy_parserv3
+
+STATISTICS = [
+    "minutes", "fieldGoalsMade", "fieldGoalsAttempted", "fieldGoalsPercentage",
+    "threePointersMade", "threePointersAttempted", "threePointersPercentage",
+    "freeThrowsMade", "freeThrowsAttempted", "freeThrowsPercentage",
+    "reboundsOffensive", "reboundsDefensive", "reboundsTotal", "assists",
+    "steals", "blocks", "turnovers", "foulsPersonal", "points", "plusMinusPoints",
+]
+
+
+def make_statistics(seed):
+    return {key: seed + i for i, key in enumerate(STATISTICS)}
+
+
+def make_team(team_id, players, matchups=0):
+    team = {
+        "teamId": team_id,
+        "teamCity": "City",
+        "teamName": "Name",
+        "teamTricode": "ABC",
+        "teamSlug": "name",
+        "players": [],
+    }
+    for i in range(players):
+        player = {
+            "personId": team_id * 100 + i,
+            "firstName": "First",
+            "familyName": "Family",
+            "nameI": "F. Family",
+            "playerSlug": "first-family",
+            "position": "G",
+            "comment": "",
+            "jerseyNum": str(i),
+        }
+        if matchups:
+            player["matchups"] = [
+                {
+                    "personId": team_id * 1000 + j,
+                    "firstName": "First",
+                    "familyName": "Family",
+                    "nameI": "F. Family",
+                    "playerSlug": "first-family",
+                    "jerseyNum": str(j),
+                    "statistics": make_statistics(j),
+                }
+                for j in range(matchups)
+            ]
+        else:
+            player["statistics"] = make_statistics(i)
+        team["players"].append(player)
+    if not matchups:
+        team["statistics"] = make_statistics(team_id)
+        stats = dict(team["statistics"])
+        del stats["plusMinusPoints"]
+        team["starters"] = stats
+        team["bench"] = stats
+    return team
+
+
+def make_boxscore(players=15, matchups=0):
+    return {
+        "meta": {"version": 1},
+        "boxScore": {
+            "gameId": "0022300061",
+            "awayTeamId": 1,
+            "homeTeamId": 2,
+            "homeTeam": make_team(2, players, matchups),
+            "awayTeam": make_team(1, players, matchups),
+        },
+    }
+
+
+def make_playbyplay(actions=500):
+    return {
+        "meta": {"version": 1},
+        "game": {
+            "gameId": "0022300061",
+            "videoAvailable": 1,
+            "actions": [
+                {
+                    "actionNumber": i,
+                    "clock": "PT12M00.00S",
+                    "period": 1 + i // 125,
+                    "teamId": 1,
+                    "teamTricode": "ABC",
+                    "personId": 100,
+                    "playerName": "Family",
+                    "playerNameI": "F. Family",
+                    "xLegacy": 0,
+                    "yLegacy": 0,
+                    "shotDistance": 0,
+                    "shotResult": "",
+                    "isFieldGoal": 0,
+                    "scoreHome": "0",
+                    "scoreAway": "0",
+                    "pointsTotal": 0,
+                    "location": "h",
+                    "description": "Jump Ball",
+                    "actionType": "Jump Ball",
+                    "subType": "",
+                    "videoAvailable": 1,
+                    "shotValue": 0,
+                    "actionId": i,
+                }
+                for i in range(actions)
+            ],
+        },
+    }
+
+
+CASES = [
+    ("boxscore", "NBAStatsBoxscoreParserV3", make_boxscore),
+    ("boxscore traditional", "NBAStatsBoxscoreTraditionalParserV3", make_boxscore),
+    ("boxscore matchups", "NBAStatsBoxscoreMatchupsParserV3", lambda: make_boxscore(matchups=8)),
+    ("playbyplay", "NBAStatsPlayByPlayParserV3", make_playbyplay),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    print("{:<22} {:>12} {:>12} {:>8}".format("parser", "legacy ms", "compiled ms", "speedup"))
+    for label, name, make_payload in CASES:
+        payload = make_payload()
+        legacy = getattr(legacy_parserv3, name)
+        compiled = getattr(parserv3, name)
+        if legacy(payload).get_data_sets() != compiled(payload).get_data_sets():
+            raise AssertionError("{} data sets differ from the legacy parser".format(name))
+        legacy_time = timeit.timeit(lambda: legacy(payload).get_data_sets(), number=args.number)
+        compiled_time = timeit.timeit(lambda: compiled(payload).get_data_sets(), number=args.number)
+        print(
+            "{:<22} {:>12.3f} {:>12.3f} {:>7.1f}x".format(
+                label,
+                legacy_time / args.number * 1000,
+                compiled_time / args.number * 1000,
+                legacy_time / compiled_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
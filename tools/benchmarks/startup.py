@@ -0,0 +1,54 @@
+"""
+Measures cold import time of the nba_api entry points used by the scripts,
+each in a fresh interpreter, and reports the median over several runs.
+
+    python -m tools.benchmarks.startup [--runs 7] [statement ...]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import nba_api.stats.endpoints",
+    "from nba_api.stats.endpoints import ScoreboardV2",
+    "from nba_api.stats.endpoints import PlayByPlayV2, LeagueGameFinder",
+    "from nba_api.stats.endpoints import *",
+    "from nba_api.live.nba.endpoints import scoreboard",
+]
+
+CHILD = """
+import sys, time
+started = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - started
+print(elapsed, sum(name.startswith("nba_api.stats.endpoints.") for name in sys.modules))
+"""
+
+
+def measure(statement):
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("statements", nargs="*", default=STATEMENTS)
+    args = parser.parse_args()
+
+    print("{:>10} {:>10}  {}".format("median ms", "endpoints", "statement"))
+    for statement in args.statements:
+        runs = [measure(statement) for _ in range(args.runs)]
+        median = statistics.median(elapsed for elapsed, _ in runs)
+        print("{:>10.1f} {:>10}  {}".format(median * 1000, runs[0][1], statement))
+
+
+if __name__ == "__main__":
+    main()
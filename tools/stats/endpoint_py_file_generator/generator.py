@@ -2,7 +2,7 @@ import os
 
 from .template import argument_template, no_default_argument_template
 from .template import parameter_template, data_set_template, imports_template
-from .template import file_template
+from .template import file_template, placeholder_template
 from tools.stats.endpoint_analysis.analysis import load_endpoint_file
 from tools.library.functions import get_python_variable_name
 from tools.stats.library.mapping import parameter_variations, parameter_map
@@ -95,7 +95,13 @@ def get_endpoint_contents(endpoint, endpoint_analysis):
 
     arguments = ",\n".join(arguments_list)
     parameters = ",\n".join(parameters_list)
-    data_set_variables = "\n".join(data_set_lists)
+    data_set_properties = "\n".join(data_set_lists)
+    variable_names = [get_python_variable_name(key_name) for key_name in data_sets]
+    placeholders = "".join(
+        placeholder_template.format(variable_name=variable_name)
+        for variable_name in ("player_stats", "team_stats")
+        if variable_name not in variable_names
+    )
     imports = ""
     if imports_list:
         imports = imports_template.format(imports_list=", ".join(imports_list))
@@ -107,7 +113,8 @@ def get_endpoint_contents(endpoint, endpoint_analysis):
         data_sets=data_sets,
         arguments=arguments,
         parameters=parameters,
-        data_set_variables=data_set_variables,
+        placeholders=placeholders,
+        data_set_properties=data_set_properties,
     )
 
     return file_contents
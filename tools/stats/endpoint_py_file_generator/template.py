@@ -8,9 +8,9 @@ class {endpoint}(Endpoint):
 
     nba_response = None
     data_sets = None
-    player_stats = None
-    team_stats = None
-    headers = None
+{placeholders}    headers = None
+
+{data_set_properties}
 
     def __init__(self,
 {arguments},
@@ -39,15 +39,16 @@ class {endpoint}(Endpoint):
         self.load_response()
         
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-{data_set_variables}
+        self.data_sets = Endpoint.DataSets(self.nba_response, self.endpoint)
 """
 
 data_set_template = (
-    """        self.{variable_name} = Endpoint.DataSet(data=data_sets['{key_name}'])"""
+    """    {variable_name} = Endpoint.DataSetProperty('{key_name}')"""
 )
 
+placeholder_template = """    {variable_name} = None
+"""
+
 imports_template = """\nfrom nba_api.stats.library.parameters import {imports_list}"""
 
 function_template = """    def {function_name}(self):
@@ -1,4 +1,6 @@
-file_template = """player_index_id = 0
+file_template = """import os
+
+player_index_id = 0
 player_index_last_name = 1
 player_index_first_name = 2
 player_index_full_name = 3
@@ -6,13 +8,50 @@ player_index_is_active = 4
 
 # Data last updated: {date_updated}
 
-players = [
-{players_list}
-]
+# players and wnba_players are stored column by column in static_data.bin
+# (written by tools/stats/static_players_update) and built on first access.
+STATIC_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static_data.bin")
+PLAYER_COLUMNS = ("id", "last_name", "first_name", "full_name", "is_active")
+PLAYER_TABLES = ("players", "wnba_players")
+
+_player_columns = None
+
+
+# Returns the columns of a player table (players or wnba_players) as
+# {{column: values}}; see read_static_data().
+def get_player_columns(name="players", memory_map=False):
+    global _player_columns
+    # Imported here so team lookups do not load NumPy.
+    from nba_api.stats.library.static_data import read_static_data
+
+    if memory_map:
+        return read_static_data(STATIC_DATA_PATH, memory_map=True)["tables"][name]
+    if _player_columns is None:
+        _player_columns = read_static_data(STATIC_DATA_PATH)["tables"]
+    return _player_columns[name]
+
+
+def _get_player_rows(name):
+    columns = get_player_columns(name)
+    return [
+        list(row)
+        for row in zip(
+            columns["id"].tolist(),
+            columns["last_name"],
+            columns["first_name"],
+            columns["full_name"],
+            columns["is_active"].tolist(),
+        )
+    ]
+
+
+def __getattr__(name):
+    if name not in PLAYER_TABLES:
+        raise AttributeError("module {{!r}} has no attribute {{!r}}".format(__name__, name))
+    rows = _get_player_rows(name)
+    globals()[name] = rows
+    return rows
 
-wnba_players = [
-{wnba_players_list}
-]
 
 team_index_id = 0
 team_index_abbreviation = 1
@@ -25,16 +64,19 @@ team_index_championship_year = 7
 
 teams = [
     [1610612737, 'ATL', 'Hawks', 1949, 'Atlanta', 'Atlanta Hawks', 'Georgia', [1958]],
-    [1610612738, 'BOS', 'Celtics', 1946, 'Boston', 'Boston Celtics', 'Massachusetts', [1957, 1959, 1960, 1961, 1962, 1963, 1964, 1965, 1966, 1968, 1969, 1974, 1976, 1981, 1984, 1986, 2008]],
+    [1610612738, 'BOS', 'Celtics', 1946, 'Boston', 'Boston Celtics', 'Massachusetts', [1957, 1959,
+                                                                                       1960, 1961, 1962, 1963, 1964, 1965, 1966, 1968, 1969, 1974, 1976, 1981, 1984, 1986, 2008]],
     [1610612739, 'CLE', 'Cavaliers', 1970, 'Cleveland', 'Cleveland Cavaliers', 'Ohio', [2016]],
     [1610612740, 'NOP', 'Pelicans', 2002, 'New Orleans', 'New Orleans Pelicans', 'Louisiana', []],
     [1610612741, 'CHI', 'Bulls', 1966, 'Chicago', 'Chicago Bulls', 'Illinois', [1991, 1992, 1993, 1996, 1997, 1998]],
     [1610612742, 'DAL', 'Mavericks', 1980, 'Dallas', 'Dallas Mavericks', 'Texas', [2011]],
     [1610612743, 'DEN', 'Nuggets', 1976, 'Denver', 'Denver Nuggets', 'Colorado', [2023]],
-    [1610612744, 'GSW', 'Warriors', 1946, 'Golden State', 'Golden State Warriors', 'California', [1947, 1956, 1975, 2015, 2017, 2018, 2022]],
+    [1610612744, 'GSW', 'Warriors', 1946, 'Golden State', 'Golden State Warriors',
+        'California', [1947, 1956, 1975, 2015, 2017, 2018, 2022]],
     [1610612745, 'HOU', 'Rockets', 1967, 'Houston', 'Houston Rockets', 'Texas', [1994, 1995]],
     [1610612746, 'LAC', 'Clippers', 1970, 'Los Angeles', 'Los Angeles Clippers', 'California', []],
-    [1610612747, 'LAL', 'Lakers', 1948, 'Los Angeles', 'Los Angeles Lakers', 'California', [1949, 1950, 1952, 1953, 1954, 1972, 1980, 1982, 1985, 1987, 1988, 2000, 2001, 2002, 2009, 2010, 2020]],
+    [1610612747, 'LAL', 'Lakers', 1948, 'Los Angeles', 'Los Angeles Lakers', 'California', [
+        1949, 1950, 1952, 1953, 1954, 1972, 1980, 1982, 1985, 1987, 1988, 2000, 2001, 2002, 2009, 2010, 2020]],
     [1610612748, 'MIA', 'Heat', 1988, 'Miami', 'Miami Heat', 'Florida', [2006, 2012, 2013]],
     [1610612749, 'MIL', 'Bucks', 1968, 'Milwaukee', 'Milwaukee Bucks', 'Wisconsin', [1971, 2021]],
     [1610612750, 'MIN', 'Timberwolves', 1989, 'Minnesota', 'Minnesota Timberwolves', 'Minnesota', []],
@@ -66,12 +108,8 @@ wnba_teams = [
     [1611661323, "CON", "Sun", 1999, "Connecticut", "Connecticut Sun", "Connecticut", []],
     [1611661324, "MIN", "Lynx", 1999, "Minnesota", "Minnesota Lynx", "Minnesota", [2011, 2013, 2015, 2017]],
     [1611661325, "IND", "Fever", 2000, "Indiana", "Indiana Fever", "Indiana", [2012]],
-    [1611661328, "SEA", "Storm", 2000, "Seattle", "Seattle Storm", "Washington",[2004, 2010, 2018, 2020]],
+    [1611661328, "SEA", "Storm", 2000, "Seattle", "Seattle Storm", "Washington", [2004, 2010, 2018, 2020]],
     [1611661329, "CHI", "Sky", 2005, "Chicago", "Chicago Sky", "Illinois", [2021]],
     [1611661330, "ATL", "Dream", 2008, "Atlanta", "Atlanta Dream", "Georgia", []],
 ]
 """
-
-player_row_template = (
-    """    [{id}, "{last_name}", "{first_name}", "{full_name}", {is_active}]"""
-)
@@ -3,8 +3,10 @@ import shutil
 from datetime import datetime
 
 from nba_api.stats.endpoints.commonallplayers import CommonAllPlayers
+from nba_api.stats.library.data import PLAYER_COLUMNS
 from nba_api.stats.library.parameters import LeagueID, Season, WnbaSeason
-from template import file_template, player_row_template
+from nba_api.stats.library.static_data import write_static_data
+from template import file_template
 
 player_adjustments = {
     2775: ["Ha Seung-jin", "", "Ha Seung-jin", False],
@@ -46,20 +48,8 @@ def create_players_list(
     return sorted(players_dict.items(), key=lambda kv: kv[1])
 
 
-def format_player_string(players_list):
-    players_string = ""
-
-    for player in players_list:
-        player_string = player_row_template.format(
-            id=player[0],
-            last_name=player[1][0],
-            first_name=player[1][1],
-            full_name=player[1][2],
-            is_active=player[1][3],
-        )
-        players_string += player_string + ",\n"
-
-    return players_string.rstrip(",\n")
+def get_player_rows(players_list):
+    return [[player_id, *player_data] for player_id, player_data in players_list]
 
 
 def write_static_data_file(directory, file_contents) -> str:
@@ -72,6 +62,21 @@ def write_static_data_file(directory, file_contents) -> str:
     return file_path
 
 
+def write_players_file(directory, players_list, wnba_players_list, date_updated) -> str:
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    file_path = os.path.join(os.getcwd(), directory, "static_data.bin")
+    write_static_data(
+        file_path,
+        {
+            "players": (PLAYER_COLUMNS, get_player_rows(players_list)),
+            "wnba_players": (PLAYER_COLUMNS, get_player_rows(wnba_players_list)),
+        },
+        updated=date_updated,
+    )
+    return file_path
+
+
 def generate_static_data_file(directory="static_files"):
     players_list = create_players_list()
     wnba_players_list = create_players_list(
@@ -79,17 +84,11 @@ def generate_static_data_file(directory="static_files"):
         season=WnbaSeason.default,
         player_adjustments=wnba_player_adjustments,
     )
+    date_updated = datetime.now().strftime("%b, %d %Y")
 
-    players_string = format_player_string(players_list)
-    wnba_players_string = format_player_string(wnba_players_list)
-
-    file_contents = file_template.format(
-        players_list=players_string,
-        wnba_players_list=wnba_players_string,
-        date_updated=datetime.now().strftime("%b, %d %Y"),
-    )
-
-    write_static_data_file(directory, file_contents)
+    # Copy both files into src/nba_api/stats/library/.
+    write_static_data_file(directory, file_template.format(date_updated=date_updated))
+    write_players_file(directory, players_list, wnba_players_list, date_updated)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 import os
 import sys
 import time
@@ -17,6 +18,7 @@ from py_clob_client.exceptions import PolyApiException
 from py_clob_client.order_builder.constants import BUY, SELL
 
 from agents.polymarket.gamma import GammaMarketClient as Gamma
+from nba_api.live.nba.library.clock import get_elapsed
 
 
 def setup_logger(name, log_file=None):
@@ -172,6 +174,23 @@ def get_time_played(status_text):
     return int(time_played)
 
 
+def get_time_played_from_clock(period, game_clock, status_text=None):
+    """
+    seconds played, from the live feed's period and gameClock ("PT02M31.40S"),
+    at the whole second the flip rate tables are keyed by; overtime counts 5
+    minutes per period. falls back to get_time_played(status_text) when the
+    clock is blank
+    """
+    elapsed = get_elapsed(period, game_clock)
+    if elapsed is None:
+        if status_text is None:
+            raise ValueError(f"no game clock for period {period}: {game_clock!r}")
+        return get_time_played(status_text)
+    # the tables were built from PCTIMESTRING, which drops the tenths of the
+    # time left ("2:31" for 2:31.4), so the time played is rounded up
+    return math.ceil(round(elapsed, 2))
+
+
 def calculate_row_product(row, time_played):
     # 找到每行的第一个和最后一个有效数字
     last_valid = row.last_valid_index()